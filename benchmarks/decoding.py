@@ -0,0 +1,64 @@
+"""
+Per-message cost of `Message.from_payload_and_headers`.
+
+Compares the previous decoding path (`bytes.decode`, `json.loads`, payload and
+headers models, generated constructor) with the single-pass decoder, with and
+without validation.
+
+Run with `python benchmarks/decoding.py`.
+"""
+
+import json
+import timeit
+from typing import Any
+
+from message_flow import Header, Message, Payload, ValidationPolicy
+
+
+class OrderCreated(Message):
+    order_id: str = Payload()
+    product_ids: list[str] = Payload()
+    quantity: int = Payload()
+    total: float = Payload()
+    correlation_id: str = Header()
+    tenant_id: str = Header()
+
+
+def legacy_decode(raw_payload: bytes, raw_headers: dict[str, str]) -> Message:
+    payload_obj = OrderCreated.payload_model()(**json.loads(raw_payload.decode()))
+    payload: dict[str, Any] = {name: getattr(payload_obj, name) for name in OrderCreated.payload_attributes()}
+
+    headers_obj = OrderCreated.headers_model()(**raw_headers)
+    headers: dict[str, Any] = {name: getattr(headers_obj, name) for name in OrderCreated.headers_attributes()}
+
+    return OrderCreated(**payload, **headers)
+
+
+def main(number: int = 20_000) -> None:
+    message = OrderCreated(
+        order_id="0c6a2d6e",
+        product_ids=["a1", "b2", "c3"],
+        quantity=3,
+        total=42.5,
+        correlation_id="e3b0c442",
+        tenant_id="tenant",
+    )
+    raw_payload, raw_headers = message.payload, message.headers
+
+    cases = {
+        "before": lambda: legacy_decode(raw_payload, raw_headers),
+        "after": lambda: OrderCreated.from_payload_and_headers(raw_payload, raw_headers),
+        "after (memoryview)": lambda: OrderCreated.from_payload_and_headers(memoryview(raw_payload), raw_headers),
+        "after (trusted)": lambda: OrderCreated.from_payload_and_headers(
+            raw_payload, raw_headers, ValidationPolicy.TRUSTED
+        ),
+    }
+
+    for name, case in cases.items():
+        case()
+        seconds = min(timeit.repeat(case, number=number, repeat=5))
+        print(f"{name:<20} {seconds / number * 1e6:8.2f} µs/message")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Per-message cost of `Message.payload` and `Message.headers`.
+
+Compares the previous encoding path (payload and headers models built from
+instance attributes, then dumped) with the generated encoders, and the cost
+of construction with and without validation.
+
+Run with `python benchmarks/encoding.py`.
+"""
+
+import timeit
+
+from message_flow import Codecs, Header, Message, MessageInfo, Payload, ValidationPolicy
+
+
+class OrderCreated(Message):
+    order_id: str = Payload()
+    product_ids: list[str] = Payload()
+    quantity: int = Payload()
+    total: float = Payload()
+    correlation_id: str = Header()
+    tenant_id: str = Header()
+
+
+class TrustedOrderCreated(Message):
+    message_info = MessageInfo(validation=ValidationPolicy.TRUSTED)
+
+    order_id: str = Payload()
+    product_ids: list[str] = Payload()
+    quantity: int = Payload()
+    total: float = Payload()
+    correlation_id: str = Header()
+    tenant_id: str = Header()
+
+
+def legacy_encode(message: Message) -> tuple[bytes, dict[str, str]]:
+    payload = (
+        message.payload_model()(**{name: getattr(message, name) for name in message.payload_attributes()})
+        .model_dump_json()
+        .encode()
+    )
+    headers = message.headers_model()(
+        **{name: getattr(message, name) for name in message.headers_attributes()}
+    ).model_dump()
+
+    return payload, headers
+
+
+def main(number: int = 20_000) -> None:
+    attributes = {
+        "order_id": "0c6a2d6e",
+        "product_ids": ["a1", "b2", "c3"],
+        "quantity": 3,
+        "total": 42.5,
+        "correlation_id": "e3b0c442",
+        "tenant_id": "tenant",
+    }
+    message = OrderCreated(**attributes)
+    codec = Codecs.get(message.content_type)
+
+    cases = {
+        "before": lambda: legacy_encode(message),
+        "after": lambda: (message.__encode_payload__(codec), message.__encode_headers__()),
+        "construct (lax)": lambda: OrderCreated(**attributes),
+        "construct (trusted)": lambda: TrustedOrderCreated(**attributes),
+    }
+
+    for name, case in cases.items():
+        case()
+        seconds = min(timeit.repeat(case, number=number, repeat=5))
+        print(f"{name:<20} {seconds / number * 1e6:8.2f} µs/message")
+
+
+if __name__ == "__main__":
+    main()
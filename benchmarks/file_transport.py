@@ -0,0 +1,77 @@
+"""
+Read throughput of the simple file transport on a large log, comparing the
+buffered reader with the memory-mapped reader that hands out `memoryview`
+slices of the payloads.
+
+Run with `python benchmarks/file_transport.py [GiB]`, e.g. `python benchmarks/file_transport.py 4`
+for a multi-gigabyte log. The log is written to the temporary directory and removed afterwards.
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from message_flow import Header, Message, Payload
+from message_flow.app._simple_messaging import Envelope, SimpleMessageConsumer
+
+PAYLOAD_BYTES = 1024
+CHUNK_MESSAGES = 10_000
+
+
+class OrderCreated(Message):
+    order_id: str = Payload()
+    note: str = Payload()
+    tenant_id: str = Header()
+
+
+def write_log(path: Path, size: int) -> int:
+    message = OrderCreated(order_id="0c6a2d6e", note="x" * PAYLOAD_BYTES, tenant_id="tenant")
+    record = Envelope.encode("orders", message.payload, message.headers)
+    chunk = record * CHUNK_MESSAGES
+
+    with open(path, "wb") as fp:
+        for _ in range(max(size // len(chunk), 1)):
+            fp.write(chunk)
+
+    return path.stat().st_size // len(record)
+
+
+def read_log(path: Path, total: int, memory_map: bool, decode: bool) -> float:
+    Path(f"{path}.offset").write_text("0")
+    consumer = SimpleMessageConsumer(logging.getLogger("benchmark"), str(path), memory_map=memory_map)
+    handled = 0
+
+    def handler(payload: bytes, headers: dict[str, str]) -> None:
+        nonlocal handled
+        if decode:
+            OrderCreated.from_payload_and_headers(payload, headers)
+        handled += 1
+        if handled == total:
+            consumer.close()
+
+    consumer.subscribe({"orders"}, handler)
+
+    started = time.perf_counter()
+    consumer.start_consuming()
+
+    return time.perf_counter() - started
+
+
+def main(gigabytes: float = 0.25) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "queue.txt"
+        total = write_log(path, int(gigabytes * 2**30))
+        size = path.stat().st_size / 2**20
+        print(f"{total} messages, {size:.0f} MiB")
+
+        for decode in (False, True):
+            for memory_map in (False, True):
+                seconds = read_log(path, total, memory_map, decode)
+                name = f"{'mmap' if memory_map else 'buffered'}{' + decode' if decode else ''}"
+                print(f"{name:<20} {total / seconds:12,.0f} messages/s {size / seconds:10,.0f} MiB/s")
+
+
+if __name__ == "__main__":
+    main(*map(float, sys.argv[1:]))
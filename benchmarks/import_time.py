@@ -0,0 +1,68 @@
+"""
+Import time of a module declaring many `Message` classes, with AsyncAPI schema
+generation deferred until first access versus forced at import.
+
+Run with `python benchmarks/import_time.py`.
+"""
+
+import subprocess
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+MESSAGES = 2000
+ROUNDS = 5
+
+TEMPLATE = """
+class Message{index}(Message):
+    entity_id: str = Payload()
+    quantity: int = Payload()
+    total: float = Payload()
+    correlation_id: str = Header()
+"""
+
+RUNNER = """
+import time
+
+started = time.perf_counter()
+import messages
+if {force}:
+    for message in messages.MESSAGES:
+        message.__async_api_components__
+print(time.perf_counter() - started)
+"""
+
+
+def write_module(directory: Path) -> None:
+    source = ["from message_flow import Header, Message, Payload\n"]
+    source.extend(TEMPLATE.format(index=index) for index in range(MESSAGES))
+    source.append(f"\nMESSAGES = [{', '.join(f'Message{index}' for index in range(MESSAGES))}]\n")
+    (directory / "messages.py").write_text("".join(source))
+
+
+def measure(directory: Path, force: bool) -> float:
+    script = textwrap.dedent(RUNNER).format(force=force)
+    timings = []
+    for _ in range(ROUNDS):
+        output = subprocess.run(
+            [sys.executable, "-B", "-c", script], cwd=directory, check=True, capture_output=True, text=True
+        )
+        timings.append(float(output.stdout))
+    return min(timings)
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        write_module(Path(directory))
+        lazy = measure(Path(directory), force=False)
+        eager = measure(Path(directory), force=True)
+
+    print(f"{MESSAGES} message classes, best of {ROUNDS}")
+    print(f"import only            {lazy * 1000:8.1f} ms")
+    print(f"import and schema      {eager * 1000:8.1f} ms")
+    print(f"deferred               {(eager - lazy) / eager:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Memory footprint of decoded `Message` instances with and without `__slots__`.
+
+Run with `python benchmarks/memory.py`.
+"""
+
+import gc
+import tracemalloc
+
+from message_flow import Header, Message, Payload
+
+
+class OrderCreated(Message):
+    order_id: str = Payload()
+    quantity: int = Payload()
+    total: float = Payload()
+    correlation_id: str = Header()
+    tenant_id: str = Header()
+
+
+class SlottedOrderCreated(Message, slots=True):
+    order_id: str = Payload()
+    quantity: int = Payload()
+    total: float = Payload()
+    correlation_id: str = Header()
+    tenant_id: str = Header()
+
+
+def measure(message_class: type[Message], count: int) -> float:
+    raw_payload = b'{"order_id":"0c6a2d6e","quantity":3,"total":42.5}'
+    raw_headers = {"correlation_id": "e3b0c442", "tenant_id": "tenant"}
+
+    message_class.from_payload_and_headers(raw_payload, raw_headers)
+    gc.collect()
+
+    tracemalloc.start()
+    messages = [message_class.from_payload_and_headers(raw_payload, raw_headers) for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del messages
+    return size / count
+
+
+def main(count: int = 100_000) -> None:
+    for name, message_class in (("__dict__", OrderCreated), ("__slots__", SlottedOrderCreated)):
+        print(f"{name:<20} {measure(message_class, count):8.1f} bytes/message")
+
+
+if __name__ == "__main__":
+    main()
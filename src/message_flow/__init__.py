@@ -1,5 +1,33 @@
-from .app import *
-from .channel import *
-from .message import *
+from .utils import lazy_package
 
-__all__ = app.__all__ + channel.__all__ + message.__all__
+_exports = {
+    "BaseMiddleware": "app",
+    "MessageFlow": "app",
+    "AsyncMessageConsumer": "app",
+    "AsyncMessageProducer": "app",
+    "BufferedMessageProducer": "app",
+    "LogMessageConsumer": "app",
+    "LogMessageProducer": "app",
+    "MessageConsumer": "app",
+    "MessageProducer": "app",
+    "StatelessMiddleware": "app",
+    "Channel": "channel",
+    "Compression": "channel",
+    "CompressionStats": "channel",
+    "Codec": "message",
+    "JsonCodec": "message",
+    "MsgPackCodec": "message",
+    "CborCodec": "message",
+    "Codecs": "message",
+    "CorrelationId": "message",
+    "Header": "message",
+    "Message": "message",
+    "MessageExample": "message",
+    "MessageInfo": "message",
+    "MessageTrait": "message",
+    "Payload": "message",
+    "ValidationPolicy": "message",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
@@ -0,0 +1,26 @@
+from .app import AsyncMessageConsumer as AsyncMessageConsumer
+from .app import AsyncMessageProducer as AsyncMessageProducer
+from .app import BaseMiddleware as BaseMiddleware
+from .app import BufferedMessageProducer as BufferedMessageProducer
+from .app import LogMessageConsumer as LogMessageConsumer
+from .app import LogMessageProducer as LogMessageProducer
+from .app import MessageConsumer as MessageConsumer
+from .app import MessageFlow as MessageFlow
+from .app import MessageProducer as MessageProducer
+from .app import StatelessMiddleware as StatelessMiddleware
+from .channel import Channel as Channel
+from .channel import Compression as Compression
+from .channel import CompressionStats as CompressionStats
+from .message import CborCodec as CborCodec
+from .message import Codec as Codec
+from .message import Codecs as Codecs
+from .message import CorrelationId as CorrelationId
+from .message import Header as Header
+from .message import JsonCodec as JsonCodec
+from .message import Message as Message
+from .message import MessageExample as MessageExample
+from .message import MessageInfo as MessageInfo
+from .message import MessageTrait as MessageTrait
+from .message import MsgPackCodec as MsgPackCodec
+from .message import Payload as Payload
+from .message import ValidationPolicy as ValidationPolicy
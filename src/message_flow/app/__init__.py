@@ -1,3 +1,17 @@
-from ..utils import init_package
+from ..utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "BaseMiddleware": "base_middleware",
+    "MessageFlow": "message_flow",
+    "AsyncMessageConsumer": "messaging",
+    "AsyncMessageProducer": "messaging",
+    "BufferedMessageProducer": "messaging",
+    "LogMessageConsumer": "messaging",
+    "LogMessageProducer": "messaging",
+    "MessageConsumer": "messaging",
+    "MessageProducer": "messaging",
+    "StatelessMiddleware": "stateless_middleware",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
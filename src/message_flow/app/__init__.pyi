@@ -1,3 +1,10 @@
-from .base_middleware import *
-from .message_flow import *
-from .messaging import *
+from .base_middleware import BaseMiddleware as BaseMiddleware
+from .message_flow import MessageFlow as MessageFlow
+from .messaging import AsyncMessageConsumer as AsyncMessageConsumer
+from .messaging import AsyncMessageProducer as AsyncMessageProducer
+from .messaging import BufferedMessageProducer as BufferedMessageProducer
+from .messaging import LogMessageConsumer as LogMessageConsumer
+from .messaging import LogMessageProducer as LogMessageProducer
+from .messaging import MessageConsumer as MessageConsumer
+from .messaging import MessageProducer as MessageProducer
+from .stateless_middleware import StatelessMiddleware as StatelessMiddleware
@@ -1,3 +1,17 @@
-from ...utils import init_package
+from ...utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "ShowingOptions": "async_api_studio",
+    "ExpandingOptions": "async_api_studio",
+    "SidebarOptions": "async_api_studio",
+    "AsyncAPIStudioConfig": "async_api_studio",
+    "AsyncAPIStudio": "async_api_studio",
+    "AsyncAPIStudioPage": "async_api_studio",
+    "AsyncAPISchema": "async_api_schema",
+    "Channels": "channels",
+    "Info": "message_flow_schema",
+    "MessageFlowSchema": "message_flow_schema",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
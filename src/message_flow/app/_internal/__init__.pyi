@@ -1,3 +1,10 @@
-from .async_api_studio import *
-from .channels import *
-from .message_flow_schema import *
+from .async_api_schema import AsyncAPISchema as AsyncAPISchema
+from .async_api_studio import AsyncAPIStudio as AsyncAPIStudio
+from .async_api_studio import AsyncAPIStudioConfig as AsyncAPIStudioConfig
+from .async_api_studio import AsyncAPIStudioPage as AsyncAPIStudioPage
+from .async_api_studio import ExpandingOptions as ExpandingOptions
+from .async_api_studio import ShowingOptions as ShowingOptions
+from .async_api_studio import SidebarOptions as SidebarOptions
+from .channels import Channels as Channels
+from .message_flow_schema import Info as Info
+from .message_flow_schema import MessageFlowSchema as MessageFlowSchema
@@ -0,0 +1,31 @@
+import hashlib
+import json
+from typing import Hashable, final
+
+from ...utils import internal
+from .message_flow_schema import MessageFlowSchema
+
+
+@final
+@internal
+class AsyncAPISchema:
+    def __init__(self, schema: MessageFlowSchema, revision: Hashable) -> None:
+        self.revision = revision
+
+        self.text = json.dumps(schema)
+        self.content = self.text.encode()
+        self.sha256 = hashlib.sha256(self.content).hexdigest()
+
+        self._pages: dict[tuple[str | bool, ...], str] = {}
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.sha256}"'
+
+    def page(self, *options: str | bool) -> str | None:
+        return self._pages.get(options)
+
+    def add_page(self, page: str, *options: str | bool) -> str:
+        self._pages[options] = page
+
+        return page
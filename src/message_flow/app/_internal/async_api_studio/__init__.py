@@ -1,3 +1,13 @@
-from ....utils import init_package
+from ....utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "ShowingOptions": "config",
+    "ExpandingOptions": "config",
+    "SidebarOptions": "config",
+    "AsyncAPIStudioConfig": "config",
+    "AsyncAPIStudio": "config",
+    "AsyncAPIStudioPage": "page",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
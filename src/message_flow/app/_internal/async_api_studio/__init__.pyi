@@ -1,2 +1,6 @@
-from .config import *
-from .page import *
+from .config import AsyncAPIStudio as AsyncAPIStudio
+from .config import AsyncAPIStudioConfig as AsyncAPIStudioConfig
+from .config import ExpandingOptions as ExpandingOptions
+from .config import ShowingOptions as ShowingOptions
+from .config import SidebarOptions as SidebarOptions
+from .page import AsyncAPIStudioPage as AsyncAPIStudioPage
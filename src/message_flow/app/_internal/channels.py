@@ -1,8 +1,9 @@
 from typing import Any, final
 
 from ...channel import Channel
-from ...message import Message
-from ...operation import Operation
+from ...channel._internal import ChannelMeta
+from ...message import Message, ValidationPolicy
+from ...operation import Operation, OperationBatch
 from ...shared import Components
 from ...utils import internal
 
@@ -13,31 +14,54 @@ class Channels:
     def __init__(self, *, channels: list[Channel] | None = None) -> None:
         self._channels: list[Channel] = channels or []
 
+        self._routes_revision: tuple[int, int] | None = None
+        self._schemas_revision: tuple[int, int] | None = None
+        self._receivers: dict[tuple[str, str], Operation] = {}
+        self._senders: dict[str, tuple[Channel, Operation]] = {}
+        self._validations: dict[str, ValidationPolicy] = {}
+        self._channels_by_address: dict[str, Channel] = {}
+
+    @property
+    def revision(self) -> tuple[int, int]:
+        return ChannelMeta.revision, len(self._channels)
+
     @property
     def addresses(self) -> set[str]:
-        if not hasattr(self, "_addresses"):
-            self._addresses = {channel.address for channel in self._channels}
+        self.build_routes()
 
         return self._addresses
 
+    @property
+    def batches(self) -> dict[str, OperationBatch]:
+        batches: dict[str, OperationBatch] = {}
+
+        for (address, _), operation in self._routes()[0].items():
+            if operation.batch is None:
+                continue
+
+            if (batch := batches.get(address)) is None:
+                batches[address] = OperationBatch(operation.batch.max_size, operation.batch.max_wait)
+            else:
+                batch.max_size = max(batch.max_size, operation.batch.max_size)
+                batch.max_wait = min(batch.max_wait, operation.batch.max_wait)
+
+        return batches
+
     @property
     def channels_schema(self) -> dict[str, dict[str, str]]:
-        if not hasattr(self, "_channels_schema"):
-            self._make_schemas()
+        self._make_schemas()
 
         return self._channels_schema
 
     @property
     def operations_schema(self) -> dict[str, dict[str, str]]:
-        if not hasattr(self, "_operations_schema"):
-            self._make_schemas()
+        self._make_schemas()
 
         return self._operations_schema
 
     @property
     def components(self) -> dict[str, Any]:
-        if not hasattr(self, "_components"):
-            self._make_schemas()
+        self._make_schemas()
 
         return self._components.as_schema()
 
@@ -45,18 +69,26 @@ class Channels:
         self._channels.append(channel)
 
     def channel_of(self, message: Message) -> Channel | None:
-        return next(filter(lambda c: c.sends(message.message_id), self._channels), None)
+        if (route := self._routes()[1].get(message.message_id)) is None:
+            return None
+
+        return route[0]
 
     def operation_of(self, address: str, message_id: str) -> Operation | None:
-        for channel in self._channels:
-            if (operation := channel.receives(address, message_id)) is not None:
-                return operation
+        return self._routes()[0].get((address, message_id))
+
+    def validation_of(self, address: str) -> ValidationPolicy | None:
+        self.build_routes()
+
+        return self._validations.get(address)
 
     def channel_and_operation_of(self, message: Message) -> tuple[Channel, Operation] | None:
-        for channel in self._channels:
-            for operation in channel.operations:
-                if operation.sends(message.message_id):
-                    return channel, operation
+        return self._routes()[1].get(message.message_id)
+
+    def channel_at(self, address: str) -> Channel | None:
+        self.build_routes()
+
+        return self._channels_by_address.get(address)
 
     def find_or_create_for(self, address: str) -> Channel:
         if (channel := next(filter(lambda c: c.address == address, self._channels), None)) is None:
@@ -65,7 +97,38 @@ class Channels:
 
         return channel
 
+    def build_routes(self) -> None:
+        if self._routes_revision == self.revision:
+            return
+
+        self._addresses = {channel.address for channel in self._channels}
+        self._receivers = {}
+        self._senders = {}
+        self._validations = {}
+        self._channels_by_address = {}
+
+        for channel in self._channels:
+            self._channels_by_address.setdefault(channel.address, channel)
+            if channel.validation is not None:
+                self._validations.setdefault(channel.address, channel.validation)
+
+            for operation in channel.operations:
+                if operation.receives(operation.message.__name__):
+                    self._receivers.setdefault((channel.address, operation.message.__name__), operation)
+                elif operation.sends(operation.message.__name__):
+                    self._senders.setdefault(operation.message.__name__, (channel, operation))
+
+        self._routes_revision = self.revision
+
+    def _routes(self) -> tuple[dict[tuple[str, str], Operation], dict[str, tuple[Channel, Operation]]]:
+        self.build_routes()
+
+        return self._receivers, self._senders
+
     def _make_schemas(self) -> None:
+        if self._schemas_revision == self.revision:
+            return
+
         self._channels_schema = {}
         self._operations_schema = {}
         self._components = Components()
@@ -76,3 +139,5 @@ class Channels:
                 self._operations_schema.update(operation.__async_api_reference__.as_component())
 
             self._components.merge(channel.__async_api_components__)
+
+        self._schemas_revision = self.revision
@@ -0,0 +1,10 @@
+from ...utils import lazy_package
+
+_exports = {
+    "OffsetIndex": "offset_index",
+    "PartitionLog": "partition_log",
+    "PartitionReader": "partition_reader",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
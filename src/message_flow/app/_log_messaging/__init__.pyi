@@ -0,0 +1,3 @@
+from .offset_index import OffsetIndex as OffsetIndex
+from .partition_log import PartitionLog as PartitionLog
+from .partition_reader import PartitionReader as PartitionReader
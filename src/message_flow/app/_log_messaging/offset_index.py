@@ -0,0 +1,93 @@
+import mmap
+import os
+import struct
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, final
+
+from ...utils import internal
+
+
+@final
+@internal
+class OffsetIndex:
+    """
+    Sparse index of a segment: fixed-size `offset | timestamp (ms) | position` entries appended
+    every few kilobytes of records, looked up by binary search over a memory map of the file.
+    """
+
+    SUFFIX = ".index"
+    ENTRY = struct.Struct("<QQQ")
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @classmethod
+    def for_segment(cls, partition_path: Path, base: int) -> "OffsetIndex":
+        return cls(partition_path / f"{base:020d}{cls.SUFFIX}")
+
+    def entries(self) -> list[tuple[int, int, int]]:
+        try:
+            content = self.path.read_bytes()
+        except FileNotFoundError:
+            return []
+
+        return list(self.ENTRY.iter_unpack(content[: len(content) - len(content) % self.ENTRY.size]))
+
+    def lookup_offset(self, offset: int) -> tuple[int, int] | None:
+        """
+        The offset and position of the last entry at or before *offset*.
+        """
+        return self._lookup(offset, 0)
+
+    def lookup_timestamp(self, timestamp: int) -> tuple[int, int] | None:
+        """
+        The offset and position of the last entry appended at or before *timestamp*, in milliseconds.
+        """
+        return self._lookup(timestamp, 1)
+
+    def first_timestamp(self) -> int | None:
+        with self._map() as view:
+            if view is None or len(view) < self.ENTRY.size:
+                return None
+
+            return self.ENTRY.unpack_from(view, 0)[1]
+
+    def _lookup(self, value: int, field: int) -> tuple[int, int] | None:
+        with self._map() as view:
+            if view is None:
+                return None
+
+            low, high = 0, len(view) // self.ENTRY.size
+            while low < high:
+                middle = (low + high) // 2
+                if self.ENTRY.unpack_from(view, middle * self.ENTRY.size)[field] <= value:
+                    low = middle + 1
+                else:
+                    high = middle
+
+            if low == 0:
+                return None
+
+            offset, _, position = self.ENTRY.unpack_from(view, (low - 1) * self.ENTRY.size)
+            return offset, position
+
+    @contextmanager
+    def _map(self) -> Iterator[mmap.mmap | None]:
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except FileNotFoundError:
+            yield None
+            return
+
+        try:
+            if os.fstat(fd).st_size == 0:
+                yield None
+                return
+
+            view = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+
+        with view:
+            yield view
@@ -0,0 +1,171 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import final
+from urllib.parse import quote
+
+from ...utils import internal
+from .._simple_messaging import Envelope
+from .offset_index import OffsetIndex
+
+
+@final
+@internal
+class PartitionLog:
+    """
+    Append side of a partition: a directory of segment files named after the offset of their first message,
+    each with a sparse `OffsetIndex` entry every *index interval bytes*.
+    """
+
+    SUFFIX = ".log"
+
+    def __init__(
+        self,
+        path: Path,
+        segment_bytes: int,
+        retention_seconds: float | None = None,
+        retention_bytes: int | None = None,
+        index_interval_bytes: int = 4096,
+    ) -> None:
+        self.path = path
+        self._segment_bytes = segment_bytes
+        self._index_interval_bytes = index_interval_bytes
+        self._retention_seconds = retention_seconds
+        self._retention_bytes = retention_bytes
+
+        self._lock = threading.Lock()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._open(bases[-1] if (bases := self.segments(self.path)) else 0)
+        self._enforce_retention()
+
+    @property
+    def next_offset(self) -> int:
+        return self._next_offset
+
+    @staticmethod
+    def channel_path(directory: Path, channel: str) -> Path:
+        """
+        The directory of *channel* under *directory*, percent-encoded so that the name stays one path component.
+        """
+        if not channel:
+            raise ValueError("Channel name must not be empty")
+
+        name = quote(channel, safe="")
+        return directory / (f"%2E{name[1:]}" if name.startswith(".") else name)
+
+    @classmethod
+    def segments(cls, path: Path) -> list[int]:
+        return sorted(
+            int(entry.name[: -len(cls.SUFFIX)]) for entry in os.scandir(path) if entry.name.endswith(cls.SUFFIX)
+        )
+
+    @classmethod
+    def segment_path(cls, path: Path, base: int) -> Path:
+        return path / f"{base:020d}{cls.SUFFIX}"
+
+    def append(self, records: list[bytes]) -> int:
+        data = b"".join(records)
+
+        with self._lock:
+            if self._size and self._size + len(data) > self._segment_bytes:
+                self._roll()
+
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self._fd, view) :]
+
+            offset, position = self._next_offset, self._size
+            self._size += len(data)
+            self._next_offset += len(records)
+
+            if position == 0 or position - self._indexed_at >= self._index_interval_bytes:
+                os.write(self._index_fd, OffsetIndex.ENTRY.pack(offset, time.time_ns() // 1_000_000, position))
+                self._indexed_at = position
+
+            return offset
+
+    def sync(self) -> None:
+        with self._lock:
+            os.fsync(self._fd)
+
+    def close(self) -> None:
+        with self._lock:
+            os.close(self._fd)
+            os.close(self._index_fd)
+
+    def _open(self, base: int) -> None:
+        self._base = base
+        self._fd = os.open(self.segment_path(self.path, base), os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        self._index = OffsetIndex.for_segment(self.path, base)
+        self._index_fd = os.open(self._index.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+        self._size, count = self._recover()
+        self._next_offset = base + count
+
+    def _roll(self) -> None:
+        os.close(self._fd)
+        os.close(self._index_fd)
+        self._open(self._next_offset)
+        self._enforce_retention()
+
+    def _enforce_retention(self) -> None:
+        """
+        Delete the oldest inactive segments older than *retention seconds* or beyond *retention bytes* in total.
+        """
+        if self._retention_seconds is None and self._retention_bytes is None:
+            return
+
+        segments = [self.segment_path(self.path, base) for base in self.segments(self.path) if base < self._base]
+        stats = [segment.stat() for segment in segments]
+        total = sum(stat.st_size for stat in stats) + self._size
+        expired_at = time.time() - self._retention_seconds if self._retention_seconds is not None else None
+
+        for segment, stat in zip(segments, stats):
+            too_old = expired_at is not None and stat.st_mtime < expired_at
+            too_large = self._retention_bytes is not None and total > self._retention_bytes
+
+            if not (too_old or too_large):
+                break
+
+            segment.unlink(missing_ok=True)
+            OffsetIndex.for_segment(self.path, int(segment.name[: -len(self.SUFFIX)])).path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+    def _recover(self) -> tuple[int, int]:
+        """
+        Count the complete records of the active segment, cut off a record left half-written by a crash
+        and drop index entries past it. A missing index is rebuilt, dated with the segment modification time.
+        """
+        size = count = 0
+        entries: list[tuple[int, int, int]] = []
+        modified_at = os.fstat(self._fd).st_mtime_ns // 1_000_000
+
+        with open(os.dup(self._fd), "rb") as fp:
+            fp.seek(0)
+            while True:
+                try:
+                    if Envelope.read(fp) is None:
+                        break
+                except ValueError:
+                    pass
+
+                if size == 0 or size - entries[-1][2] >= self._index_interval_bytes:
+                    entries.append((self._base + count, modified_at, size))
+
+                size = fp.tell()
+                count += 1
+
+        if size != os.fstat(self._fd).st_size:
+            os.ftruncate(self._fd, size)
+
+        if indexed := self._index.entries():
+            entries = [entry for entry in indexed if entry[2] < size]
+
+        if entries != indexed:
+            os.ftruncate(self._index_fd, 0)
+            os.write(self._index_fd, b"".join(OffsetIndex.ENTRY.pack(*entry) for entry in entries))
+
+        self._indexed_at = entries[-1][2] if entries else 0
+
+        return size, count
@@ -0,0 +1,155 @@
+import bisect
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Literal, final
+
+from ...utils import internal
+from .._simple_messaging import Envelope
+from .offset_index import OffsetIndex
+from .partition_log import PartitionLog
+
+
+@final
+@internal
+class PartitionReader:
+    """
+    Consume side of a partition, tracking the position of a consumer group in an offset file.
+    """
+
+    def __init__(self, path: Path, group: str, offset_reset: Literal["earliest", "latest"] = "earliest") -> None:
+        self.path = path
+
+        self._offset_path = path / f"{group}.offset"
+        self._fp: BinaryIO | None = None
+        self._base = self._position = self.offset = 0
+        self._committed: int | None = None
+
+        self.uncommitted = 0
+
+        if not self._restore():
+            self._reset(offset_reset)
+
+    def read(self) -> tuple[str, bytes, dict[str, str]] | None:
+        if self._fp is None:
+            if not (segments := PartitionLog.segments(self.path)):
+                return None
+
+            self._seek(segments[0], 0, max(segments[0], self.offset))
+
+        while (record := self._read()) is None:
+            if (following := self._following()) is None:
+                return None
+
+            # The segment is complete once a newer one exists, pick up what was appended in the meantime.
+            if (record := self._read()) is not None:
+                break
+
+            self._seek(following, 0, max(following, self.offset))
+
+        return record
+
+    def seek(self, offset: int | None = None, timestamp: datetime | None = None) -> None:
+        """
+        Move to the message at *offset*, or to the indexed message appended at or shortly before *timestamp*.
+        """
+        if not (segments := PartitionLog.segments(self.path)):
+            return
+
+        if timestamp is not None:
+            milliseconds = int(timestamp.timestamp() * 1000)
+            first_timestamps = [OffsetIndex.for_segment(self.path, base).first_timestamp() or 0 for base in segments]
+            base = segments[max(bisect.bisect_right(first_timestamps, milliseconds) - 1, 0)]
+            entry = OffsetIndex.for_segment(self.path, base).lookup_timestamp(milliseconds)
+        else:
+            offset = offset or 0
+            base = segments[max(bisect.bisect_right(segments, offset) - 1, 0)]
+            entry = OffsetIndex.for_segment(self.path, base).lookup_offset(offset)
+
+        start, position = entry or (base, 0)
+        self._seek(base, position, start)
+
+        while offset is not None and self.offset < offset:
+            try:
+                if self.read() is None:
+                    break
+            except ValueError:
+                continue
+
+        self.uncommitted = 0
+
+    def commit(self) -> None:
+        if self._committed == self.offset:
+            return
+
+        temporary_path = self._offset_path.with_suffix(".tmp")
+        temporary_path.write_text(f"{self.offset} {self._base} {self._position}")
+        os.replace(temporary_path, self._offset_path)
+
+        self._committed = self.offset
+        self.uncommitted = 0
+
+    def close(self) -> None:
+        self.commit()
+
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def _read(self) -> tuple[str, bytes, dict[str, str]] | None:
+        try:
+            record = Envelope.read(self._fp)  # type: ignore
+        except ValueError:
+            self._advance()
+            raise
+
+        if record is None:
+            self._fp.seek(self._position)  # type: ignore
+            return None
+
+        self._advance()
+        return record
+
+    def _advance(self) -> None:
+        self._position = self._fp.tell()  # type: ignore
+        self.offset += 1
+        self.uncommitted += 1
+
+    def _restore(self) -> bool:
+        try:
+            offset, base, position = map(int, self._offset_path.read_text().split())
+        except (FileNotFoundError, ValueError):
+            return False
+
+        if base not in PartitionLog.segments(self.path):
+            return False
+
+        self._seek(base, position, offset)
+        self._committed = offset
+        return True
+
+    def _reset(self, offset_reset: Literal["earliest", "latest"]) -> None:
+        if not (segments := PartitionLog.segments(self.path)):
+            return
+
+        if offset_reset == "earliest":
+            self._seek(segments[0], 0, segments[0])
+            return
+
+        self._seek(segments[-1], 0, segments[-1])
+        while self.read() is not None:
+            pass
+
+        self.uncommitted = 0
+
+    def _seek(self, base: int, position: int, offset: int) -> None:
+        if self._fp is not None:
+            self._fp.close()
+
+        self._fp = open(PartitionLog.segment_path(self.path, base), "rb")
+        self._fp.seek(position)
+
+        self._base, self._position, self.offset = base, position, offset
+
+    def _following(self) -> int | None:
+        return next((base for base in PartitionLog.segments(self.path) if base > self._base), None)
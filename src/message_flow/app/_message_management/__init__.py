@@ -1,3 +1,19 @@
-from ...utils import init_package
+from ...utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "AsyncDispatcher": "async_dispatcher",
+    "AsyncProducer": "async_producer",
+    "Compressor": "compressor",
+    "Dispatcher": "dispatcher",
+    "FlowControl": "flow_control",
+    "AsyncFlowControl": "flow_control",
+    "MessageBatcher": "message_batcher",
+    "AsyncMessageBatcher": "message_batcher",
+    "MiddlewarePipeline": "middleware_pipeline",
+    "OrderedWorkerPool": "ordered_worker_pool",
+    "Producer": "producer",
+    "RoutingHeaders": "routing_headers",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
@@ -1,3 +1,12 @@
-from .dispatcher import *
-from .producer import *
-from .routing_headers import *
+from .async_dispatcher import AsyncDispatcher as AsyncDispatcher
+from .async_producer import AsyncProducer as AsyncProducer
+from .compressor import Compressor as Compressor
+from .dispatcher import Dispatcher as Dispatcher
+from .flow_control import AsyncFlowControl as AsyncFlowControl
+from .flow_control import FlowControl as FlowControl
+from .message_batcher import AsyncMessageBatcher as AsyncMessageBatcher
+from .message_batcher import MessageBatcher as MessageBatcher
+from .middleware_pipeline import MiddlewarePipeline as MiddlewarePipeline
+from .ordered_worker_pool import OrderedWorkerPool as OrderedWorkerPool
+from .producer import Producer as Producer
+from .routing_headers import RoutingHeaders as RoutingHeaders
@@ -0,0 +1,164 @@
+import asyncio
+import inspect
+import logging
+from contextlib import AsyncExitStack
+from typing import Any, Coroutine, final
+
+from ...message import Message
+from ...operation import Operation
+from ...utils import internal
+from .._internal import Channels
+from ..messaging import AsyncMessageConsumer
+from .async_producer import AsyncProducer
+from .flow_control import AsyncFlowControl
+from .message_batcher import AsyncMessageBatcher
+from .middleware_pipeline import Middleware, MiddlewarePipeline
+from .routing_headers import RoutingHeaders
+
+
+@final
+@internal
+class AsyncDispatcher:
+    def __init__(
+        self,
+        channels: Channels,
+        message_consumer: AsyncMessageConsumer,
+        producer: AsyncProducer,
+        logger: logging.Logger,
+        middlewares: list[Middleware],
+        max_in_flight: int,
+        max_in_flight_bytes: int | None = None,
+    ) -> None:
+        self._logger = logger
+
+        self._channels = channels
+        self._message_consumer = message_consumer
+        self._producer = producer
+        self._pipeline = MiddlewarePipeline(middlewares)
+
+        self._flow_control = AsyncFlowControl(max_in_flight, max_in_flight_bytes)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._batchers: dict[Operation, AsyncMessageBatcher] = {}
+
+    def initialize(self) -> None:
+        self._logger.debug("Initializing async dispatcher")
+        self._channels.build_routes()
+
+        if (set_prefetch := getattr(self._message_consumer, "set_prefetch", None)) is not None:
+            set_prefetch(self._flow_control.max_messages, self._flow_control.max_bytes)
+
+        self._message_consumer.subscribe(
+            self._channels.addresses,
+            self.message_handler,
+        )
+        self._logger.debug("Initialized async dispatcher")
+
+    async def message_handler(self, payload: bytes, headers: dict[str, str]) -> None:
+        if (
+            handler := self._channels.operation_of(headers[RoutingHeaders.ADDRESS], headers[RoutingHeaders.TYPE])
+        ) is None:
+            return
+
+        await self._flow_control.acquire(len(payload))
+
+        if handler.batch is not None:
+            self._batcher_of(handler).add(payload, headers)
+        else:
+            self._spawn(self._process(handler, payload, headers))
+
+    async def drain(self) -> None:
+        for batcher in self._batchers.values():
+            batcher.flush()
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _batcher_of(self, handler: Operation) -> AsyncMessageBatcher:
+        if (batcher := self._batchers.get(handler)) is None:
+            batcher = self._batchers[handler] = AsyncMessageBatcher(
+                lambda batch: self._spawn(self._process_batch(handler, batch)),
+                max_size=handler.batch.max_size,  # type: ignore
+                max_wait=handler.batch.max_wait,  # type: ignore
+            )
+
+        return batcher
+
+    def _spawn(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._complete)
+
+    async def _process(self, handler: Operation, payload: bytes, headers: dict[str, str]) -> None:
+        try:
+            if (encoding := headers.get(RoutingHeaders.CONTENT_ENCODING)) is not None:
+                decompressed = self._producer.compressor.decompress(payload, encoding)
+            else:
+                decompressed = payload
+
+            await self._pipeline.consume_async(decompressed, headers, self._handle, handler, decompressed, headers)
+        finally:
+            await self._flow_control.release(len(payload))
+
+    async def _process_batch(self, handler: Operation, batch: list[tuple[bytes, dict[str, str]]]) -> None:
+        try:
+            messages = [
+                (
+                    self._producer.compressor.decompress(payload, encoding)
+                    if (encoding := headers.get(RoutingHeaders.CONTENT_ENCODING)) is not None
+                    else payload,
+                    headers,
+                )
+                for payload, headers in batch
+            ]
+            validation = self._channels.validation_of(batch[0][1][RoutingHeaders.ADDRESS])
+
+            async with AsyncExitStack() as dispatcher_stack:
+                for payload, headers in messages:
+                    for context in self._pipeline.consume_async_contexts:
+                        await dispatcher_stack.enter_async_context(context(payload, headers))
+
+                await self._call(
+                    handler,
+                    [
+                        handler.message.from_payload_and_headers(payload, headers, validation)
+                        for payload, headers in messages
+                    ],
+                )
+        finally:
+            for payload, _ in batch:
+                await self._flow_control.release(len(payload))
+
+    async def _handle(self, handler: Operation, payload: bytes, headers: dict[str, str]) -> None:
+        if (
+            message := await self._call(
+                handler,
+                handler.message.from_payload_and_headers(
+                    payload, headers, self._channels.validation_of(headers[RoutingHeaders.ADDRESS])
+                ),
+            )
+        ) is not None:
+            reply_to = headers[RoutingHeaders.REPLY_TO]
+            channel = self._channels.channel_at(reply_to)
+
+            await self._pipeline.produce_async(
+                message.payload,
+                message.headers,
+                self._producer.send,
+                reply_to,
+                message,
+                None,
+                channel.content_type if channel is not None else None,
+                channel.compression if channel is not None else None,
+            )
+
+    async def _call(self, handler: Operation, argument: Message | list[Message]) -> Message | None:
+        if inspect.iscoroutinefunction(handler.handler):
+            return await handler(argument)  # type: ignore
+
+        return await asyncio.get_running_loop().run_in_executor(None, handler, argument)
+
+    def _complete(self, task: "asyncio.Task[None]") -> None:
+        self._tasks.discard(task)
+
+        if not task.cancelled() and (error := task.exception()) is not None:
+            self._logger.error("An error occurred while handling message", exc_info=error)
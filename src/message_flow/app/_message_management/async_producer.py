@@ -0,0 +1,59 @@
+import asyncio
+import inspect
+from typing import final
+
+from ...channel import Compression
+from ...message import Message
+from ...utils import internal
+from ..messaging import AsyncMessageProducer, MessageProducer
+from .compressor import Compressor
+from .routing_headers import RoutingHeaders
+
+
+@final
+@internal
+class AsyncProducer:
+    def __init__(
+        self, message_producer: MessageProducer | AsyncMessageProducer, compressor: Compressor | None = None
+    ) -> None:
+        self._message_producer = message_producer
+        self._is_async = inspect.iscoroutinefunction(message_producer.send)
+
+        self.compressor = compressor or Compressor()
+
+    async def send(
+        self,
+        channel: str,
+        message: Message,
+        reply_to_address: str | None = None,
+        content_type: str | None = None,
+        compression: Compression | None = None,
+    ) -> None:
+        if content_type is not None:
+            message.set_default_content_type(content_type)
+
+        message.add_routing_headers(
+            RoutingHeaders.make(channel, message.message_id, reply_to_address, message.content_type)
+        )
+
+        payload, encoding = self.compressor.compress(message.payload, compression)
+
+        if encoding is not None:
+            message.add_routing_headers({RoutingHeaders.CONTENT_ENCODING: encoding})
+        else:
+            message.headers.pop(RoutingHeaders.CONTENT_ENCODING, None)
+
+        if self._is_async:
+            await self._message_producer.send(channel, payload, message.headers)  # type: ignore
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._message_producer.send, channel, payload, message.headers
+            )
+
+    async def close(self) -> None:
+        if (flush := getattr(self._message_producer, "flush", None)) is not None:
+            if inspect.isawaitable(result := flush()):
+                await result
+
+        if inspect.isawaitable(result := self._message_producer.close()):
+            await result
@@ -0,0 +1,52 @@
+import gzip
+import lzma
+import time
+import zlib
+from typing import Callable, final
+
+from ...channel import Compression, CompressionStats
+from ...utils import internal
+
+_COMPRESSORS: dict[str, Callable[[bytes, int | None], bytes]] = {
+    "zlib": lambda data, level: zlib.compress(data, -1 if level is None else level),
+    "gzip": lambda data, level: gzip.compress(data, 9 if level is None else level),
+    "lzma": lambda data, level: lzma.compress(data, preset=level),
+}
+
+_DECOMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "zlib": zlib.decompress,
+    "gzip": gzip.decompress,
+    "lzma": lzma.decompress,
+}
+
+
+@final
+@internal
+class Compressor:
+    def __init__(self) -> None:
+        self.stats = CompressionStats()
+
+    def compress(self, payload: bytes, compression: Compression | None) -> tuple[bytes, str | None]:
+        if compression is None or len(payload) < compression.threshold:
+            return payload, None
+
+        started = time.perf_counter()
+        compressed = _COMPRESSORS[compression.algorithm](payload, compression.level)
+        seconds = time.perf_counter() - started
+
+        if len(compressed) >= len(payload):
+            return payload, None
+
+        self.stats.record_compression(len(payload), len(compressed), seconds)
+
+        return compressed, compression.algorithm
+
+    def decompress(self, payload: bytes | memoryview, encoding: str) -> bytes:
+        if (decompressor := _DECOMPRESSORS.get(encoding)) is None:
+            raise ValueError(f"Unsupported content encoding {encoding!r}.")
+
+        started = time.perf_counter()
+        decompressed = decompressor(payload)
+        self.stats.record_decompression(time.perf_counter() - started)
+
+        return decompressed
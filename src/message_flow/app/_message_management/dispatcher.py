@@ -1,11 +1,18 @@
+import asyncio
+import inspect
 import logging
+import threading
 from contextlib import ExitStack
-from typing import final
+from typing import Any, Coroutine, final
 
+from ...operation import Operation, OperationBatch
 from ...utils import internal
 from .._internal import Channels
-from ..base_middleware import BaseMiddleware
 from ..messaging import MessageConsumer
+from .flow_control import FlowControl
+from .message_batcher import MessageBatcher
+from .middleware_pipeline import Middleware, MiddlewarePipeline
+from .ordered_worker_pool import OrderedWorkerPool
 from .producer import Producer
 from .routing_headers import RoutingHeaders
 
@@ -25,37 +32,224 @@ class Dispatcher:
         self._channels = channels
         self._message_consumer = message_consumer
         self._producer = producer
-        self._middlewares: list[type[BaseMiddleware]] = []
+        self._middlewares: list[Middleware] = []
+        self._pipeline: MiddlewarePipeline | None = None
+        self._worker_pool: OrderedWorkerPool | None = None
+        self._batchers: list[MessageBatcher] = []
+        self._flow_control: FlowControl | None = None
+        self._event_loop: asyncio.AbstractEventLoop | None = None
+        self._event_loop_thread: threading.Thread | None = None
+        self._event_loop_lock = threading.Lock()
 
-    def initialize(self) -> None:
+    @property
+    def middlewares(self) -> list[Middleware]:
+        return self._middlewares
+
+    @property
+    def pipeline(self) -> MiddlewarePipeline:
+        if self._pipeline is None:
+            self._pipeline = MiddlewarePipeline(self._middlewares)
+
+        return self._pipeline
+
+    def initialize(
+        self,
+        threads: int = 1,
+        ordering_key: str | None = None,
+        queue_size: int = 1000,
+        max_in_flight: int | None = None,
+        max_in_flight_bytes: int | None = None,
+    ) -> None:
         self._logger.debug("Initializing dispatcher")
-        self._message_consumer.subscribe(
-            self._channels.addresses,
-            self.message_handler,
-        )
+        self.prepare()
+
+        if max_in_flight is not None or max_in_flight_bytes is not None:
+            self._flow_control = FlowControl(max_in_flight, max_in_flight_bytes)
+
+            if (set_prefetch := getattr(self._message_consumer, "set_prefetch", None)) is not None:
+                set_prefetch(max_in_flight, max_in_flight_bytes)
+
+        message_handler = self.message_handler
+
+        if threads > 1:
+            self._worker_pool = OrderedWorkerPool(
+                self._flow_control.complete(message_handler) if self._flow_control is not None else message_handler,
+                self._logger,
+                workers=threads,
+                ordering_key=ordering_key or RoutingHeaders.ADDRESS,
+                queue_size=queue_size,
+            )
+            self._worker_pool.start()
+            message_handler = self._worker_pool.submit
+
+            if self._flow_control is not None:
+                message_handler = self._flow_control.admit(message_handler)
+        elif self._flow_control is not None:
+            message_handler = self._flow_control.limit(message_handler)
+
+        batches = self._channels.batches
+
+        self._message_consumer.subscribe(self._channels.addresses - batches.keys(), message_handler)
+
+        for address, batch in batches.items():
+            self._subscribe_batch(address, batch)
+
         self._logger.debug("Initialized dispatcher")
 
-    def add_middleware(self, middleware: type[BaseMiddleware]) -> None:
+    @property
+    def fork_safe(self) -> bool:
+        return getattr(self._message_consumer, "fork_safe", False)
+
+    def set_worker(self, index: int, workers: int) -> None:
+        if (set_worker := getattr(self._message_consumer, "set_worker", None)) is not None:
+            set_worker(index, workers)
+
+    def prepare(self) -> None:
+        self._channels.build_routes()
+        self._pipeline = MiddlewarePipeline(self._middlewares)
+
+    def shutdown(self) -> None:
+        for batcher in self._batchers:
+            batcher.flush()
+
+        if self._worker_pool is not None:
+            self._logger.debug("Waiting for workers to process remaining messages")
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+
+        if self._event_loop is not None:
+            self._event_loop.call_soon_threadsafe(self._event_loop.stop)
+            self._event_loop_thread.join()  # type: ignore
+            self._event_loop.close()
+            self._event_loop = self._event_loop_thread = None
+
+    def stop(self) -> None:
+        self._message_consumer.close()
+
+    def add_middleware(self, middleware: Middleware) -> None:
         self._middlewares.append(middleware)
+        self._pipeline = None
 
-    def message_handler(self, payload: bytes, headers: dict[str, str]) -> None:
+    def message_handler(self, payload: bytes | memoryview, headers: dict[str, str]) -> None:
         if (
             handler := self._channels.operation_of(headers[RoutingHeaders.ADDRESS], headers[RoutingHeaders.TYPE])
         ) is None:
             return
 
-        with ExitStack() as dispatcher_stack:
-            self._execute_consume_middlewares(dispatcher_stack, payload, headers)
+        if handler.batch is not None:
+            return self.batch_handler([(payload, headers)])
+
+        if (encoding := headers.get(RoutingHeaders.CONTENT_ENCODING)) is not None:
+            payload = self._producer.compressor.decompress(payload, encoding)
+
+        self.pipeline.consume(payload, headers, self._handle, handler, payload, headers)
+
+    def batch_handler(self, messages: list[tuple[bytes, dict[str, str]]]) -> None:
+        batches: dict[Operation, list[tuple[bytes, dict[str, str]]]] = {}
+
+        for payload, headers in messages:
+            if (
+                handler := self._channels.operation_of(headers[RoutingHeaders.ADDRESS], headers[RoutingHeaders.TYPE])
+            ) is None:
+                continue
 
-            if (message := handler(handler.message.from_payload_and_headers(payload, headers))) is not None:
-                self._execute_produce_middlewares(dispatcher_stack, message.payload, message.headers)
+            if handler.batch is None:
+                self.message_handler(payload, headers)
+                continue
 
-                self._producer.send(headers[RoutingHeaders.REPLY_TO], message)
+            if (encoding := headers.get(RoutingHeaders.CONTENT_ENCODING)) is not None:
+                payload = self._producer.compressor.decompress(payload, encoding)
 
-    def _execute_consume_middlewares(self, stack: ExitStack, payload: bytes, headers: dict[str, str]) -> None:
-        for middleware in self._middlewares:
-            stack.enter_context(middleware(payload, headers).consume())
+            batches.setdefault(handler, []).append((payload, headers))
+
+        for handler, batch in batches.items():
+            validation = self._channels.validation_of(batch[0][1][RoutingHeaders.ADDRESS])
+
+            with ExitStack() as dispatcher_stack:
+                for payload, headers in batch:
+                    for context in self.pipeline.consume_contexts:
+                        dispatcher_stack.enter_context(context(payload, headers))
+
+                if inspect.isawaitable(
+                    result := handler(
+                        [  # type: ignore
+                            handler.message.from_payload_and_headers(payload, headers, validation)
+                            for payload, headers in batch
+                        ]
+                    )
+                ):
+                    self._run(result)  # type: ignore
+
+    def _handle(self, handler: Operation, payload: bytes | memoryview, headers: dict[str, str]) -> None:
+        message = handler.message.from_payload_and_headers(
+            payload, headers, self._channels.validation_of(headers[RoutingHeaders.ADDRESS])
+        )
+
+        if inspect.isawaitable(reply := handler(message)):
+            reply = self._run(reply)  # type: ignore
+
+        if reply is not None:
+            reply_to = headers[RoutingHeaders.REPLY_TO]
+            channel = self._channels.channel_at(reply_to)
+
+            self.pipeline.produce(
+                reply.payload,
+                reply.headers,
+                self._producer.send,
+                reply_to,
+                reply,
+                None,
+                channel.content_type if channel is not None else None,
+                channel.compression if channel is not None else None,
+            )
+
+    def _run(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        # Coroutine handlers share one event loop for the whole dispatch, so that loop-bound
+        # resources outlive a single message, whichever thread the handler is called from.
+        with self._event_loop_lock:
+            if self._event_loop is None:
+                self._event_loop = asyncio.new_event_loop()
+                self._event_loop_thread = threading.Thread(
+                    target=self._event_loop.run_forever, name="message-flow-event-loop", daemon=True
+                )
+                self._event_loop_thread.start()
+
+        return asyncio.run_coroutine_threadsafe(coroutine, self._event_loop).result()
+
+    def _subscribe_batch(self, address: str, batch: OperationBatch) -> None:
+        if (subscribe_batch := getattr(self._message_consumer, "subscribe_batch", None)) is not None:
+            try:
+                subscribe_batch(
+                    {address},
+                    self._flow_control.limit_batch(self.batch_handler)
+                    if self._flow_control is not None
+                    else self.batch_handler,
+                    batch.max_size,
+                    batch.max_wait,
+                )
+                return
+            except NotImplementedError:
+                pass
+
+        batcher = MessageBatcher(
+            self._complete_batch if self._flow_control is not None else self.batch_handler,
+            self._logger,
+            max_size=batch.max_size,
+            max_wait=batch.max_wait,
+        )
+        self._batchers.append(batcher)
+        self._message_consumer.subscribe(
+            {address},
+            self._flow_control.admit(batcher.add) if self._flow_control is not None else batcher.add,
+        )
 
-    def _execute_produce_middlewares(self, stack: ExitStack, payload: bytes, headers: dict[str, str]) -> None:
-        for middleware in self._middlewares:
-            stack.enter_context(middleware(payload, headers).produce())
+    def _complete_batch(self, messages: list[tuple[bytes, dict[str, str]]]) -> None:
+        # Every message of the batch is already handed over, so raising to the consumer would make
+        # the admitting handler of the last one release its credit twice.
+        try:
+            self.batch_handler(messages)
+        except Exception as error:
+            self._logger.error("An error occurred while handling batch of messages", exc_info=error)
+        finally:
+            for payload, _ in messages:
+                self._flow_control.release(len(payload))  # type: ignore
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+from typing import Callable, final
+
+from ...utils import internal
+
+MessageHandler = Callable[[bytes, dict[str, str]], None]
+BatchHandler = Callable[[list[tuple[bytes, dict[str, str]]]], None]
+
+
+@final
+@internal
+class FlowControl:
+    """
+    Credit-based limit of messages and payload bytes being processed at once.
+
+    A message bigger than *max bytes*, or a batch bigger than either limit, is
+    admitted only when no other messages are in flight.
+    """
+
+    def __init__(self, max_messages: int | None = None, max_bytes: int | None = None) -> None:
+        if max_messages is not None and max_messages < 1:
+            raise ValueError("Maximum number of in-flight messages should be positive.")
+
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("Maximum number of in-flight bytes should be positive.")
+
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+
+        self._messages = 0
+        self._bytes = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int, count: int = 1) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: self._has_capacity(size, count))
+            self._messages += count
+            self._bytes += size
+
+    def release(self, size: int, count: int = 1) -> None:
+        with self._condition:
+            self._messages -= count
+            self._bytes -= size
+            self._condition.notify_all()
+
+    def admit(self, handler: MessageHandler) -> MessageHandler:
+        """
+        Acquire credit for the message handed over to *handler*, e.g. a queue of worker threads.
+        The credit is released by the `complete`d handler, or right away when the hand-over fails.
+        """
+
+        def admitted(payload: bytes, headers: dict[str, str]) -> None:
+            self.acquire(len(payload))
+            try:
+                handler(payload, headers)
+            except BaseException:
+                self.release(len(payload))
+                raise
+
+        return admitted
+
+    def complete(self, handler: MessageHandler) -> MessageHandler:
+        def completed(payload: bytes, headers: dict[str, str]) -> None:
+            try:
+                handler(payload, headers)
+            finally:
+                self.release(len(payload))
+
+        return completed
+
+    def limit(self, handler: MessageHandler) -> MessageHandler:
+        """
+        Hold credit for the message while *handler* processes it in the calling thread.
+        """
+
+        def limited(payload: bytes, headers: dict[str, str]) -> None:
+            self.acquire(len(payload))
+            try:
+                handler(payload, headers)
+            finally:
+                self.release(len(payload))
+
+        return limited
+
+    def limit_batch(self, handler: BatchHandler) -> BatchHandler:
+        """
+        Hold credit for every message of the batch while *handler* processes it in the calling thread.
+        """
+
+        def limited(messages: list[tuple[bytes, dict[str, str]]]) -> None:
+            size = sum(len(payload) for payload, _ in messages)
+
+            self.acquire(size, len(messages))
+            try:
+                handler(messages)
+            finally:
+                self.release(size, len(messages))
+
+        return limited
+
+    def _has_capacity(self, size: int, count: int) -> bool:
+        return (self.max_messages is None or self._messages == 0 or self._messages + count <= self.max_messages) and (
+            self.max_bytes is None or self._messages == 0 or self._bytes + size <= self.max_bytes
+        )
+
+
+@final
+@internal
+class AsyncFlowControl:
+    """
+    Credit-based limit of messages and payload bytes being processed at once
+    on the event loop.
+    """
+
+    def __init__(self, max_messages: int | None = None, max_bytes: int | None = None) -> None:
+        if max_messages is not None and max_messages < 1:
+            raise ValueError("Maximum number of in-flight messages should be positive.")
+
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("Maximum number of in-flight bytes should be positive.")
+
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+
+        self._messages = 0
+        self._bytes = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, size: int) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._has_capacity(size))
+            self._messages += 1
+            self._bytes += size
+
+    async def release(self, size: int) -> None:
+        async with self._condition:
+            self._messages -= 1
+            self._bytes -= size
+            self._condition.notify_all()
+
+    def _has_capacity(self, size: int) -> bool:
+        return (self.max_messages is None or self._messages < self.max_messages) and (
+            self.max_bytes is None or self._messages == 0 or self._bytes + size <= self.max_bytes
+        )
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import threading
+from typing import Callable, final
+
+from ...utils import internal
+
+
+@final
+@internal
+class MessageBatcher:
+    """
+    Accumulates consumed messages for consumers without native batching
+    and hands them over when the batch is full or the wait time is elapsed.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[tuple[bytes, dict[str, str]]]], None],
+        logger: logging.Logger,
+        *,
+        max_size: int,
+        max_wait: float,
+    ) -> None:
+        self._logger = logger
+
+        self._handler = handler
+        self._max_size = max_size
+        self._max_wait = max_wait
+
+        self._lock = threading.RLock()
+        self._batch: list[tuple[bytes, dict[str, str]]] = []
+        self._timer: threading.Timer | None = None
+
+    def add(self, payload: bytes, headers: dict[str, str]) -> None:
+        with self._lock:
+            self._batch.append((payload, headers))
+
+            if len(self._batch) >= self._max_size:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._max_wait, self._flush_on_timeout)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+            if not self._batch:
+                return
+
+            batch, self._batch = self._batch, []
+            self._handler(batch)
+
+    def _flush_on_timeout(self) -> None:
+        try:
+            self.flush()
+        except Exception as error:
+            self._logger.error("An error occurred while handling batch of messages", exc_info=error)
+
+
+@final
+@internal
+class AsyncMessageBatcher:
+    """
+    Accumulates messages consumed on the event loop and hands them over
+    when the batch is full or the wait time is elapsed.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[list[tuple[bytes, dict[str, str]]]], None],
+        *,
+        max_size: int,
+        max_wait: float,
+    ) -> None:
+        self._handler = handler
+        self._max_size = max_size
+        self._max_wait = max_wait
+
+        self._batch: list[tuple[bytes, dict[str, str]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    def add(self, payload: bytes, headers: dict[str, str]) -> None:
+        self._batch.append((payload, headers))
+
+        if len(self._batch) >= self._max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._max_wait, self.flush)
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._batch:
+            return
+
+        batch, self._batch = self._batch, []
+        self._handler(batch)
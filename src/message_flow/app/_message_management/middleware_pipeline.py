@@ -0,0 +1,223 @@
+import inspect
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Sequence,
+    TypeVar,
+    final,
+)
+
+from ...utils import internal
+from ..base_middleware import BaseMiddleware
+from ..stateless_middleware import StatelessMiddleware
+
+Middleware = type[BaseMiddleware] | type[StatelessMiddleware]
+Stage = Callable[..., None]
+AsyncStage = Callable[..., Awaitable[None]]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@final
+@internal
+class MiddlewarePipeline:
+    """
+    Middlewares compiled into chains of plain functions.
+
+    Each chain is called as `chain(payload, headers, call, *args)`, runs the
+    hooks of all middlewares around `call(*args)`. `BaseMiddleware` is adapted
+    by instantiating it once per `Message` and entering its `consume()` or
+    `produce()`, `StatelessMiddleware` hooks are called directly. The synchronous
+    chains raise `TypeError` for middlewares with coroutine hooks.
+
+    `consume_contexts` and `consume_async_contexts` are the context manager
+    factories used to enter the consume hooks of every `Message` of a batch at once.
+    """
+
+    def __init__(self, middlewares: Sequence[Middleware]) -> None:
+        self.consume_contexts: list[Callable[[bytes, dict[str, str]], ContextManager[None]]] = []
+        self.consume_async_contexts: list[Callable[[bytes, dict[str, str]], AsyncContextManager[None]]] = []
+        self.consume: Stage = _run
+        self.produce: Stage = _run
+        self.consume_async: AsyncStage = _run_async
+        self.produce_async: AsyncStage = _run_async
+
+        for middleware in reversed(middlewares):
+            consume_hooks = (middleware.on_consume, middleware.after_consume)
+            produce_hooks = (middleware.on_produce, middleware.after_produce)
+
+            if issubclass(middleware, StatelessMiddleware):
+                self.consume_contexts.insert(0, _synchronous(middleware, consume_hooks, middleware.consume))
+                self.consume_async_contexts.insert(0, _stateless_async_context(*consume_hooks))
+                self.consume = _synchronous(middleware, consume_hooks, _stateless_stage(*consume_hooks, self.consume))
+                self.produce = _synchronous(middleware, produce_hooks, _stateless_stage(*produce_hooks, self.produce))
+                self.consume_async = _stateless_async_stage(*consume_hooks, self.consume_async)
+                self.produce_async = _stateless_async_stage(*produce_hooks, self.produce_async)
+            else:
+                self.consume_contexts.insert(
+                    0, _synchronous(middleware, consume_hooks, _instance_consume_context(middleware))
+                )
+                self.consume_async_contexts.insert(0, _instance_async_consume_context(middleware))
+                self.consume = _synchronous(
+                    middleware, consume_hooks, _instance_stage(middleware, middleware.consume, self.consume)
+                )
+                self.produce = _synchronous(
+                    middleware, produce_hooks, _instance_stage(middleware, middleware.produce, self.produce)
+                )
+                self.consume_async = _instance_async_stage(middleware, *consume_hooks, self.consume_async)
+                self.produce_async = _instance_async_stage(middleware, *produce_hooks, self.produce_async)
+
+
+def _run(payload: bytes, headers: dict[str, str], call: Callable[..., Any], *args: Any) -> None:
+    call(*args)
+
+
+async def _run_async(payload: bytes, headers: dict[str, str], call: Callable[..., Awaitable[Any]], *args: Any) -> None:
+    await call(*args)
+
+
+def _synchronous(middleware: Middleware, hooks: tuple[Callable[..., Any], ...], function: F) -> F:
+    """
+    The *function* running the hooks synchronously, or one raising `TypeError` for coroutine hooks,
+    which would be called without being awaited.
+    """
+    if not any(inspect.iscoroutinefunction(hook) for hook in hooks):
+        return function
+
+    def coroutine_hooks(*args: Any) -> Any:
+        raise TypeError(
+            f"{middleware.__name__} has coroutine hooks, which are only awaited by `MessageFlow.dispatch_async()`."
+        )
+
+    return coroutine_hooks  # type: ignore
+
+
+def _stateless_stage(
+    before: Callable[[bytes, dict[str, str]], Any],
+    after: Callable[[bytes, dict[str, str], Exception | None], Any],
+    next_stage: Stage,
+) -> Stage:
+    def stage(payload: bytes, headers: dict[str, str], call: Callable[..., Any], *args: Any) -> None:
+        stage_error: Exception | None = None
+
+        try:
+            before(payload, headers)
+            next_stage(payload, headers, call, *args)
+        except Exception as error:
+            stage_error = error
+
+        after(payload, headers, stage_error)
+
+    return stage
+
+
+def _stateless_async_stage(
+    before: Callable[[bytes, dict[str, str]], Any],
+    after: Callable[[bytes, dict[str, str], Exception | None], Any],
+    next_stage: AsyncStage,
+) -> AsyncStage:
+    async def stage(payload: bytes, headers: dict[str, str], call: Callable[..., Any], *args: Any) -> None:
+        stage_error: Exception | None = None
+
+        try:
+            if inspect.isawaitable(result := before(payload, headers)):
+                await result
+            await next_stage(payload, headers, call, *args)
+        except Exception as error:
+            stage_error = error
+
+        if inspect.isawaitable(result := after(payload, headers, stage_error)):
+            await result
+
+    return stage
+
+
+def _stateless_async_context(
+    before: Callable[[bytes, dict[str, str]], Any],
+    after: Callable[[bytes, dict[str, str], Exception | None], Any],
+) -> Callable[[bytes, dict[str, str]], AsyncContextManager[None]]:
+    @asynccontextmanager
+    async def context(payload: bytes, headers: dict[str, str]) -> AsyncIterator[None]:
+        stage_error: Exception | None = None
+
+        try:
+            if inspect.isawaitable(result := before(payload, headers)):
+                await result
+            yield
+        except Exception as error:
+            stage_error = error
+
+        if inspect.isawaitable(result := after(payload, headers, stage_error)):
+            await result
+
+    return context
+
+
+def _instance_consume_context(
+    middleware: type[BaseMiddleware],
+) -> Callable[[bytes, dict[str, str]], ContextManager[None]]:
+    def context(payload: bytes, headers: dict[str, str]) -> ContextManager[None]:
+        return middleware(payload, headers).consume()
+
+    return context
+
+
+def _instance_async_consume_context(
+    middleware: type[BaseMiddleware],
+) -> Callable[[bytes, dict[str, str]], AsyncContextManager[None]]:
+    @asynccontextmanager
+    async def context(payload: bytes, headers: dict[str, str]) -> AsyncIterator[None]:
+        instance = middleware(payload, headers)
+        stage_error: Exception | None = None
+
+        try:
+            if inspect.isawaitable(result := instance.on_consume()):
+                await result
+            yield
+        except Exception as error:
+            stage_error = error
+
+        if inspect.isawaitable(result := instance.after_consume(stage_error)):
+            await result
+
+    return context
+
+
+def _instance_stage(
+    middleware: type[BaseMiddleware],
+    enter: Callable[[BaseMiddleware], ContextManager[None]],
+    next_stage: Stage,
+) -> Stage:
+    def stage(payload: bytes, headers: dict[str, str], call: Callable[..., Any], *args: Any) -> None:
+        with enter(middleware(payload, headers)):
+            next_stage(payload, headers, call, *args)
+
+    return stage
+
+
+def _instance_async_stage(
+    middleware: type[BaseMiddleware],
+    before: Callable[[BaseMiddleware], Any],
+    after: Callable[[BaseMiddleware, Exception | None], Any],
+    next_stage: AsyncStage,
+) -> AsyncStage:
+    async def stage(payload: bytes, headers: dict[str, str], call: Callable[..., Any], *args: Any) -> None:
+        instance = middleware(payload, headers)
+        stage_error: Exception | None = None
+
+        try:
+            if inspect.isawaitable(result := before(instance)):
+                await result
+            await next_stage(payload, headers, call, *args)
+        except Exception as error:
+            stage_error = error
+
+        if inspect.isawaitable(result := after(instance, stage_error)):
+            await result
+
+    return stage
@@ -0,0 +1,62 @@
+import logging
+import queue
+import threading
+from typing import Callable, final
+
+from ...utils import internal
+
+_STOP = object()
+
+
+@final
+@internal
+class OrderedWorkerPool:
+    """
+    Pool of worker threads, where messages with the same ordering key are
+    always processed by the same worker in the order they were submitted.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[bytes, dict[str, str]], None],
+        logger: logging.Logger,
+        *,
+        workers: int,
+        ordering_key: str,
+        queue_size: int,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("Number of workers should be positive.")
+
+        self._logger = logger
+
+        self._handler = handler
+        self._ordering_key = ordering_key
+        self._queues: list[queue.Queue] = [queue.Queue(maxsize=queue_size) for _ in range(workers)]
+        self._threads = [
+            threading.Thread(target=self._work, args=(worker_queue,), name=f"message-flow-worker-{number}", daemon=True)
+            for number, worker_queue in enumerate(self._queues)
+        ]
+
+    def start(self) -> None:
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, payload: bytes, headers: dict[str, str]) -> None:
+        key = headers.get(self._ordering_key)
+        self._queues[hash(str(key)) % len(self._queues)].put((payload, headers))
+
+    def shutdown(self) -> None:
+        for worker_queue in self._queues:
+            worker_queue.put(_STOP)
+
+        for thread in self._threads:
+            if thread.is_alive():
+                thread.join()
+
+    def _work(self, worker_queue: queue.Queue) -> None:
+        while (item := worker_queue.get()) is not _STOP:
+            try:
+                self._handler(*item)
+            except Exception as error:
+                self._logger.error("An error occurred while handling message", exc_info=error)
@@ -1,29 +1,83 @@
-from typing import final
+import inspect
+from typing import Iterable, final
 
+from ...channel import Compression
 from ...message import Message
 from ...utils import internal
-from ..messaging import MessageProducer
+from ..messaging import AsyncMessageProducer, MessageProducer
+from .compressor import Compressor
 from .routing_headers import RoutingHeaders
 
 
 @final
 @internal
 class Producer:
-    def __init__(self, message_producer: MessageProducer) -> None:
+    def __init__(
+        self, message_producer: MessageProducer | AsyncMessageProducer, compressor: Compressor | None = None
+    ) -> None:
         self._message_producer = message_producer
+        self._is_async = inspect.iscoroutinefunction(message_producer.send)
 
-    def send(self, channel: str, message: Message, reply_to_address: str | None = None) -> None:
-        message.add_routing_headers(self._make_routing_info(channel, message.message_id, reply_to_address))
+        self.compressor = compressor or Compressor()
 
-        self._message_producer.send(channel, message.payload, message.headers)
+    def send(
+        self,
+        channel: str,
+        message: Message,
+        reply_to_address: str | None = None,
+        content_type: str | None = None,
+        compression: Compression | None = None,
+    ) -> None:
+        if self._is_async:
+            raise RuntimeError("Asynchronous message producer can be used only with `dispatch_async()`.")
 
-    def _make_routing_info(self, channel: str, type: str, reply_to_address: str | None) -> dict[str, str]:
-        routing_info = {
-            RoutingHeaders.TYPE: type,
-            RoutingHeaders.ADDRESS: channel,
-        }
+        self._add_routing_headers(channel, message, reply_to_address, content_type)
 
-        if reply_to_address is not None:
-            routing_info[RoutingHeaders.REPLY_TO] = reply_to_address
+        self._message_producer.send(channel, self._compress(message, compression), message.headers)  # type: ignore
 
-        return routing_info
+    def send_many(
+        self,
+        channel: str,
+        messages: Iterable[Message],
+        reply_to_address: str | None = None,
+        content_type: str | None = None,
+        compression: Compression | None = None,
+    ) -> None:
+        if self._is_async:
+            raise RuntimeError("Asynchronous message producer can be used only with `dispatch_async()`.")
+
+        batch: list[tuple[bytes, dict[str, str] | None]] = []
+        for message in messages:
+            self._add_routing_headers(channel, message, reply_to_address, content_type)
+            batch.append((self._compress(message, compression), message.headers))
+
+        if (send_many := getattr(self._message_producer, "send_many", None)) is not None:
+            send_many(channel, batch)
+        else:
+            for payload, headers in batch:
+                self._message_producer.send(channel, payload, headers)  # type: ignore
+
+    def flush(self) -> None:
+        if (flush := getattr(self._message_producer, "flush", None)) is not None:
+            flush()
+
+    def _compress(self, message: Message, compression: Compression | None) -> bytes:
+        payload, encoding = self.compressor.compress(message.payload, compression)
+
+        if encoding is not None:
+            message.add_routing_headers({RoutingHeaders.CONTENT_ENCODING: encoding})
+        else:
+            message.headers.pop(RoutingHeaders.CONTENT_ENCODING, None)
+
+        return payload
+
+    @staticmethod
+    def _add_routing_headers(
+        channel: str, message: Message, reply_to_address: str | None, content_type: str | None
+    ) -> None:
+        if content_type is not None:
+            message.set_default_content_type(content_type)
+
+        message.add_routing_headers(
+            RoutingHeaders.make(channel, message.message_id, reply_to_address, message.content_type)
+        )
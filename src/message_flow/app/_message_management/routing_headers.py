@@ -1,3 +1,4 @@
+from ...message import Codecs
 from ...utils import internal
 
 
@@ -6,3 +7,20 @@ class RoutingHeaders:
     TYPE: str = "message-type"
     ADDRESS: str = "channel-address"
     REPLY_TO: str = "reply-to-address"
+    CONTENT_TYPE: str = Codecs.HEADER
+    CONTENT_ENCODING: str = "content-encoding"
+
+    @classmethod
+    def make(
+        cls, channel: str, type: str, reply_to_address: str | None = None, content_type: str = Codecs.DEFAULT
+    ) -> dict[str, str]:
+        routing_info = {
+            cls.TYPE: type,
+            cls.ADDRESS: channel,
+            cls.CONTENT_TYPE: content_type,
+        }
+
+        if reply_to_address is not None:
+            routing_info[cls.REPLY_TO] = reply_to_address
+
+        return routing_info
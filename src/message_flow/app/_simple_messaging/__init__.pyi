@@ -1,2 +1,4 @@
-from .simple_consumer import *
-from .simple_producer import *
+from .durability import Durability as Durability
+from .envelope import Envelope as Envelope
+from .simple_consumer import SimpleMessageConsumer as SimpleMessageConsumer
+from .simple_producer import SimpleMessageProducer as SimpleMessageProducer
@@ -0,0 +1,12 @@
+from enum import Enum
+from typing import final
+
+from ...utils import internal
+
+
+@final
+@internal
+class Durability(str, Enum):
+    NONE = "none"
+    BATCH = "batch"
+    MESSAGE = "message"
@@ -0,0 +1,137 @@
+import struct
+import zlib
+from typing import Any, BinaryIO, final
+
+from pydantic_core import from_json, to_json
+
+from ...utils import internal
+
+
+@final
+@internal
+class Envelope:
+    """
+    Binary record of the simple transport:
+
+    `magic (3) | version (1) | flags (1) | channel length (2) | headers length (4) | payload length (4) | crc32 (4)`
+    followed by the channel, the headers as length-prefixed key and JSON value pairs, and the payload.
+    The CRC covers the three sections and is only checked when the checksum flag is set.
+    """
+
+    MAGIC = b"\xffMF"
+    VERSION = 1
+    CHECKSUM = 0x01
+
+    PREFIX = struct.Struct("<3sBBHIII")
+    KEY = struct.Struct("<H")
+    VALUE = struct.Struct("<I")
+
+    @classmethod
+    def encode(cls, channel: str, payload: bytes, headers: dict[str, Any] | None, checksum: bool = False) -> bytes:
+        encoded_channel = channel.encode()
+        encoded_headers = b"".join(
+            cls.KEY.pack(len(key := name.encode())) + key + cls.VALUE.pack(len(data := to_json(value))) + data
+            for name, value in (headers or {}).items()
+        )
+
+        crc = zlib.crc32(payload, zlib.crc32(encoded_headers, zlib.crc32(encoded_channel))) if checksum else 0
+        prefix = cls.PREFIX.pack(
+            cls.MAGIC,
+            cls.VERSION,
+            cls.CHECKSUM if checksum else 0,
+            len(encoded_channel),
+            len(encoded_headers),
+            len(payload),
+            crc,
+        )
+
+        return b"".join((prefix, encoded_channel, encoded_headers, payload))
+
+    @classmethod
+    def read(cls, fp: BinaryIO) -> tuple[str, bytes, dict[str, Any]] | None:
+        """
+        Read the record at the current position, `None` if it is not completely written yet.
+        The payload is returned as read, without copying.
+        """
+        if len(prefix := fp.read(cls.PREFIX.size)) < cls.PREFIX.size:
+            return None
+
+        _, version, flags, channel_length, headers_length, payload_length, crc = cls.PREFIX.unpack(prefix)
+
+        if len(meta := fp.read(channel_length + headers_length)) < channel_length + headers_length:
+            return None
+
+        if len(payload := fp.read(payload_length)) < payload_length:
+            return None
+
+        if version != cls.VERSION:
+            raise ValueError(f"Unsupported envelope version {version}")
+
+        if flags & cls.CHECKSUM and zlib.crc32(payload, zlib.crc32(meta)) != crc:
+            raise ValueError("Envelope checksum mismatch")
+
+        view = memoryview(meta)
+
+        return str(view[:channel_length], "utf-8"), payload, cls._decode_headers(view[channel_length:])
+
+    @classmethod
+    def unpack_from(cls, buffer: memoryview, offset: int = 0) -> tuple[int, str, memoryview, dict[str, Any]] | None:
+        """
+        Parse the record at *offset* of the buffer, `None` if it is not completely written yet.
+        Returns the end offset of the record, the payload is a slice of the buffer.
+        """
+        if (end := cls.end_of(buffer, offset)) is None:
+            return None
+
+        _, version, flags, channel_length, headers_length, _, crc = cls.PREFIX.unpack_from(buffer, offset)
+        channel_start = offset + cls.PREFIX.size
+        headers_start = channel_start + channel_length
+        payload_start = headers_start + headers_length
+
+        if version != cls.VERSION:
+            raise ValueError(f"Unsupported envelope version {version}")
+
+        payload = buffer[payload_start:end]
+
+        if flags & cls.CHECKSUM and zlib.crc32(payload, zlib.crc32(buffer[channel_start:payload_start])) != crc:
+            raise ValueError("Envelope checksum mismatch")
+
+        return (
+            end,
+            str(buffer[channel_start:headers_start], "utf-8"),
+            payload,
+            cls._decode_headers(buffer[headers_start:payload_start]),
+        )
+
+    @classmethod
+    def end_of(cls, buffer: memoryview, offset: int = 0) -> int | None:
+        """
+        The end offset of the record at *offset* of the buffer, `None` if it is not completely written yet.
+        """
+        if len(buffer) - offset < cls.PREFIX.size:
+            return None
+
+        _, _, _, channel_length, headers_length, payload_length, _ = cls.PREFIX.unpack_from(buffer, offset)
+        end = offset + cls.PREFIX.size + channel_length + headers_length + payload_length
+
+        return end if end <= len(buffer) else None
+
+    @classmethod
+    def _decode_headers(cls, view: memoryview) -> dict[str, Any]:
+        headers = {}
+        offset = 0
+
+        while offset < len(view):
+            key, offset = cls._decode_field(view, offset, cls.KEY)
+            value, offset = cls._decode_field(view, offset, cls.VALUE)
+            headers[str(key, "utf-8")] = from_json(bytes(value))
+
+        return headers
+
+    @staticmethod
+    def _decode_field(view: memoryview, offset: int, length: struct.Struct) -> tuple[memoryview, int]:
+        start = offset + length.size
+        if start > len(view) or (end := start + length.unpack_from(view, offset)[0]) > len(view):
+            raise ValueError(f"Envelope header at {offset} overruns the headers section")
+
+        return view[start:end], end
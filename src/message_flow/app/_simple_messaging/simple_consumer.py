@@ -1,10 +1,13 @@
 import json
 import logging
+import mmap
+import os
 import time
 from typing import Callable, final
 
 from ...utils import internal
 from ..messaging import MessageConsumer
+from .envelope import Envelope
 
 
 @final
@@ -16,6 +19,10 @@ class SimpleMessageConsumer(MessageConsumer):
         file_path: str = "/tmp/message-flow-queue.txt",
         dry_run: bool = False,
         throw_error: bool = False,
+        commit_every: int = 100,
+        min_backoff: float = 0.001,
+        max_backoff: float = 1.0,
+        memory_map: bool = False,
     ) -> None:
         self._logger = logger
 
@@ -23,8 +30,18 @@ class SimpleMessageConsumer(MessageConsumer):
         self._throw_error = throw_error
         self.closed = False
 
-        self._fp = open(file_path, "a+")
-        self._router = {}
+        self._commit_every = commit_every
+        self._min_backoff = min_backoff
+        self._max_backoff = max_backoff
+        self._memory_map = memory_map
+
+        self._fp = open(file_path, "a+b")
+        self._offset_path = f"{file_path}.offset"
+        self._router: dict[str, Callable[[bytes, dict[str, str]], None]] = {}
+        self._view: memoryview | None = None
+
+        self._consuming = False
+        self._uncommitted = 0
 
         self._initialize()
 
@@ -35,55 +52,186 @@ class SimpleMessageConsumer(MessageConsumer):
     def start_consuming(self) -> None:
         self._logger.info("Start consuming")
 
-        while True:
-            if self._dry_run:
-                break
+        self._consuming = True
+        backoff = self._min_backoff
 
-            if self._throw_error:
-                raise RuntimeError("Test Error")
+        try:
+            while not self.closed:
+                if self._dry_run:
+                    break
 
-            message = self._get_message()
-            self._process_message(message)
+                if self._throw_error:
+                    raise RuntimeError("Test Error")
+
+                if self._drain():
+                    backoff = self._min_backoff
+                    continue
+
+                self._commit()
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+        finally:
+            self._consuming = False
+            if self.closed:
+                self._shutdown()
 
     def close(self) -> None:
         self.closed = True
-        self._fp.close()
 
-    def _initialize(self) -> None:
-        self._fp.seek(0, 2)
-        self._position = self._fp.tell()
+        if not self._consuming:
+            self._shutdown()
 
-    def _get_message(self) -> str | None:
-        return self._fp.readline() or None
+    def _initialize(self) -> None:
+        size = self._fp.seek(0, os.SEEK_END)
 
-    def _process_message(self, message: str | None) -> None:
         try:
+            with open(self._offset_path, "rb") as offset_file:
+                position = int(offset_file.read() or size)
+        except (FileNotFoundError, ValueError):
+            position = size
+
+        self._position = self._committed = position if position <= size else 0
+        self._fp.seek(self._position)
+
+    def _drain(self) -> int:
+        if self._memory_map:
+            return self._drain_mapped()
+
+        handled = 0
+
+        while not self.closed and (head := self._fp.peek(1)):
+            try:
+                if (message := self._read_message(head)) is None:
+                    self._fp.seek(self._position)
+                    break
+            except ValueError as error:
+                self._logger.warning("Skipped malformed message at offset %s: %s", self._position, error)
+            else:
+                self._process_message(*message)
+
+            self._advance(self._fp.tell())
+            handled += 1
+
+        return handled
+
+    def _drain_mapped(self) -> int:
+        if (view := self._mapped_view()) is None:
+            return 0
+
+        handled = 0
+
+        while not self.closed and self._position < len(view):
+            if (unpacked := self._unpack_message(view)) is None:
+                break
+
+            end, message = unpacked
             if message is not None:
-                self._handle_message(message)
+                self._process_message(*message)
+
+            self._advance(end)
+            handled += 1
+
+        return handled
+
+    def _mapped_view(self) -> memoryview | None:
+        size = os.fstat(self._fp.fileno()).st_size
+        if size <= self._position:
+            return None
+
+        if self._view is None or len(self._view) < size:
+            # The previous mapping stays alive for as long as handlers hold slices of it.
+            self._view = memoryview(mmap.mmap(self._fp.fileno(), size, access=mmap.ACCESS_READ))
 
-            self._logger.debug("Got message empty message. Start sleeping...")
-            time.sleep(1)
+        return self._view
+
+    def _unpack_message(self, view: memoryview) -> tuple[int, tuple[str, memoryview, dict[str, str]] | None] | None:
+        position = self._position
+
+        if view[position] == Envelope.MAGIC[0]:
+            try:
+                if (record := Envelope.unpack_from(view, position)) is None:
+                    return None
+            except ValueError as error:
+                self._logger.warning("Skipped malformed message at offset %s: %s", position, error)
+                return Envelope.end_of(view, position), None  # type: ignore[return-value]
+
+            end, *message = record
+            return end, tuple(message)  # type: ignore[return-value]
+
+        if (newline := view.obj.find(b"\n", position)) == -1:  # type: ignore[union-attr]
+            return None
+
+        try:
+            return newline + 1, self._parse_mapped_message(view, position, newline)
+        except ValueError as error:
+            self._logger.warning("Skipped malformed message at offset %s: %s", position, error)
+            return newline + 1, None
+
+    def _parse_mapped_message(self, view: memoryview, start: int, end: int) -> tuple[str, memoryview, dict[str, str]]:
+        mapped: mmap.mmap = view.obj  # type: ignore[assignment]
+
+        if end > start and view[end - 1] == ord("\r"):
+            end -= 1
+
+        first = mapped.find(b"\t", start, end)
+        second = mapped.find(b"\t", first + 1, end) if first != -1 else -1
+        if second == -1 or mapped.find(b"\t", second + 1, end) != -1:
+            raise ValueError("expected channel, payload and headers separated by tabs")
+
+        return str(view[start:first], "utf-8"), view[first + 1 : second], json.loads(mapped[second + 1 : end])
+
+    def _advance(self, position: int) -> None:
+        self._position = position
+
+        self._uncommitted += 1
+        if self._uncommitted >= self._commit_every:
+            self._commit()
+
+    def _read_message(self, head: bytes) -> tuple[str, bytes, dict[str, str]] | None:
+        if head[0] == Envelope.MAGIC[0]:
+            return Envelope.read(self._fp)
+
+        if not (line := self._fp.readline()).endswith(b"\n"):
+            return None
+
+        return self._parse_message(line)
+
+    def _process_message(self, channel: str, payload: bytes, headers: dict[str, str]) -> None:
+        try:
+            self._handle_message(channel, payload, headers)
         except Exception as error:
             self._logger.debug("An error occurred while consuming events", exc_info=error)
-        finally:
-            self._commit_message(message)
 
-    def _handle_message(self, message: str) -> None:
-        channel, payload, headers = self._parse_message(message)
+    def _handle_message(self, channel: str, payload: bytes, headers: dict[str, str]) -> None:
         self._logger.debug("Got message with payload %s and headers %s from channel %s", payload, headers, channel)
 
         if (handler := self._router.get(channel)) is None:
-            self._logger.warning(f"Received message for unknown channel {channel}")
+            self._logger.warning("Received message for unknown channel %s", channel)
             return
 
         handler(payload, headers)
 
-    def _parse_message(self, message: str) -> tuple[str, bytes, dict[str, str]]:
-        channel, payload, headers = message.strip().split("\t")
-        return channel, payload.encode(), json.loads(headers)
+    def _parse_message(self, message: bytes) -> tuple[str, bytes, dict[str, str]]:
+        channel, payload, headers = message.rstrip(b"\r\n").split(b"\t")
+        return channel.decode(), payload, json.loads(headers)
+
+    def _commit(self) -> None:
+        if self._position == self._committed:
+            return
+
+        temporary_path = f"{self._offset_path}.tmp"
+        with open(temporary_path, "wb") as offset_file:
+            offset_file.write(b"%d" % self._position)
+        os.replace(temporary_path, self._offset_path)
+
+        self._logger.debug("Committed %s messages up to offset %s.", self._uncommitted, self._position)
+        self._committed = self._position
+        self._uncommitted = 0
 
-    def _commit_message(self, message: str | None) -> None:
-        if message is not None:
-            self._position += len(message)
-            self._fp.seek(self._position)
-            self._logger.debug("Message %s is committed.", message)
+    def _shutdown(self) -> None:
+        if self._fp.closed:
+            return
+
+        self._commit()
+        self._view = None
+        self._fp.close()
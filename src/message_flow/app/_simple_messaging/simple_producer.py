@@ -1,25 +1,137 @@
-import json
 import logging
+import os
+import threading
+import time
 from typing import final
 
+from pydantic_core import to_json
+
 from ...utils import internal
 from ..messaging import MessageProducer
+from .durability import Durability
+from .envelope import Envelope
 
 
 @final
 @internal
 class SimpleMessageProducer(MessageProducer):
-    def __init__(self, logger: logging.Logger, file_path: str = "/tmp/message-flow-queue.txt") -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        file_path: str = "/tmp/message-flow-queue.txt",
+        durability: Durability = Durability.NONE,
+        sync_every: int = 1000,
+        sync_interval: float = 1.0,
+        binary: bool = True,
+        checksum: bool = False,
+    ) -> None:
         self._logger = logger
 
         self.closed = False
 
         self._file_path = file_path
+        self._durability = durability
+        self._sync_every = sync_every
+        self._sync_interval = sync_interval
+        self._binary = binary
+        self._checksum = checksum
+
+        self._condition = threading.Condition()
+        self._pending: list[bytes] = []
+        self._tickets: list[int] = []
+        self._enqueued = 0
+        self._written = 0
+        self._writing = False
+        self._errors: dict[int, OSError] = {}
+
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+    @property
+    def fd(self) -> int:
+        if not hasattr(self, "_fd"):
+            self._fd = os.open(self._file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
 
     def send(self, channel: str, payload: bytes, headers: dict[str, str] | None = None) -> None:
-        self._logger.debug(f"Send message to {channel}")
-        with open(self._file_path, "a+") as fp:
-            fp.write(f"{channel}\t{payload.decode()}\t{json.dumps(headers)}\n")
+        self._append([self._make_record(channel, payload, headers)])
+
+    def send_many(self, channel: str, messages: list[tuple[bytes, dict[str, str] | None]]) -> None:
+        self._logger.debug("Send %s messages to %s", len(messages), channel)
+        self._append([self._make_record(channel, payload, headers) for payload, headers in messages])
 
     def close(self) -> None:
-        self.closed = True
+        with self._condition:
+            while self._writing:
+                self._condition.wait()
+
+            if hasattr(self, "_fd"):
+                if self._unsynced:
+                    os.fsync(self._fd)
+                os.close(self._fd)
+                del self._fd
+
+            self.closed = True
+
+    def _make_record(self, channel: str, payload: bytes, headers: dict[str, str] | None) -> bytes:
+        if self._binary:
+            return Envelope.encode(channel, payload, headers, self._checksum)
+
+        return b"%s\t%s\t%s\n" % (channel.encode(), payload, to_json(headers))
+
+    def _append(self, records: list[bytes]) -> None:
+        """
+        Group commit: the first sender to find no write in progress appends the
+        records of every waiting sender with a single `O_APPEND` write (and
+        fsync, depending on durability), the others wait for it to finish.
+        """
+        with self._condition:
+            self._pending.extend(records)
+            self._enqueued += len(records)
+            ticket = self._enqueued
+            self._tickets.append(ticket)
+
+            while self._written < ticket:
+                if self._writing:
+                    self._condition.wait()
+                    continue
+
+                self._write_pending()
+
+            if (error := self._errors.pop(ticket, None)) is not None:
+                raise error
+
+    def _write_pending(self) -> None:
+        records, self._pending = self._pending, []
+        tickets, self._tickets = self._tickets, []
+
+        error: OSError | None = None
+
+        self._writing = True
+        self._condition.release()
+        try:
+            self._write(b"".join(records), len(records))
+        except OSError as write_error:
+            error = write_error
+        finally:
+            self._condition.acquire()
+            if error is not None:
+                self._errors.update(dict.fromkeys(tickets, error))
+            self._writing = False
+            self._written = tickets[-1]
+            self._condition.notify_all()
+
+    def _write(self, data: bytes, count: int) -> None:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(self.fd, view) :]
+
+        self._unsynced += count
+
+        if self._durability is Durability.MESSAGE or (
+            self._durability is Durability.BATCH
+            and (self._unsynced >= self._sync_every or time.monotonic() - self._synced_at >= self._sync_interval)
+        ):
+            os.fsync(self.fd)
+            self._unsynced = 0
+            self._synced_at = time.monotonic()
@@ -37,6 +37,16 @@ class BaseMiddleware:
             logger.info("Message with %s payload and %s headers produced.", self.payload, self.headers)
             return super().after_produce(error)
     ```
+
+    Hooks can also be defined as coroutines, such middlewares are awaited
+    when messages are dispatched with `MessageFlow.dispatch_async()`, and
+    raise `TypeError` when used synchronously, e.g. by `MessageFlow.dispatch()`.
+
+    ```python
+    class AsyncMiddleware(BaseMiddleware):
+        async def on_consume(self) -> None:
+            await audit_log.write(self.headers)
+    ```
     """
 
     def __init__(
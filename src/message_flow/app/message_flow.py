@@ -1,21 +1,25 @@
-import json
+import asyncio
+import inspect
 import logging
 import warnings
-from typing import Annotated, Callable, final
+from datetime import datetime
+from typing import Annotated, Awaitable, Callable, Iterable, final
 
 from typing_extensions import Doc, deprecated
 
-from ..channel import Channel
+from ..channel import Channel, Compression, CompressionStats
 from ..message import Message
 from ..utils import external, logger
 from ._fast_api import FastAPI
-from ._internal import AsyncAPIStudioPage, Channels, Info, MessageFlowSchema
-from ._message_management import Dispatcher, Producer
+from ._internal import AsyncAPISchema, Channels, Info, MessageFlowSchema
+from ._message_management import AsyncDispatcher, AsyncProducer, Dispatcher, Producer
 from ._simple_messaging import SimpleMessageConsumer, SimpleMessageProducer
 from .base_middleware import BaseMiddleware
-from .messaging import MessageConsumer, MessageProducer
+from .messaging import AsyncMessageConsumer, AsyncMessageProducer, MessageConsumer, MessageProducer
+from .stateless_middleware import StatelessMiddleware
 
-MessageHandler = Callable[[Message], Message | None]
+MessageHandler = Callable[[Message], Message | None | Awaitable[Message | None]]
+Route = tuple[str, str | None, str | None, Compression | None]
 
 
 @final
@@ -63,11 +67,13 @@ class MessageFlow:
             ),
         ] = None,
         message_producer: Annotated[
-            MessageProducer | None,
+            MessageProducer | AsyncMessageProducer | None,
             Doc(
                 """
                 The message producer to be used for messages producing.
 
+                **Note:** `AsyncMessageProducer` can be used only with `dispatch_async()`.
+
                 **Example**
 
                 ```python
@@ -79,11 +85,13 @@ class MessageFlow:
             ),
         ] = None,
         message_consumer: Annotated[
-            MessageConsumer | None,
+            MessageConsumer | AsyncMessageConsumer | None,
             Doc(
                 """
                 The message consumer to be used for messages consuming.
 
+                **Note:** `AsyncMessageConsumer` is dispatched with `dispatch_async()`.
+
                 **Example**
 
                 ```python
@@ -182,6 +190,7 @@ class MessageFlow:
         self.version = version
 
         self._channels = Channels(channels=channels)
+        self._async_api_schema: AsyncAPISchema | None = None
         self._message_producer = message_producer or SimpleMessageProducer(self._logger)
         self._message_consumer = message_consumer or SimpleMessageConsumer(self._logger)
 
@@ -191,10 +200,41 @@ class MessageFlow:
             self._producer = Producer(self._message_producer)
         return self._producer
 
+    @property
+    def async_api_schema(self) -> AsyncAPISchema:
+        """
+        Serialized AsyncAPI schema with its SHA-256 hash, rebuilt only when channels, operations or messages change.
+        """
+        revision = (self._channels.revision, self.asyncapi_version, self.title, self.version)
+
+        if self._async_api_schema is None or self._async_api_schema.revision != revision:
+            schema = MessageFlowSchema(
+                asyncapi=self.asyncapi_version,
+                info=Info(title=self.title, version=self.version),
+                channels=self._channels.channels_schema,
+                operations=self._channels.operations_schema,
+                components=self._channels.components,
+            )
+            self._async_api_schema = AsyncAPISchema(schema, revision)
+
+        return self._async_api_schema
+
+    @property
+    def compression_stats(self) -> CompressionStats:
+        """
+        Counters of payload compression on sending and decompression on dispatching.
+        """
+        return self.producer.compressor.stats
+
     @property
     def dispatcher(self) -> Dispatcher:
         if not hasattr(self, "_dispatcher"):
-            self._dispatcher = Dispatcher(self._channels, self._message_consumer, self.producer, self._logger)
+            self._dispatcher = Dispatcher(
+                self._channels,
+                self._message_consumer,  # type: ignore
+                self.producer,
+                self._logger,
+            )
         return self._dispatcher
 
     def add_channel(self, channel: Annotated[Channel, Doc("The channel to add.")]) -> None:
@@ -270,6 +310,8 @@ class MessageFlow:
         self.producer.send(
             channel=channel.address if channel is not None else channel_address,  # type: ignore
             message=message,
+            content_type=channel.content_type if channel is not None else None,
+            compression=channel.compression if channel is not None else None,
         )
 
     def send(
@@ -362,12 +404,162 @@ class MessageFlow:
             channel=channel.address if channel is not None else channel_address,  # type: ignore
             message=message,
             reply_to_address=operation.reply.channel if operation is not None else reply_to_address,
+            content_type=channel.content_type if channel is not None else None,
+            compression=channel.compression if channel is not None else None,
         )
 
+    def publish_many(
+        self,
+        messages: Annotated[Iterable[Message], Doc("The messages to publish.")],
+        *,
+        channel_address: Annotated[
+            str | None,
+            Doc(
+                """
+                The address to which channel the messages should be published.
+
+                **Note**: Has lower priority than added channel.
+                """
+            ),
+        ] = None,
+        batch_size: Annotated[
+            int,
+            Doc("The maximum number of messages handed over to the message producer at once."),
+        ] = 1000,
+    ) -> None:
+        """
+        Publish `Messages` to the added `Channels` or to the specified *channel address*.
+
+        The `Channel` is resolved once per `Message` type and messages are handed
+        over to the message producer in batches, preserving the order per `Channel`.
+
+        **Example**
+
+        ```python title="Publishing messages in bulk"
+        from message_flow import MessageFlow
+
+        from .orders import order_channel, OrderCreated
+
+        app = MessageFlow()
+
+        app.add_channel(order_channel)
+        app.publish_many(OrderCreated(order_id=order_id) for order_id in order_ids)
+        ```
+
+        Raises:
+            RuntimeError: Raised when channel is not found for given message
+                and channel address is not provided explicitly.
+        """
+        routes: dict[type[Message], Route] = {}
+
+        def route(message: Message) -> Route:
+            if (address := routes.get(message.__class__)) is None:
+                if (channel := self._channels.channel_of(message)) is None and channel_address is None:
+                    raise RuntimeError(f"Could not find channel for {message}")
+
+                address = routes[message.__class__] = (
+                    channel.address if channel is not None else channel_address,  # type: ignore
+                    None,
+                    channel.content_type if channel is not None else None,
+                    channel.compression if channel is not None else None,
+                )
+
+            return address
+
+        self._send_many(messages, route, batch_size)
+
+    def send_many(
+        self,
+        messages: Annotated[Iterable[Message], Doc("The messages to send.")],
+        *,
+        channel_address: Annotated[
+            str | None,
+            Doc(
+                """
+                The address to which channel the messages should be sent.
+
+                **Note**: Has lower priority than added channel.
+                """
+            ),
+        ] = None,
+        reply_to_address: Annotated[
+            str | None,
+            Doc(
+                """
+                The reply address to which channel the messages should be sent by consumer.
+
+                **Note**: Has lower priority than added operation's reply channel.
+                """
+            ),
+        ] = None,
+        batch_size: Annotated[
+            int,
+            Doc("The maximum number of messages handed over to the message producer at once."),
+        ] = 1000,
+    ) -> None:
+        """
+        Send `Messages` to the added `Channels` or to the specified *channel address*.
+
+        The `Channel` and reply address are resolved once per `Message` type and messages
+        are handed over to the message producer in batches, preserving the order per `Channel`.
+
+        **Example**
+
+        ```python title="Sending messages in bulk"
+        from message_flow import MessageFlow
+
+        from .orders import order_channel, CreateOrder
+
+        app = MessageFlow()
+
+        app.add_channel(order_channel)
+        app.send_many(CreateOrder(product_id=product_id, amount=1) for product_id in product_ids)
+        ```
+
+        Raises:
+            RuntimeError: Raised when channel is not found for given message
+                and channel address is not provided explicitly.
+        """
+        routes: dict[type[Message], Route] = {}
+
+        def route(message: Message) -> Route:
+            if (address := routes.get(message.__class__)) is None:
+                channel, operation = self._channels.channel_and_operation_of(message) or (None, None)
+
+                if channel is None and channel_address is None:
+                    raise RuntimeError(f"Could not find channel for {message}")
+
+                address = routes[message.__class__] = (
+                    channel.address if channel is not None else channel_address,  # type: ignore
+                    operation.reply.channel if operation is not None else reply_to_address,
+                    channel.content_type if channel is not None else None,
+                    channel.compression if channel is not None else None,
+                )
+
+            return address
+
+        self._send_many(messages, route, batch_size)
+
     def subscribe(
         self,
         address: Annotated[str, Doc("The `Channel` address.")],
         message: Annotated[type[Message], Doc("The type of `Message`s that will be consumed on the channel.")],
+        *,
+        batch_size: Annotated[
+            int | None,
+            Doc(
+                """
+                The maximum number of `Messages` delivered to the handler at once.
+
+                When provided, the handler receives a list of `Messages` and its
+                result is not sent as a reply.
+                """
+            ),
+        ] = None,
+        batch_wait: Annotated[
+            float,
+            Doc("The maximum number of seconds to wait for the batch to be filled."),
+        ] = 1.0,
     ) -> Callable[[MessageHandler], MessageHandler]:
         """
         Subscribe to `Message` from the `Channel` with specified *address*.
@@ -389,13 +581,78 @@ class MessageFlow:
             ...
         ```
 
+        Handlers can also be defined as coroutines.
+
+        ```python title="Subscribing with asynchronous handler"
+        @app.subscribe(address="orders", message=OrderCreated)
+        async def handle_order_created(event: OrderCreated) -> None:
+            ...
+        ```
+
+        ```python title="Subscribing to batches of messages"
+        @app.subscribe(address="orders", message=OrderCreated, batch_size=100, batch_wait=0.5)
+        def handle_orders_created(events: list[OrderCreated]) -> None:
+            ...
+        ```
+
         Returns:
             Callable[[MessageHandler], MessageHandler]: "Decorated handler used for `Message` processing."
         """
         channel = self._channels.find_or_create_for(address)
-        return channel.subscribe(message)
+        return channel.subscribe(message, batch_size=batch_size, batch_wait=batch_wait)
+
+    def dispatch(
+        self,
+        threads: Annotated[
+            int,
+            Doc(
+                """
+                The number of worker threads used to process `Messages` concurrently.
+
+                `Messages` with the same *ordering key* are always processed in order
+                by the same thread, while `Messages` with different keys are processed
+                concurrently.
+                """
+            ),
+        ] = 1,
+        ordering_key: Annotated[
+            str | None,
+            Doc(
+                """
+                The header used to select the worker thread for the `Message`, e.g. the
+                `CorrelationId` location or a `tenant_id` `Header`.
+
+                **Note:** When not provided, `Messages` are ordered per `Channel`.
+                """
+            ),
+        ] = None,
+        queue_size: Annotated[
+            int,
+            Doc("The maximum number of `Messages` waiting for each worker thread."),
+        ] = 1000,
+        max_in_flight: Annotated[
+            int | None,
+            Doc(
+                """
+                The maximum number of consumed `Messages` not yet processed by handlers.
 
-    def dispatch(self) -> None:
+                When the limit is reached, consumer is blocked until one of `Messages` is processed.
+                """
+            ),
+        ] = None,
+        max_in_flight_bytes: Annotated[
+            int | None,
+            Doc("The maximum total size of consumed `Message` payloads not yet processed by handlers."),
+        ] = None,
+        from_offset: Annotated[
+            int | None,
+            Doc("The offset from which the consumer replays `Messages`, when it supports seeking."),
+        ] = None,
+        from_time: Annotated[
+            datetime | None,
+            Doc("The time from which the consumer replays `Messages`, when it supports seeking."),
+        ] = None,
+    ) -> None:
         """
         Initiate the dispatch of `Messages` on the added `Channels`.
 
@@ -414,18 +671,118 @@ class MessageFlow:
 
         app.dispatch()
         ```
+
+        ```python title="Starting dispatching with key-ordered worker threads"
+        app.dispatch(threads=8, ordering_key="tenant_id")
+        ```
+
+        ```python title="Starting dispatching with backpressure"
+        app.dispatch(threads=8, max_in_flight=500, max_in_flight_bytes=16 * 1024 * 1024)
+        ```
+
+        ```python title="Replaying messages from a point in time"
+        app.dispatch(from_time=datetime(2024, 5, 1, tzinfo=timezone.utc))
+        ```
+
+        **Note:** `AsyncMessageConsumer` is dispatched on a new event loop using `dispatch_async()`.
+
+        Raises:
+            NotImplementedError: Raised when replaying with a message consumer that does not support seeking.
         """
+        if from_offset is not None or from_time is not None:
+            if (seek := getattr(self._message_consumer, "seek", None)) is None:
+                raise NotImplementedError("The message consumer does not support seeking.")
+
+            seek(offset=from_offset, timestamp=from_time)
+
+        if inspect.iscoroutinefunction(self._message_consumer.start_consuming):
+            return asyncio.run(self.dispatch_async(max_in_flight or 100, max_in_flight_bytes))
+
         try:
-            self.dispatcher.initialize()
+            self.dispatcher.initialize(
+                threads=threads,
+                ordering_key=ordering_key,
+                queue_size=queue_size,
+                max_in_flight=max_in_flight,
+                max_in_flight_bytes=max_in_flight_bytes,
+            )
             self._logger.info("Message Flow app starting...")
             self._message_consumer.start_consuming()
         except Exception as error:
             self._logger.error("An error occurred while dispatching events", exc_info=error)
             raise
         finally:
+            self.dispatcher.shutdown()
             self._message_consumer.close()
+            self.producer.flush()
             self._message_producer.close()
 
+    async def dispatch_async(
+        self,
+        max_in_flight: Annotated[
+            int,
+            Doc("The maximum number of `Messages` processed concurrently on the event loop."),
+        ] = 100,
+        max_in_flight_bytes: Annotated[
+            int | None,
+            Doc("The maximum total size of `Message` payloads processed concurrently on the event loop."),
+        ] = None,
+    ) -> None:
+        """
+        Initiate the dispatch of `Messages` on the added `Channels` using `AsyncMessageConsumer`.
+
+        Coroutine handlers are awaited on the running event loop, regular handlers
+        are offloaded to the default executor. When *max in flight* `Messages` or
+        *max in flight bytes* are being processed, consumer waits until one of them
+        is completed.
+
+        **Example**
+
+        ```python title="Starting asynchronous dispatching"
+        import asyncio
+
+        from message_flow import MessageFlow
+
+        from .orders import OrderCreated
+
+        app = MessageFlow(message_consumer=AsyncRabbitMQConsumer(...))
+
+        @app.subscribe(address="orders", message=OrderCreated)
+        async def handle_order_created(event: OrderCreated) -> None:
+            ...
+
+        asyncio.run(app.dispatch_async(max_in_flight=50))
+        ```
+
+        Raises:
+            RuntimeError: Raised when the message consumer is not asynchronous.
+        """
+        if not inspect.iscoroutinefunction(self._message_consumer.start_consuming):
+            raise RuntimeError("Asynchronous dispatching requires `AsyncMessageConsumer`.")
+
+        producer = AsyncProducer(self._message_producer, self.producer.compressor)
+        dispatcher = AsyncDispatcher(
+            self._channels,
+            self._message_consumer,  # type: ignore
+            producer,
+            self._logger,
+            self.dispatcher.middlewares,
+            max_in_flight,
+            max_in_flight_bytes,
+        )
+
+        try:
+            dispatcher.initialize()
+            self._logger.info("Message Flow app starting...")
+            await self._message_consumer.start_consuming()  # type: ignore
+            await dispatcher.drain()
+        except Exception as error:
+            self._logger.error("An error occurred while dispatching events", exc_info=error)
+            raise
+        finally:
+            await self._message_consumer.close()  # type: ignore
+            await producer.close()
+
     def make_async_api_schema(self) -> str:
         """
         Generate AsyncAPI schema for the specified `Channels`, `Operations` and `Messages`.
@@ -449,15 +806,7 @@ class MessageFlow:
         Returns:
             str: Generated AsyncAPI schema.
         """
-        schema = MessageFlowSchema(
-            asyncapi=self.asyncapi_version,
-            info=Info(title=self.title, version=self.version),
-            channels=self._channels.channels_schema,
-            operations=self._channels.operations_schema,
-            components=self._channels.components,
-        )
-
-        return json.dumps(schema)
+        return self.async_api_schema.text
 
     def generate_docs_page(
         self,
@@ -492,17 +841,28 @@ class MessageFlow:
         Returns:
             str: Generated AsyncAPI Studio page.
         """
-        return AsyncAPIStudioPage(
-            schema=self.make_async_api_schema(),
-            title=title,
-            sidebar=sidebar,
-            info=info,
-            servers=servers,
-            operations=operations,
-            messages=messages,
-            schemas=schemas,
-            errors=errors,
-        ).generate()
+        from ._internal import AsyncAPIStudioPage
+
+        schema = self.async_api_schema
+        options = (title, sidebar, info, servers, operations, messages, schemas, errors)
+
+        if (page := schema.page(*options)) is not None:
+            return page
+
+        return schema.add_page(
+            AsyncAPIStudioPage(
+                schema=schema.text,
+                title=title,
+                sidebar=sidebar,
+                info=info,
+                servers=servers,
+                operations=operations,
+                messages=messages,
+                schemas=schemas,
+                errors=errors,
+            ).generate(),
+            *options,
+        )
 
     def set_logging_level(self, level: Annotated[int, Doc("Logging level to set.")]) -> None:
         """
@@ -551,19 +911,22 @@ class MessageFlow:
             warnings.warn("Please use this method only with FastAPI installed.")
             return
 
-        documentation_page = self.generate_docs_page()
-
         async def async_api_docs_html(req: Request) -> HTMLResponse:
-            return HTMLResponse(documentation_page)
+            return HTMLResponse(self.generate_docs_page())
 
         fast_api.add_route(documentation_url, async_api_docs_html, include_in_schema=False)
 
     def add_middleware(
-        self, middleware: Annotated[type[BaseMiddleware], Doc("Message processing Middleware.")]
+        self,
+        middleware: Annotated[type[BaseMiddleware] | type[StatelessMiddleware], Doc("Message processing Middleware.")],
     ) -> None:
         """
         Add Middleware.
 
+        Middlewares are compiled into a chain of hook calls when dispatching starts,
+        `StatelessMiddleware` hooks are called without creating objects per `Message`.
+        Middlewares with coroutine hooks are supported by `dispatch_async()`.
+
         **Example**
 
         ```python title="Adding processing Middleware"
@@ -596,3 +959,23 @@ class MessageFlow:
         ```
         """
         self.dispatcher.add_middleware(middleware=middleware)
+
+    def _send_many(
+        self,
+        messages: Iterable[Message],
+        route: Callable[[Message], Route],
+        batch_size: int,
+    ) -> None:
+        batches: dict[Route, list[Message]] = {}
+
+        for message in messages:
+            batch = batches.setdefault(address := route(message), [])
+            batch.append(message)
+
+            if len(batch) >= batch_size:
+                self.producer.send_many(address[0], batch, *address[1:])
+                batch.clear()
+
+        for (channel, *options), batch in batches.items():
+            if batch:
+                self.producer.send_many(channel, batch, *options)
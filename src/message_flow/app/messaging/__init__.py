@@ -1,3 +1,14 @@
-from ...utils import init_package
+from ...utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "AsyncMessageConsumer": "async_consumer",
+    "AsyncMessageProducer": "async_producer",
+    "BufferedMessageProducer": "buffered_producer",
+    "LogMessageConsumer": "log_consumer",
+    "LogMessageProducer": "log_producer",
+    "MessageConsumer": "consumer",
+    "MessageProducer": "producer",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
@@ -1,2 +1,7 @@
-from .consumer import *
-from .producer import *
+from .async_consumer import AsyncMessageConsumer as AsyncMessageConsumer
+from .async_producer import AsyncMessageProducer as AsyncMessageProducer
+from .buffered_producer import BufferedMessageProducer as BufferedMessageProducer
+from .consumer import MessageConsumer as MessageConsumer
+from .log_consumer import LogMessageConsumer as LogMessageConsumer
+from .log_producer import LogMessageProducer as LogMessageProducer
+from .producer import MessageProducer as MessageProducer
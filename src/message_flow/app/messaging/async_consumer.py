@@ -0,0 +1,57 @@
+import abc
+from typing import Annotated, Awaitable, Callable, Protocol
+
+from typing_extensions import Doc
+
+from ...utils import external
+
+
+@external
+class AsyncMessageConsumer(Protocol):
+    """
+    Interface for asynchronous message consumers used to integrate various messaging
+    technologies into the Message Flow running on an event loop.
+    """
+
+    @abc.abstractmethod
+    def subscribe(
+        self,
+        channels: Annotated[set[str], Doc("The set of channels to which the consumer should subscribe.")],
+        handler: Annotated[
+            Callable[[bytes, dict[str, str]], Awaitable[None]],
+            Doc("The coroutine function utilized for processing messages from specified channels."),
+        ],
+    ) -> None:
+        """
+        Subscribe the message consumer to the specified channels, and a handler
+        will be awaited to process the consumed messages.
+        """
+        pass
+
+    def set_prefetch(
+        self,
+        max_messages: Annotated[int | None, Doc("The maximum number of unacknowledged messages to be delivered.")],
+        max_bytes: Annotated[int | None, Doc("The maximum size of unacknowledged messages to be delivered.")],
+    ) -> None:
+        """
+        Limit the number of messages the broker pushes ahead of processing,
+        e.g. a prefetch count or a fetch size, so that the dispatcher's
+        in-flight limits are mirrored on the broker side.
+
+        **Note:** Optional, the hint is ignored by default.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def start_consuming(self) -> None:
+        """
+        Start consuming messages from the specified channels.
+        """
+        pass
+
+    @abc.abstractmethod
+    async def close(self) -> None:
+        """
+        Free allocated resources.
+        """
+        pass
@@ -0,0 +1,161 @@
+import threading
+import time
+from typing import Annotated, Callable, final
+
+from typing_extensions import Doc
+
+from ...utils import external, logger
+from .producer import MessageProducer
+
+
+@final
+@external
+class BufferedMessageProducer(MessageProducer):
+    """
+    Message producer that accumulates outgoing messages per channel and hands
+    them over to the wrapped message producer in batches.
+
+    A channel buffer is flushed when it reaches *max messages* or *max bytes*,
+    when its oldest message is older than *linger* seconds, on `flush()` and on `close()`.
+
+    **Example**
+
+    ```python
+    from message_flow import BufferedMessageProducer, MessageFlow
+
+    app = MessageFlow(
+        message_producer=BufferedMessageProducer(RabbitMQProducer(...), linger=0.01),
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        message_producer: Annotated[MessageProducer, Doc("The message producer used to send batches.")],
+        *,
+        max_messages: Annotated[int, Doc("The maximum number of buffered messages per channel.")] = 1000,
+        max_bytes: Annotated[int, Doc("The maximum size of buffered payloads per channel.")] = 1024 * 1024,
+        linger: Annotated[float, Doc("The maximum number of seconds messages stay buffered.")] = 0.005,
+    ) -> None:
+        self.closed = False
+
+        self._message_producer = message_producer
+        self._max_messages = max_messages
+        self._max_bytes = max_bytes
+        self._linger = linger
+
+        self._condition = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._buffers: dict[str, list[tuple[bytes, dict[str, str] | None]]] = {}
+        self._sizes: dict[str, int] = {}
+        self._created_at: dict[str, float] = {}
+
+        self._stopped = False
+        self._flusher: threading.Thread | None = None
+
+    def send(
+        self,
+        channel: Annotated[str, Doc("The channel to which the message will be sent.")],
+        payload: Annotated[bytes, Doc("The message payload.")],
+        headers: Annotated[dict[str, str] | None, Doc("The message headers.")] = None,
+    ) -> None:
+        """
+        Buffer the message payload and headers for the specified channel.
+        """
+        self.send_many(channel, [(payload, headers)])
+
+    def send_many(
+        self,
+        channel: Annotated[str, Doc("The channel to which the messages will be sent.")],
+        messages: Annotated[
+            list[tuple[bytes, dict[str, str] | None]],
+            Doc("The list of message payloads and headers."),
+        ],
+    ) -> None:
+        """
+        Buffer the batch of message payloads and headers for the specified channel.
+        """
+        with self._condition:
+            if self.closed:
+                raise RuntimeError("Message producer is closed.")
+
+            if (buffer := self._buffers.get(channel)) is None:
+                buffer = self._buffers[channel] = []
+                self._sizes[channel] = 0
+                self._created_at[channel] = time.monotonic()
+                self._condition.notify()
+
+            buffer.extend(messages)
+            self._sizes[channel] += sum(len(payload) for payload, _ in messages)
+
+            full = len(buffer) >= self._max_messages or self._sizes[channel] >= self._max_bytes
+
+            self._start_flusher()
+
+        if full:
+            self._flush(lambda buffered: buffered == channel)
+
+    def flush(self) -> None:
+        """
+        Send all buffered messages.
+        """
+        self._flush(lambda _: True)
+
+    def close(self) -> None:
+        """
+        Send all buffered messages and free allocated resources.
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+        if self._flusher is not None:
+            self._flusher.join()
+
+        self._flush(lambda _: True, close=True)
+
+        self._message_producer.close()
+
+    def _start_flusher(self) -> None:
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._flush_lingering, name="message-flow-flusher", daemon=True)
+            self._flusher.start()
+
+    def _flush_lingering(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._stopped or self._created_at)
+                if self._stopped:
+                    return
+
+                if (timeout := min(self._created_at.values()) + self._linger - time.monotonic()) > 0:
+                    self._condition.wait(timeout)
+                    continue
+
+            try:
+                self._flush(lambda channel: self._created_at[channel] <= time.monotonic() - self._linger)
+            except Exception as error:
+                logger.error("An error occurred while flushing buffered messages", exc_info=error)
+
+    def _flush(self, selected: Callable[[str], bool], close: bool = False) -> None:
+        # Buffers are taken under the condition, so publishers are not blocked while they are sent,
+        # and sent under the send lock, so batches of a channel are handed over in order.
+        with self._send_lock:
+            with self._condition:
+                if close:
+                    self.closed = True
+
+                buffers = [(channel, self._take(channel)) for channel in list(self._buffers) if selected(channel)]
+
+            for channel, buffer in buffers:
+                if (send_many := getattr(self._message_producer, "send_many", None)) is not None:
+                    send_many(channel, buffer)
+                else:
+                    for payload, headers in buffer:
+                        self._message_producer.send(channel, payload, headers)
+
+    def _take(self, channel: str) -> list[tuple[bytes, dict[str, str] | None]]:
+        del self._sizes[channel]
+        del self._created_at[channel]
+
+        return self._buffers.pop(channel)
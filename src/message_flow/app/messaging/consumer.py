@@ -1,4 +1,5 @@
 import abc
+from datetime import datetime
 from typing import Annotated, Callable, Protocol
 
 from typing_extensions import Doc
@@ -13,6 +14,21 @@ class MessageConsumer(Protocol):
     into the Message Flow.
     """
 
+    fork_safe: Annotated[
+        bool,
+        Doc(
+            """
+            Whether the consumer can be shared by dispatcher processes forked after it is created,
+            e.g. because it connects in `start_consuming` and the broker balances a consumer group
+            between the processes, or it consumes the share of the worker set by `set_worker`.
+
+            **Note:** Dispatching with several workers is refused for other consumers, as forked
+            processes would share their file offsets and consume the same messages. Of the bundled
+            consumers, only `LogMessageConsumer` is fork-safe.
+            """
+        ),
+    ] = False
+
     @abc.abstractmethod
     def subscribe(
         self,
@@ -28,6 +44,66 @@ class MessageConsumer(Protocol):
         """
         pass
 
+    def subscribe_batch(
+        self,
+        channels: Annotated[set[str], Doc("The set of channels to which the consumer should subscribe.")],
+        handler: Annotated[
+            Callable[[list[tuple[bytes, dict[str, str]]]], None],
+            Doc("The handler utilized for processing batches of messages from specified channels."),
+        ],
+        max_size: Annotated[int, Doc("The maximum number of messages in the batch.")],
+        max_wait: Annotated[float, Doc("The maximum number of seconds to wait for the batch to be filled.")],
+    ) -> None:
+        """
+        Subscribe the message consumer to the specified channels, and a handler
+        will be used to process batches of the consumed messages. Messages of the
+        batch should be committed after the handler returns.
+
+        **Note:** Optional, consumers without native batching get messages
+        batched by the dispatcher.
+        """
+        raise NotImplementedError
+
+    def set_prefetch(
+        self,
+        max_messages: Annotated[int | None, Doc("The maximum number of unacknowledged messages to be delivered.")],
+        max_bytes: Annotated[int | None, Doc("The maximum size of unacknowledged messages to be delivered.")],
+    ) -> None:
+        """
+        Limit the number of messages the broker pushes ahead of processing,
+        e.g. a prefetch count or a fetch size, so that the dispatcher's
+        in-flight limits are mirrored on the broker side.
+
+        **Note:** Optional, the hint is ignored by default.
+        """
+        pass
+
+    def set_worker(
+        self,
+        index: Annotated[int, Doc("The index of the forked dispatcher process, from 0.")],
+        workers: Annotated[int, Doc("The number of forked dispatcher processes.")],
+    ) -> None:
+        """
+        Restrict the consumer to its share of the subscribed channels in the dispatcher
+        process *index* of *workers*, called in the forked process before consuming starts.
+
+        **Note:** Optional, ignored by default, e.g. when the broker balances a consumer group.
+        """
+        pass
+
+    def seek(
+        self,
+        offset: Annotated[int | None, Doc("The offset of the first message to consume.")] = None,
+        timestamp: Annotated[datetime | None, Doc("The time from which to consume messages.")] = None,
+    ) -> None:
+        """
+        Reposition the consumer before consuming starts, e.g. to replay or backfill
+        messages from an offset or a point in time.
+
+        **Note:** Optional, consumers without seeking raise `NotImplementedError`.
+        """
+        raise NotImplementedError
+
     @abc.abstractmethod
     def start_consuming(self) -> None:
         """
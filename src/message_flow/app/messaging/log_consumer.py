@@ -0,0 +1,196 @@
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Annotated, Callable, Literal, final
+
+from typing_extensions import Doc
+
+from ...utils import external, logger
+from .._log_messaging import PartitionLog, PartitionReader
+from .consumer import MessageConsumer
+
+
+@final
+@external
+class LogMessageConsumer(MessageConsumer):
+    """
+    Message consumer reading the local log written by `LogMessageProducer`.
+
+    Every partition of the subscribed channels is consumed, partitions appearing
+    later are picked up while idle. The position of the consumer *group* is kept
+    in an offset file per partition, committed every *commit every* messages, when
+    the log is idle and on close, so a restarted consumer resumes where it stopped.
+    Without a committed offset, consumption starts from the *offset reset* end of the log.
+
+    The consumer is fork-safe: the log is opened when consuming starts, and dispatcher
+    processes forked by `--workers` share the partitions of the group between them.
+
+    **Example**
+
+    ```python
+    from message_flow import LogMessageConsumer, MessageFlow
+
+    app = MessageFlow(message_consumer=LogMessageConsumer("/var/lib/orders", group="billing"))
+    ```
+    """
+
+    fork_safe = True
+
+    def __init__(
+        self,
+        directory: Annotated[str | Path, Doc("The root directory of the log.")],
+        *,
+        group: Annotated[str, Doc("The consumer group whose offsets are tracked.")] = "default",
+        offset_reset: Annotated[
+            Literal["earliest", "latest"], Doc("Where to start when the group has no committed offset.")
+        ] = "earliest",
+        commit_every: Annotated[int, Doc("The number of messages per partition between commits.")] = 100,
+        max_poll: Annotated[int, Doc("The number of messages read from a partition before moving on.")] = 500,
+        min_backoff: Annotated[float, Doc("The first sleep in seconds when the log is idle.")] = 0.001,
+        max_backoff: Annotated[float, Doc("The longest sleep in seconds when the log is idle.")] = 0.5,
+        logger: Annotated[logging.Logger, Doc("The logger of the consumer.")] = logger,
+    ) -> None:
+        self._logger = logger
+
+        self.closed = False
+
+        self._directory = Path(directory)
+        self._group = group
+        self._offset_reset: Literal["earliest", "latest"] = offset_reset
+        self._commit_every = commit_every
+        self._max_poll = max_poll
+        self._min_backoff = min_backoff
+        self._max_backoff = max_backoff
+
+        self._router: dict[str, Callable[[bytes, dict[str, str]], None]] = {}
+        self._readers: dict[Path, PartitionReader] = {}
+        self._consuming = False
+        self._seek: tuple[int | None, datetime | None] | None = None
+        self._worker = 0
+        self._workers = 1
+
+    def subscribe(
+        self,
+        channels: Annotated[set[str], Doc("The set of channels to which the consumer should subscribe.")],
+        handler: Annotated[
+            Callable[[bytes, dict[str, str]], None],
+            Doc("The handler utilized for processing messages from specified channels."),
+        ],
+    ) -> None:
+        """
+        Subscribe the handler to every partition of the channels.
+        """
+        for channel in channels:
+            self._router[channel] = handler
+
+    def set_worker(
+        self,
+        index: Annotated[int, Doc("The index of the forked dispatcher process, from 0.")],
+        workers: Annotated[int, Doc("The number of forked dispatcher processes.")],
+    ) -> None:
+        """
+        Consume only the partitions whose number modulo *workers* is *index*.
+        """
+        self._worker = index
+        self._workers = workers
+
+    def seek(
+        self,
+        offset: Annotated[int | None, Doc("The offset of the first message to consume in every partition.")] = None,
+        timestamp: Annotated[datetime | None, Doc("The time from which to consume messages.")] = None,
+    ) -> None:
+        """
+        Start consuming every partition at *offset*, or at the messages appended from *timestamp*,
+        instead of the committed offsets. The sparse segment indexes locate the position without
+        scanning the log, so consumption by timestamp may start with a few earlier messages.
+        """
+        self._seek = (offset, timestamp)
+
+    def start_consuming(self) -> None:
+        """
+        Consume the subscribed partitions in turn until the consumer is closed.
+        """
+        self._logger.info("Start consuming %s from %s", sorted(self._router), self._directory)
+
+        self._consuming = True
+        backoff = self._min_backoff
+
+        try:
+            self._discover()
+            self._seek = None
+
+            while not self.closed:
+                if sum(self._poll(reader) for reader in list(self._readers.values())):
+                    backoff = self._min_backoff
+                    continue
+
+                self._commit()
+                self._discover()
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self._max_backoff)
+        finally:
+            self._consuming = False
+            if self.closed:
+                self._shutdown()
+
+    def close(self) -> None:
+        """
+        Commit the consumed offsets and free allocated resources.
+        """
+        self.closed = True
+
+        if not self._consuming:
+            self._shutdown()
+
+    def _discover(self) -> None:
+        for channel in self._router:
+            if not (channel_path := PartitionLog.channel_path(self._directory, channel)).is_dir():
+                continue
+
+            for partition_path in channel_path.iterdir():
+                if (
+                    partition_path.name.isdigit()
+                    and int(partition_path.name) % self._workers == self._worker
+                    and partition_path not in self._readers
+                ):
+                    reader = self._readers[partition_path] = PartitionReader(
+                        partition_path, self._group, self._offset_reset
+                    )
+
+                    if self._seek is not None:
+                        reader.seek(*self._seek)
+
+    def _poll(self, reader: PartitionReader) -> int:
+        handled = 0
+
+        while handled < self._max_poll and not self.closed:
+            try:
+                if (message := reader.read()) is None:
+                    break
+            except ValueError as error:
+                self._logger.warning("Skipped malformed message in %s: %s", reader.path, error)
+                continue
+
+            channel, payload, headers = message
+            handled += 1
+
+            try:
+                self._router[channel](payload, headers)
+            except Exception as error:
+                self._logger.debug("An error occurred while consuming events", exc_info=error)
+
+            if reader.uncommitted >= self._commit_every:
+                reader.commit()
+
+        return handled
+
+    def _commit(self) -> None:
+        for reader in self._readers.values():
+            reader.commit()
+
+    def _shutdown(self) -> None:
+        for reader in self._readers.values():
+            reader.close()
+
+        self._readers.clear()
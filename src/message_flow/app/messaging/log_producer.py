@@ -0,0 +1,161 @@
+import itertools
+import logging
+import threading
+import zlib
+from pathlib import Path
+from typing import Annotated, Iterator, final
+
+from typing_extensions import Doc
+
+from ...utils import external, logger
+from .._log_messaging import PartitionLog
+from .._simple_messaging import Envelope
+from .producer import MessageProducer
+
+
+@final
+@external
+class LogMessageProducer(MessageProducer):
+    """
+    Message producer appending messages to a local, segmented and partitioned log,
+    a single-host stand-in for a Kafka-like broker.
+
+    Each channel is a directory with one subdirectory per partition, holding segment
+    files of at most *segment bytes* named after the offset of their first message, each
+    with a sparse index of offsets and append times used by `LogMessageConsumer.seek()`.
+    Messages go to the partition selected by the hash of the *key header*, or round-robin
+    when it is missing. Channel names are percent-encoded into directory names. When a segment is rolled, the oldest segments are deleted once
+    they are older than *retention seconds* or the partition exceeds *retention bytes*.
+    A log directory is meant to have a single producer process.
+
+    **Example**
+
+    ```python
+    from message_flow import LogMessageConsumer, LogMessageProducer, MessageFlow
+
+    app = MessageFlow(
+        message_producer=LogMessageProducer("/var/lib/orders", partitions=4, key_header="order_id"),
+        message_consumer=LogMessageConsumer("/var/lib/orders", group="billing"),
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        directory: Annotated[str | Path, Doc("The root directory of the log.")],
+        *,
+        partitions: Annotated[int, Doc("The number of partitions per channel.")] = 1,
+        key_header: Annotated[str | None, Doc("The header whose value selects the partition.")] = None,
+        segment_bytes: Annotated[int, Doc("The maximum size of a segment file.")] = 64 * 1024 * 1024,
+        retention_seconds: Annotated[float | None, Doc("The age after which segments are deleted.")] = None,
+        retention_bytes: Annotated[int | None, Doc("The maximum size of a partition.")] = None,
+        index_interval_bytes: Annotated[
+            int, Doc("The number of bytes between the sparse offset and timestamp index entries.")
+        ] = 4096,
+        checksum: Annotated[bool, Doc("Whether to protect messages with a CRC32.")] = False,
+        logger: Annotated[logging.Logger, Doc("The logger of the producer.")] = logger,
+    ) -> None:
+        self._logger = logger
+
+        self.closed = False
+
+        self._directory = Path(directory)
+        self._partitions = partitions
+        self._key_header = key_header
+        self._segment_bytes = segment_bytes
+        self._retention_seconds = retention_seconds
+        self._retention_bytes = retention_bytes
+        self._index_interval_bytes = index_interval_bytes
+        self._checksum = checksum
+
+        self._lock = threading.Lock()
+        self._logs: dict[tuple[str, int], PartitionLog] = {}
+        self._round_robin: dict[str, Iterator[int]] = {}
+
+    def send(
+        self,
+        channel: Annotated[str, Doc("The channel to which the message will be sent.")],
+        payload: Annotated[bytes, Doc("The message payload.")],
+        headers: Annotated[dict[str, str] | None, Doc("The message headers.")] = None,
+    ) -> None:
+        """
+        Append the message to the partition of the channel selected by its key.
+        """
+        self._append(channel, self._partition_of(channel, headers), [self._make_record(channel, payload, headers)])
+
+    def send_many(
+        self,
+        channel: Annotated[str, Doc("The channel to which the messages will be sent.")],
+        messages: Annotated[
+            list[tuple[bytes, dict[str, str] | None]],
+            Doc("The list of message payloads and headers."),
+        ],
+    ) -> None:
+        """
+        Append the batch of messages, with a single write per partition.
+        """
+        self._logger.debug("Send %s messages to %s", len(messages), channel)
+
+        partitions: dict[int, list[bytes]] = {}
+        for payload, headers in messages:
+            partitions.setdefault(self._partition_of(channel, headers), []).append(
+                self._make_record(channel, payload, headers)
+            )
+
+        for partition, records in partitions.items():
+            self._append(channel, partition, records)
+
+    def flush(self) -> None:
+        """
+        Force the appended messages to disk.
+        """
+        with self._lock:
+            logs = list(self._logs.values())
+
+        for log in logs:
+            log.sync()
+
+    def close(self) -> None:
+        """
+        Force the appended messages to disk and close the segment files.
+        """
+        self.flush()
+
+        with self._lock:
+            for log in self._logs.values():
+                log.close()
+
+            self._logs.clear()
+            self.closed = True
+
+    def _make_record(self, channel: str, payload: bytes, headers: dict[str, str] | None) -> bytes:
+        return Envelope.encode(channel, payload, headers, self._checksum)
+
+    def _partition_of(self, channel: str, headers: dict[str, str] | None) -> int:
+        if self._partitions == 1:
+            return 0
+
+        if self._key_header is not None and headers and (key := headers.get(self._key_header)) is not None:
+            return zlib.crc32(str(key).encode()) % self._partitions
+
+        if (round_robin := self._round_robin.get(channel)) is None:
+            round_robin = self._round_robin.setdefault(channel, itertools.cycle(range(self._partitions)))
+
+        return next(round_robin)
+
+    def _append(self, channel: str, partition: int, records: list[bytes]) -> None:
+        if (log := self._logs.get((channel, partition))) is None:
+            with self._lock:
+                if self.closed:
+                    raise RuntimeError("Message producer is closed.")
+
+                if (log := self._logs.get((channel, partition))) is None:
+                    log = self._logs[(channel, partition)] = PartitionLog(
+                        PartitionLog.channel_path(self._directory, channel) / str(partition),
+                        self._segment_bytes,
+                        self._retention_seconds,
+                        self._retention_bytes,
+                        self._index_interval_bytes,
+                    )
+
+        log.append(records)
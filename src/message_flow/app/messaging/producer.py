@@ -25,6 +25,30 @@ class MessageProducer(Protocol):
         """
         pass
 
+    def send_many(
+        self,
+        channel: Annotated[str, Doc("The channel to which the messages will be sent.")],
+        messages: Annotated[
+            list[tuple[bytes, dict[str, str] | None]],
+            Doc("The list of message payloads and headers."),
+        ],
+    ) -> None:
+        """
+        Send the batch of message payloads and headers to the specified channel.
+
+        **Note:** Optional, producers without native batching send messages one by one.
+        """
+        for payload, headers in messages:
+            self.send(channel, payload, headers)
+
+    def flush(self) -> None:
+        """
+        Send messages buffered by the message producer.
+
+        **Note:** Optional, called before the message producer is closed.
+        """
+        pass
+
     @abc.abstractmethod
     def close(self) -> None:
         """
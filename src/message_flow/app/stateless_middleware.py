@@ -0,0 +1,103 @@
+from contextlib import contextmanager
+from typing import Annotated, Generator
+
+from typing_extensions import Doc
+
+from ..utils import external
+
+
+@external
+class StatelessMiddleware:
+    """
+    `StatelessMiddleware` class, used to define custom middlewares without
+    per-message state.
+
+    Unlike `BaseMiddleware`, the middleware is never instantiated, hooks are
+    class methods receiving the payload and headers of the `Message`, so no
+    objects are allocated while `Messages` are dispatched.
+
+    **Example**
+
+    ```python
+    import logging
+    from message_flow import StatelessMiddleware
+
+    logger = logging.getLogger(__name__)
+
+
+    class CustomMiddleware(StatelessMiddleware):
+        @classmethod
+        def on_consume(cls, payload: bytes, headers: dict[str, str]) -> None:
+            logger.info("Message with %s headers received.", headers)
+
+        @classmethod
+        def after_consume(cls, payload: bytes, headers: dict[str, str], error: Exception | None = None) -> None:
+            logger.info("Message with %s headers processed.", headers)
+            return super().after_consume(payload, headers, error)
+    ```
+
+    Hooks can also be defined as coroutines, such middlewares are awaited
+    when messages are dispatched with `MessageFlow.dispatch_async()`, and
+    raise `TypeError` when used synchronously, e.g. by `MessageFlow.dispatch()`.
+    """
+
+    @classmethod
+    def on_consume(
+        cls,
+        payload: Annotated[bytes, Doc("Payload of the `Message`.")],
+        headers: Annotated[dict[str, str], Doc("Headers of the `Message`.")],
+    ) -> None:
+        """
+        Logic to execute before message processing.
+        """
+        pass
+
+    @classmethod
+    def after_consume(
+        cls,
+        payload: Annotated[bytes, Doc("Payload of the `Message`.")],
+        headers: Annotated[dict[str, str], Doc("Headers of the `Message`.")],
+        error: Annotated[Exception | None, Doc("The error raised while processing the `Message`.")] = None,
+    ) -> None:
+        """
+        Logic to execute after message processing.
+        """
+        if error is not None:
+            raise error
+
+    @classmethod
+    @contextmanager
+    def consume(cls, payload: bytes, headers: dict[str, str]) -> Generator[None, None, None]:
+        consume_error: Exception | None = None
+
+        try:
+            cls.on_consume(payload, headers)
+            yield
+        except Exception as error:
+            consume_error = error
+
+        cls.after_consume(payload, headers, consume_error)
+
+    @classmethod
+    def on_produce(
+        cls,
+        payload: Annotated[bytes, Doc("Payload of the `Message`.")],
+        headers: Annotated[dict[str, str], Doc("Headers of the `Message`.")],
+    ) -> None:
+        """
+        Logic to execute before message producing.
+        """
+        pass
+
+    @classmethod
+    def after_produce(
+        cls,
+        payload: Annotated[bytes, Doc("Payload of the `Message`.")],
+        headers: Annotated[dict[str, str], Doc("Headers of the `Message`.")],
+        error: Annotated[Exception | None, Doc("The error raised while producing the `Message`.")] = None,
+    ) -> None:
+        """
+        Logic to execute after message producing.
+        """
+        if error is not None:
+            raise error
@@ -1,3 +1,10 @@
-from ..utils import init_package
+from ..utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "Channel": "channel",
+    "Compression": "compression",
+    "CompressionStats": "compression",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
@@ -1 +1,3 @@
-from .channel import *
+from .channel import Channel as Channel
+from .compression import Compression as Compression
+from .compression import CompressionStats as CompressionStats
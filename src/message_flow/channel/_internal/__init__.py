@@ -1,3 +1,10 @@
-from ...utils import init_package
+from ...utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "ChannelMeta": "channel_construction",
+    "ChannelInfo": "channel_info",
+    "ChannelSchema": "channel_schema",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
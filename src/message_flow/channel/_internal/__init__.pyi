@@ -1,3 +1,3 @@
-from .channel_construction import *
-from .channel_info import *
-from .channel_schema import *
+from .channel_construction import ChannelMeta as ChannelMeta
+from .channel_info import ChannelInfo as ChannelInfo
+from .channel_schema import ChannelSchema as ChannelSchema
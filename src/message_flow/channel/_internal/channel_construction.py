@@ -1,5 +1,5 @@
 from abc import ABCMeta
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ...message import Message
 from ...operation import Operation
@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
 @internal
 class ChannelMeta(ABCMeta):
+    revision: int = 0
+
     def __new__(mcs, name, bases, namespace, **kwargs):
         cls: type["Channel"] = super().__new__(mcs, name, bases, namespace, **kwargs)
 
@@ -26,19 +28,28 @@ class ChannelMeta(ABCMeta):
         cls.__init__ = decorated_init(cls.__init__)
         cls._add_message = mcs._add_message
         cls._add_operation = mcs._add_operation
+        cls.__async_api_components__ = property(mcs._make_components)
 
         return cls
 
     @staticmethod
     def __post_init__(channel: "Channel") -> None:
         channel._messages = {}
+        channel._message_types = []
+        channel._async_api_components = None
 
         channel.__async_api_reference__ = Reference.for_channel(channel.channel_id)
-        channel.__async_api_components__ = Components()
+
+    @staticmethod
+    def _make_components(channel: "Channel") -> Components:
+        if channel._async_api_components is not None:
+            return channel._async_api_components
+
+        channel._async_api_components = components = Components()
 
         schema = ChannelSchema(
             address=channel.address,
-            messages=channel._messages,
+            messages=ChannelMeta._make_messages(channel),
         )
 
         if (title := channel.channel_info.get("title")) is not None:
@@ -50,14 +61,46 @@ class ChannelMeta(ABCMeta):
         if (description := channel.channel_info.get("description")) is not None:
             schema["description"] = description
 
-        channel.__async_api_components__.add_channel(channel.channel_id, schema)  # type: ignore
+        components.add_channel(channel.channel_id, schema)  # type: ignore
+
+        for message in channel._message_types:
+            components.merge(message.__async_api_components__)
+
+        for operation in channel.operations:
+            components.merge(operation.__async_api_components__)
+
+        return components
+
+    @staticmethod
+    def _make_messages(channel: "Channel") -> dict[str, Any]:
+        if channel.content_type is None:
+            return channel._messages
+
+        messages: dict[str, Any] = dict(channel._messages)
+
+        # Message components are shared between channels, so messages encoded with
+        # the content type of the channel are described inline.
+        for message in channel._message_types:
+            if "content_type" not in message.message_info:
+                message_id = message.__async_api_reference__.id
+                messages[message_id] = {
+                    **message.__async_api_components__.messages[message_id],
+                    "contentType": channel.content_type,
+                }
+
+        return messages
 
     @staticmethod
     def _add_message(channel: "Channel", message: type[Message]) -> None:
         channel._messages.update(message.__async_api_reference__.as_component())
-        channel.__async_api_components__.merge(message.__async_api_components__)
+        channel._message_types.append(message)
+        channel._async_api_components = None
+
+        ChannelMeta.revision += 1
 
     @staticmethod
     def _add_operation(channel: "Channel", operation: Operation) -> None:
         channel.operations.append(operation)
-        channel.__async_api_components__.merge(operation.__async_api_components__)
+        channel._async_api_components = None
+
+        ChannelMeta.revision += 1
@@ -1,4 +1,4 @@
-from typing import TypedDict
+from typing import Any, TypedDict
 
 from ...utils import internal
 
@@ -6,7 +6,7 @@ from ...utils import internal
 @internal
 class ChannelSchema(TypedDict, total=False):
     address: str
-    messages: dict[str, dict[str, str]]
+    messages: dict[str, Any]
     title: str
     summary: str
     description: str
@@ -1,14 +1,15 @@
-from typing import TYPE_CHECKING, Annotated, Callable, final
+from typing import TYPE_CHECKING, Annotated, Awaitable, Callable, final
 
 from typing_extensions import Doc
 
-from ..message import Message
-from ..operation import Operation
+from ..message import Message, ValidationPolicy
+from ..operation import Operation, OperationBatch
 from ..shared import Components, Reference
 from ..utils import external
 from ._internal import ChannelInfo, ChannelMeta
+from .compression import Compression
 
-MessageHandler = Callable[[Message], Message | None]
+MessageHandler = Callable[[Message], Message | None | Awaitable[Message | None]]
 
 
 @final
@@ -28,6 +29,8 @@ class Channel(metaclass=ChannelMeta):
 
     if TYPE_CHECKING:
         _messages: dict[str, dict[str, str]]
+        _message_types: list[type[Message]]
+        _async_api_components: Components | None
         __async_api_components__: Components
         __async_api_reference__: Reference
 
@@ -110,8 +113,65 @@ class Channel(metaclass=ChannelMeta):
                 """
             ),
         ] = None,
+        content_type: Annotated[
+            str | None,
+            Doc(
+                """
+                The content type of payloads of `Messages` sent to the channel,
+                used to select the codec from `Codecs`.
+
+                It will be added to the generated AsyncAPI.
+
+                **Note:** `Messages` declaring the content type in `MessageInfo` keep their own.
+
+                **Example**
+
+                ```python
+                from message_flow import Channel
+
+                orders = Channel("orders", content_type="application/msgpack")
+                ```
+                """
+            ),
+        ] = None,
+        compression: Annotated[
+            Compression | None,
+            Doc(
+                """
+                The compression of payloads of `Messages` sent to the channel.
+
+                **Example**
+
+                ```python
+                from message_flow import Channel, Compression
+
+                orders = Channel("orders", compression=Compression("zlib", threshold=4096))
+                ```
+                """
+            ),
+        ] = None,
+        validation: Annotated[
+            ValidationPolicy | None,
+            Doc(
+                """
+                The validation policy of `Messages` decoded from the channel, overriding
+                the policy of the `Message`.
+
+                **Example**
+
+                ```python
+                from message_flow import Channel, ValidationPolicy
+
+                orders = Channel("orders", validation=ValidationPolicy.TRUSTED)
+                ```
+                """
+            ),
+        ] = None,
     ) -> None:
         self.address = address or "unknown"
+        self.content_type = content_type
+        self.compression = compression
+        self.validation = validation
 
         self.channel_info = self._make_channel_info(
             title=title,
@@ -469,6 +529,35 @@ class Channel(metaclass=ChannelMeta):
                 """
             ),
         ] = None,
+        batch_size: Annotated[
+            int | None,
+            Doc(
+                """
+                The maximum number of `Messages` delivered to the handler at once.
+
+                When provided, the handler receives a list of `Messages`.
+
+                **Example**
+
+                ```python
+                from message_flow import Channel, Message, Payload
+
+                orders_channel = Channel("orders")
+
+                class OrderCreated(Message):
+                    order_id: str = Payload()
+
+                @orders_channel.subscribe(OrderCreated, batch_size=100, batch_wait=0.5)
+                def handle_orders_created(messages: list[OrderCreated]) -> None:
+                    ...
+                ```
+                """
+            ),
+        ] = None,
+        batch_wait: Annotated[
+            float,
+            Doc("The maximum number of seconds to wait for the batch to be filled."),
+        ] = 1.0,
     ) -> Callable[[MessageHandler], MessageHandler]:
         """
         Add subscribe operation using a *receive* `Operation`.
@@ -498,6 +587,7 @@ class Channel(metaclass=ChannelMeta):
                 Operation.as_subscription(
                     message,
                     handler,
+                    OperationBatch(batch_size, batch_wait) if batch_size is not None else None,
                     channel=self.channel_id,
                     title=title,
                     summary=summary,
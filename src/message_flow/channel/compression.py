@@ -0,0 +1,90 @@
+import threading
+from typing import Annotated, Literal, final
+
+from typing_extensions import Doc
+
+from ..utils import external
+
+Algorithm = Literal["zlib", "gzip", "lzma"]
+
+
+@final
+@external
+class Compression:
+    """
+    Declare compression of `Message` payloads sent to the `Channel`.
+
+    The algorithm travels in the `content-encoding` header and payloads are
+    decompressed by the dispatcher before the `Message` is decoded.
+
+    **Example**
+
+    ```python
+    from message_flow import Channel, Compression
+
+    order_snapshots = Channel("order-snapshots", compression=Compression("zlib", threshold=4096))
+    ```
+    """
+
+    ALGORITHMS: tuple[Algorithm, ...] = ("zlib", "gzip", "lzma")
+
+    def __init__(
+        self,
+        algorithm: Annotated[Algorithm, Doc("The standard library compression algorithm.")] = "zlib",
+        *,
+        threshold: Annotated[
+            int,
+            Doc("The minimum payload size in bytes to compress, smaller payloads are sent as is."),
+        ] = 1024,
+        level: Annotated[
+            int | None,
+            Doc("The compression level, or preset for `lzma`. The algorithm's default is used when absent."),
+        ] = None,
+    ) -> None:
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Compression algorithm should be one of {', '.join(self.ALGORITHMS)}.")
+
+        if threshold < 0:
+            raise ValueError("Compression threshold should not be negative.")
+
+        self.algorithm = algorithm
+        self.threshold = threshold
+        self.level = level
+
+
+@final
+@external
+class CompressionStats:
+    """
+    Counters of payload compression and decompression.
+    """
+
+    def __init__(self) -> None:
+        self.compressed_messages = 0
+        self.uncompressed_bytes = 0
+        self.compressed_bytes = 0
+        self.compression_seconds = 0.0
+
+        self.decompressed_messages = 0
+        self.decompression_seconds = 0.0
+
+        self._lock = threading.Lock()
+
+    @property
+    def ratio(self) -> float:
+        """
+        The compressed to uncompressed size ratio of compressed payloads.
+        """
+        return self.compressed_bytes / self.uncompressed_bytes if self.uncompressed_bytes else 1.0
+
+    def record_compression(self, size: int, compressed_size: int, seconds: float) -> None:
+        with self._lock:
+            self.compressed_messages += 1
+            self.uncompressed_bytes += size
+            self.compressed_bytes += compressed_size
+            self.compression_seconds += seconds
+
+    def record_decompression(self, seconds: float) -> None:
+        with self._lock:
+            self.decompressed_messages += 1
+            self.decompression_seconds += seconds
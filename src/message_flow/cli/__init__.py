@@ -1,3 +1,8 @@
-from ..utils import init_package
+from ..utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "cli": "entrypoint",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
@@ -1 +1 @@
-from .entrypoint import *
+from .entrypoint import cli as cli
@@ -1,5 +1,6 @@
 import logging
 from collections import defaultdict
+from datetime import datetime
 from importlib.util import module_from_spec, spec_from_file_location
 from pathlib import Path
 from typing import DefaultDict, final
@@ -7,9 +8,10 @@ from typing import DefaultDict, final
 import typer
 
 from ..app import MessageFlow
-from ..utils import internal
+from ..utils import internal, logger
 from ._documentation_server import DocumentationServer
 from ._logging_level import LoggingLevel
+from ._prefork_supervisor import PreforkSupervisor
 
 
 @final
@@ -77,11 +79,44 @@ class CLIApp:
 
         return self._instance
 
-    def dispatch(self) -> None:
-        self.instance.dispatch()
+    def dispatch(
+        self,
+        threads: int = 1,
+        ordering_key: str | None = None,
+        workers: int = 1,
+        from_offset: int | None = None,
+        from_time: datetime | None = None,
+    ) -> None:
+        def dispatch(worker: int = 0) -> None:
+            if workers > 1:
+                self.instance.dispatcher.set_worker(worker, workers)
+
+            self.instance.dispatch(
+                threads=threads,
+                ordering_key=ordering_key,
+                from_offset=from_offset,
+                from_time=from_time,
+            )
+
+        if workers == 1:
+            return dispatch()
+
+        if not self.instance.dispatcher.fork_safe:
+            raise typer.BadParameter(
+                "The message consumer can't be shared by forked workers, please, dispatch with a single worker"
+            )
+
+        self.instance.dispatcher.prepare()
+
+        PreforkSupervisor(dispatch, self.instance.dispatcher.stop, workers, logger).run()
 
     def serve_documentation(self, host: str, port: int) -> None:
-        DocumentationServer(studio_page=self.instance.generate_docs_page(), host=host, port=port).serve()
+        DocumentationServer(
+            studio_page=self.instance.generate_docs_page(),
+            schema=self.instance.async_api_schema,
+            host=host,
+            port=port,
+        ).serve()
 
     def _import(self) -> MessageFlow:
         spec = spec_from_file_location(
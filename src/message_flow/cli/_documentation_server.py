@@ -1,42 +1,139 @@
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import final
+import gzip
+import hashlib
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, final
 
+from ..app._internal import AsyncAPISchema
 from ..utils import internal, logger
 
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None
+
 
 @final
 @internal
 class DocumentationServer:
-    def __init__(self, studio_page: str, host: str, port: int) -> None:
+    STUDIO_PAGE_PATH = "/async-api-docs"
+    JSON_SCHEMA_PATH = "/asyncapi.json"
+    YAML_SCHEMA_PATH = "/asyncapi.yaml"
+
+    def __init__(self, studio_page: str, schema: AsyncAPISchema, host: str, port: int) -> None:
         self._host = host
         self._port = port
 
-        self.RequestHandler.studio_page = studio_page
+        resources = {
+            self.STUDIO_PAGE_PATH: self.Resource(studio_page.encode(), "text/html; charset=utf-8"),
+            self.JSON_SCHEMA_PATH: self.Resource(schema.content, "application/json", schema.sha256),
+            self.YAML_SCHEMA_PATH: self.Resource(self._dump_yaml(schema), "application/yaml"),
+        }
+        request_handler = type("RequestHandler", (self.RequestHandler,), {"resources": resources})
+
+        self._httpd = ThreadingHTTPServer((self._host, self._port), request_handler)
+        self._httpd.daemon_threads = True
 
-        self._httpd = HTTPServer((self._host, self._port), self.RequestHandler)
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._httpd.server_address[:2]  # type: ignore
 
     def serve(self) -> None:
         logger.info("Start serving documentation on %s:%s", self._host, self._port)
-        self._httpd.serve_forever()
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def shutdown(self) -> None:
+        self._httpd.shutdown()
+
+    @staticmethod
+    def _dump_yaml(schema: AsyncAPISchema) -> bytes:
+        if yaml is None:
+            # JSON is a subset of YAML 1.2, so the serialized schema is served as is.
+            return schema.content
+
+        return yaml.safe_dump(json.loads(schema.content), sort_keys=False, allow_unicode=True).encode()
+
+    @final
+    class Resource:
+        def __init__(self, content: bytes, content_type: str, digest: str | None = None) -> None:
+            self.content = content
+            self.compressed_content = gzip.compress(content, mtime=0)
+            self.content_type = content_type
+
+            digest = digest or hashlib.sha256(content).hexdigest()
+            self.etag = f'"{digest}"'
+            self.compressed_etag = f'"{digest}-gzip"'
+
+        def matches(self, if_none_match: str) -> bool:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+            return "*" in tags or self.etag in tags or self.compressed_etag in tags
 
     class RequestHandler(BaseHTTPRequestHandler):
-        studio_page: str
+        resources: dict[str, "DocumentationServer.Resource"]
+
+        protocol_version = "HTTP/1.1"
 
-        def do_GET(self):
-            if self.path == "/async-api-docs":
-                self._send_async_api_studio_page()
-            else:
-                self._send_not_found()
+        def do_GET(self) -> None:
+            self._send(head=False)
 
-        def _send_async_api_studio_page(self) -> None:
-            self._set_headers()
-            self.wfile.write(self.studio_page.encode())
+        def do_HEAD(self) -> None:
+            self._send(head=True)
 
-        def _send_not_found(self) -> None:
-            self._set_headers(404, "text/plain")
-            self.wfile.write(b"404 Not Found")
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug("%s - %s", self.address_string(), format % args)
 
-        def _set_headers(self, status: int = 200, content_type: str = "text/html"):
-            self.send_response(status)
-            self.send_header("Content-type", content_type)
+        def _send(self, head: bool) -> None:
+            if (resource := self.resources.get(self.path.split("?", 1)[0])) is None:
+                return self._send_not_found(head)
+
+            compressed = self._accepts_gzip()
+            etag = resource.compressed_etag if compressed else resource.etag
+
+            if (if_none_match := self.headers.get("If-None-Match")) is not None and resource.matches(if_none_match):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return
+
+            content = resource.compressed_content if compressed else resource.content
+
+            self.send_response(200)
+            self.send_header("Content-Type", resource.content_type)
+            self.send_header("Content-Length", str(len(content)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Vary", "Accept-Encoding")
+            if compressed:
+                self.send_header("Content-Encoding", "gzip")
             self.end_headers()
+
+            if not head:
+                self.wfile.write(content)
+
+        def _send_not_found(self, head: bool) -> None:
+            content = b"404 Not Found"
+
+            self.send_response(404)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+
+            if not head:
+                self.wfile.write(content)
+
+        def _accepts_gzip(self) -> bool:
+            for coding in self.headers.get("Accept-Encoding", "").split(","):
+                name, _, parameters = coding.partition(";")
+                if name.strip().lower() in ("gzip", "*"):
+                    try:
+                        return float(parameters.replace(" ", "").removeprefix("q=") or 1) > 0
+                    except ValueError:
+                        return True
+
+            return False
@@ -0,0 +1,97 @@
+import gc
+import logging
+import os
+import signal
+import sys
+import time
+from types import FrameType
+from typing import Callable, final
+
+from ..utils import internal
+
+
+@final
+@internal
+class PreforkSupervisor:
+    RESTART_DELAY: float = 1.0
+
+    def __init__(
+        self, target: Callable[[int], None], stop: Callable[[], None], workers: int, logger: logging.Logger
+    ) -> None:
+        if workers < 1:
+            raise ValueError("Number of workers should be positive.")
+
+        self._logger = logger
+
+        self._target = target
+        self._stop_target = stop
+        self._workers = workers
+        self._children: dict[int, tuple[int, float]] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        gc.disable()
+        gc.freeze()
+
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        for worker in range(self._workers):
+            self._spawn(worker)
+
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+
+            child = self._children.pop(pid, None)
+            if child is None or self._stopping:
+                continue
+
+            worker, started_at = child
+            self._logger.warning("Worker %s exited with status %s, restarting", pid, os.waitstatus_to_exitcode(status))
+            if time.monotonic() - started_at < self.RESTART_DELAY:
+                time.sleep(self.RESTART_DELAY)
+
+            if not self._stopping:
+                self._spawn(worker)
+
+        self._logger.info("All workers stopped")
+
+    def _spawn(self, worker: int) -> None:
+        if (pid := os.fork()) != 0:
+            self._children[pid] = (worker, time.monotonic())
+            self._logger.info("Started worker %s", pid)
+            return
+
+        signal.signal(signal.SIGTERM, self._drain)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        gc.enable()
+
+        exit_code = 0
+        try:
+            self._target(worker)
+        except BaseException as error:
+            exit_code = error.code if isinstance(error, SystemExit) and isinstance(error.code, int) else 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)
+
+    def _stop(self, signum: int, frame: FrameType | None) -> None:
+        if self._stopping:
+            return
+
+        self._logger.info("Stopping workers")
+        self._stopping = True
+
+        for pid in self._children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _drain(self, signum: int, frame: FrameType | None) -> None:
+        self._logger.info("Stopping worker %s", os.getpid())
+        self._stop_target()
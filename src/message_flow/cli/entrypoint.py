@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import typer
 
 from ._cli_app import CLIApp
@@ -27,13 +29,43 @@ def dispatch(
         show_default=False,
         help="[INFO] default",
     ),
+    workers: int = typer.Option(
+        1,
+        min=1,
+        help="number of dispatcher processes forked after the app is imported, "
+        "requires a fork-safe consumer such as LogMessageConsumer",
+    ),
+    threads: int = typer.Option(
+        1,
+        min=1,
+        help="number of worker threads processing messages",
+    ),
+    ordering_key: str = typer.Option(
+        None,
+        help="header used to keep messages ordered between worker threads, channel address by default",
+    ),
+    from_offset: int = typer.Option(
+        None,
+        min=0,
+        help="replay messages from this offset, when the consumer supports seeking",
+    ),
+    from_time: datetime = typer.Option(
+        None,
+        help="replay messages from this time, when the consumer supports seeking",
+    ),
 ):
     """
     Starts message dispatching
     """
     cli_app = CLIApp(app, log_level)
 
-    cli_app.dispatch()
+    cli_app.dispatch(
+        threads=threads,
+        ordering_key=ordering_key,
+        workers=workers,
+        from_offset=from_offset,
+        from_time=from_time,
+    )
 
 
 @cli.command()
@@ -1,3 +1,20 @@
-from ..utils import init_package
+from ..utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "Codec": "codec",
+    "JsonCodec": "codec",
+    "MsgPackCodec": "codec",
+    "CborCodec": "codec",
+    "Codecs": "codec",
+    "CorrelationId": "correlation_id",
+    "Header": "header",
+    "Message": "message",
+    "MessageExample": "message_example",
+    "MessageInfo": "message_info",
+    "MessageTrait": "message_trait",
+    "Payload": "payload",
+    "ValidationPolicy": "validation_policy",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
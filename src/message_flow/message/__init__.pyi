@@ -1,7 +1,13 @@
-from .correlation_id import *
-from .header import *
-from .message import *
-from .message_example import *
-from .message_info import *
-from .message_trait import *
-from .payload import *
+from .codec import CborCodec as CborCodec
+from .codec import Codec as Codec
+from .codec import Codecs as Codecs
+from .codec import JsonCodec as JsonCodec
+from .codec import MsgPackCodec as MsgPackCodec
+from .correlation_id import CorrelationId as CorrelationId
+from .header import Header as Header
+from .message import Message as Message
+from .message_example import MessageExample as MessageExample
+from .message_info import MessageInfo as MessageInfo
+from .message_trait import MessageTrait as MessageTrait
+from .payload import Payload as Payload
+from .validation_policy import ValidationPolicy as ValidationPolicy
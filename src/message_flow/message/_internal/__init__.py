@@ -1,3 +1,10 @@
-from ...utils import init_package
+from ...utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "MessageMeta": "message_construction",
+    "MessageDecoder": "message_decoder",
+    "MessageSchema": "message_schema",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
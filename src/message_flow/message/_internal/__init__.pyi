@@ -1,2 +1,3 @@
-from .message_construction import *
-from .message_schema import *
+from .message_construction import MessageMeta as MessageMeta
+from .message_decoder import MessageDecoder as MessageDecoder
+from .message_schema import MessageSchema as MessageSchema
@@ -1,15 +1,18 @@
 import sys
 from abc import ABCMeta
 from types import FunctionType
-from typing import TYPE_CHECKING, Any, final
+from typing import TYPE_CHECKING, Annotated, Any, final
 
+from pydantic import TypeAdapter
 from pydantic.fields import FieldInfo
-from pydantic_core import PydanticUndefined
-from typing_extensions import dataclass_transform
+from pydantic_core import PydanticUndefined, SchemaSerializer
+from typing_extensions import TypedDict, dataclass_transform
 
 from ...shared import Components, Reference
+from ..codec import Codec, Codecs
 from ..header import Header
 from ..payload import Payload
+from ..validation_policy import ValidationPolicy
 from .message_schema import MessageSchema
 
 if TYPE_CHECKING:
@@ -23,19 +26,42 @@ from ...utils import internal
 @internal
 @dataclass_transform(kw_only_default=True, field_specifiers=(Header, Payload))
 class MessageMeta(ABCMeta):
-    def __new__(mcs, name, bases, namespace, **kwargs):
+    def __new__(mcs, name, bases, namespace, *, slots: bool = False, **kwargs):
         if bases:
             mcs.process_traits(namespace)
 
+            if slots:
+                mcs.process_slots(namespace)
+
             cls: type[Message] = super().__new__(mcs, name, bases, namespace, **kwargs)
 
-            mcs.MethodGenerator(cls).generate_init()
-            mcs.SchemaGenerator(cls).generate_schema()
+            method_generator = mcs.MethodGenerator(cls)
+            method_generator.generate_init()
+            method_generator.generate_encoders()
+
+            mcs.validate_correlation_id(cls)
+            cls.__async_api_reference__ = Reference.for_message(cls.__name__)
 
             return cls
 
         return super().__new__(mcs, name, bases, namespace, **kwargs)
 
+    @property
+    def __async_api_components__(cls) -> Components:
+        """
+        AsyncAPI components of the `Message`, generated on first access.
+        """
+        if (components := cls.__dict__.get("_async_api_components")) is None:
+            components = type(cls).SchemaGenerator(cls).generate_schema()  # type: ignore
+            cls._async_api_components = components
+
+        return components
+
+    @staticmethod
+    def validate_correlation_id(cls: type["Message"]) -> None:
+        if (correlation_id := cls.message_info.get("correlation_id")) is not None:
+            correlation_id.is_valid(cls.headers_attributes())
+
     @classmethod
     def process_traits(cls, namespace: dict[str, Any]) -> None:
         if namespace.get("message_info") is None:
@@ -47,6 +73,19 @@ class MessageMeta(ABCMeta):
             trait.update_headers(namespace)
             trait.update_message_info(namespace)
 
+    @classmethod
+    def process_slots(cls, namespace: dict[str, Any]) -> None:
+        if "__slots__" in namespace:
+            raise RuntimeError("Please do not define explicit slots.")
+
+        namespace["__slots__"] = tuple(
+            f"_{component_name}"
+            for component_name, component in namespace.items()
+            if not component_name.startswith("__")
+            and not component_name.endswith("__")
+            and isinstance(component, (Header, Payload))
+        )
+
     class MethodGenerator:
         def __init__(self, message_class: type["Message"]) -> None:
             self.cls = message_class
@@ -96,7 +135,8 @@ class MessageMeta(ABCMeta):
             return "__init__" in self.cls.__dict__
 
         def _make_body(self) -> str:
-            body_lines = []
+            validated_lines = []
+            trusted_lines = []
 
             for component_name, component in self.components.items():
                 default_name = f"_dflt_{component_name}"
@@ -107,10 +147,21 @@ class MessageMeta(ABCMeta):
                     self.globals[default_name] = component.default
                     value = component_name
 
-                body_lines.append(f"self.{component_name} = {value}")
+                self.locals[f"_field_{component_name}"] = component
+                validated_lines.append(f"self._{component_name} = _field_{component_name}._validate({value}, _strict)")
+                trusted_lines.append(f"self._{component_name} = {value}")
+
+            if not validated_lines:
+                return "  pass"
 
-            if not body_lines:
-                body_lines = ["pass"]
+            self.locals["_policy"] = self.cls.message_info.get("validation", ValidationPolicy.LAX)
+            body_lines = [
+                "if _policy.should_validate():",
+                " _strict = _policy.strict",
+                *(f" {line}" for line in validated_lines),
+                "else:",
+                *(f" {line}" for line in trusted_lines),
+            ]
 
             return "\n".join(f"  {b}" for b in body_lines)
 
@@ -150,12 +201,61 @@ class MessageMeta(ABCMeta):
 
             setattr(self.cls, "__init__", self._make_constructor())
 
+        def generate_encoders(self) -> None:
+            generator = self
+
+            def __encode_payload__(message: "Message", codec: Codec) -> bytes:
+                generator._make_encoders()
+                return message.__encode_payload__(codec)
+
+            def __encode_headers__(message: "Message") -> dict[str, str]:
+                generator._make_encoders()
+                return message.__encode_headers__()
+
+            setattr(self.cls, "__encode_payload__", __encode_payload__)
+            setattr(self.cls, "__encode_headers__", __encode_headers__)
+
+        def _make_encoders(self) -> None:
+            payload_components = {name: c for name, c in self.components.items() if isinstance(c, Payload)}
+            headers_components = {name: c for name, c in self.components.items() if isinstance(c, Header)}
+
+            encoders_txt = (
+                "def __create_encoders__(_payload_serializer, _headers_serializer):\n"
+                " def __encode_payload__(self, codec):\n"
+                f"  return codec.encode(_payload_serializer, {self._make_values(payload_components)})\n"
+                " def __encode_headers__(self):\n"
+                f"  return _headers_serializer.to_python({self._make_values(headers_components)})\n"
+                " return __encode_payload__, __encode_headers__"
+            )
+
+            ns: dict[str, Any] = {}
+            exec(encoders_txt, {}, ns)
+
+            for encoder in ns["__create_encoders__"](
+                self._make_serializer("payload", payload_components),
+                self._make_serializer("headers", headers_components),
+            ):
+                encoder.__qualname__ = f"{self.cls.__qualname__}.{encoder.__name__}"
+                setattr(self.cls, encoder.__name__, encoder)
+
+        @staticmethod
+        def _make_values(components: dict[str, FieldInfo]) -> str:
+            return "{" + ", ".join(f"{name!r}: self._{name}" for name in components) + "}"
+
+        @staticmethod
+        def _make_serializer(name: str, components: dict[str, FieldInfo]) -> SchemaSerializer:
+            fields = {
+                component_name: Annotated[component.annotation, component]
+                for component_name, component in components.items()
+            }
+            return TypeAdapter(TypedDict(name, fields)).serializer  # type: ignore
+
     class SchemaGenerator:
         def __init__(self, message_class: type["Message"]) -> None:
             self.cls = message_class
 
             self._components = Components()
-            self._schema = MessageSchema(contentType="application/json")
+            self._schema = MessageSchema(contentType=message_class.message_info.get("content_type", Codecs.DEFAULT))
 
         @property
         def headers_schema(self) -> dict[str, Any]:
@@ -173,10 +273,11 @@ class MessageMeta(ABCMeta):
                 )
             return self._payload_schema
 
-        def generate_schema(self) -> None:
+        def generate_schema(self) -> Components:
             self._add_reference_schemas()
             self._add_message()
-            self._add_async_api_attributes()
+
+            return self._components
 
         def _add_reference_schemas(self) -> None:
             if "$defs" in self.headers_schema:
@@ -193,10 +294,6 @@ class MessageMeta(ABCMeta):
 
             self._components.add_message(self.cls.__name__, self._schema)  # type: ignore
 
-        def _add_async_api_attributes(self) -> None:
-            self.cls.__async_api_reference__ = Reference.for_message(self.cls.__name__)
-            self.cls.__async_api_components__ = self._components
-
         def _add_payload_to_schema(self) -> None:
             self._schema["payload"] = self.payload_schema
 
@@ -205,7 +302,6 @@ class MessageMeta(ABCMeta):
 
         def _add_correlation_id_to_schema(self) -> None:
             if (correlation_id := self.cls.message_info.get("correlation_id")) is not None:
-                correlation_id.is_valid(self.cls.headers_attributes())
                 self._schema["correlationId"] = correlation_id.as_schema()
 
         def _add_info_to_schema(self) -> None:
@@ -0,0 +1,128 @@
+from typing import TYPE_CHECKING, Annotated, Any, final
+
+from pydantic import BaseModel, Json, TypeAdapter
+from pydantic.fields import FieldInfo
+from pydantic_core import SchemaValidator
+from typing_extensions import TypedDict
+
+from ...utils import internal
+from ..codec import Codec, Codecs, JsonCodec
+from ..validation_policy import ValidationPolicy
+
+if TYPE_CHECKING:
+    from ..message import Message
+
+
+@final
+@internal
+class MessageDecoder:
+    """
+    Decodes raw payload and headers straight into the `Message` instance.
+
+    The payload and headers are validated in a single pass of one validator
+    combining both, JSON payloads are validated from bytes by pydantic-core
+    in JSON mode without decoding them to `str` and parsing them with `json`
+    first. Validated values are stored on the instance without running the
+    generated constructor, which would validate every attribute again. Trusted
+    payloads are parsed and stored without validation.
+
+    Codecs overriding `Codec.decode()` get the payload and headers validated
+    separately, as their payload validation can't be combined.
+    """
+
+    def __init__(self, message_class: type["Message"]) -> None:
+        self._message_class = message_class
+        self._codec = Codecs.get(message_class.message_info.get("content_type", Codecs.DEFAULT))
+
+        self._validation = message_class.message_info.get("validation", ValidationPolicy.LAX)
+
+        self._payload_validator = message_class.payload_model().__pydantic_validator__
+        self._headers_validator = message_class.headers_model().__pydantic_validator__
+
+        payload = TypedDict("payload", self._typed_fields(message_class.payload_attributes()))  # type: ignore
+        headers = TypedDict("headers", self._typed_fields(message_class.headers_attributes()))  # type: ignore
+        self._json_validator = self._combined_validator(Json[payload], headers)  # type: ignore
+        self._python_validator = self._combined_validator(payload, headers)
+
+        self._payload_fields = self._trusted_fields(message_class.payload_model())
+        self._headers_fields = self._trusted_fields(message_class.headers_model())
+
+        self._private_names = {
+            name: f"_{name}" for name in (*message_class.payload_attributes(), *message_class.headers_attributes())
+        }
+
+    def decode(
+        self,
+        raw_payload: bytes | memoryview,
+        raw_headers: dict[str, str],
+        validation: ValidationPolicy | None = None,
+    ) -> "Message":
+        codec = (
+            self._codec
+            if (content_type := raw_headers.get(Codecs.HEADER)) is None or content_type == self._codec.content_type
+            else Codecs.get(content_type)
+        )
+
+        message = object.__new__(self._message_class)
+
+        if not (validation := validation or self._validation).should_validate():
+            self._set_trusted(message, self._payload_fields, codec.loads(raw_payload))
+            self._set_trusted(message, self._headers_fields, raw_headers)
+        elif isinstance(codec, JsonCodec):
+            raw = raw_payload.tobytes() if isinstance(raw_payload, memoryview) else raw_payload
+            self._set_combined(message, self._json_validator, raw, raw_headers, validation.strict)
+        elif type(codec).decode is Codec.decode:
+            payload = codec.loads(raw_payload)
+            self._set_combined(message, self._python_validator, payload, raw_headers, validation.strict)
+        else:
+            payload = codec.decode(self._payload_validator, raw_payload, validation.strict)
+            headers = self._headers_validator.validate_python(raw_headers, strict=validation.strict)
+
+            self._set_validated(message, payload.__dict__)
+            self._set_validated(message, headers.__dict__)
+
+        return message
+
+    def _set_combined(
+        self, message: "Message", validator: SchemaValidator, payload: Any, headers: dict[str, str], strict: bool
+    ) -> None:
+        validated = validator.validate_python({"payload": payload, "headers": headers}, strict=strict)
+
+        self._set_validated(message, validated["payload"])
+        self._set_validated(message, validated["headers"])
+
+    def _set_validated(self, message: "Message", values: dict[str, Any]) -> None:
+        private_names = self._private_names
+
+        for name, value in values.items():
+            setattr(message, private_names[name], value)
+
+    @staticmethod
+    def _set_trusted(message: "Message", fields: list[tuple[str, str, FieldInfo]], data: dict[str, Any]) -> None:
+        for key, private_name, field in fields:
+            setattr(
+                message,
+                private_name,
+                data[key] if key in data or field.is_required() else field.get_default(call_default_factory=True),
+            )
+
+    def _typed_fields(self, names: list[str]) -> dict[str, Any]:
+        return {
+            name: Annotated[self._message_class.__annotations__[name], self._message_class.__dict__[name]]
+            for name in names
+        }
+
+    @staticmethod
+    def _combined_validator(payload: Any, headers: Any) -> SchemaValidator:
+        return TypeAdapter(TypedDict("message", {"payload": payload, "headers": headers})).validator  # type: ignore
+
+    @staticmethod
+    def _trusted_fields(model: type[BaseModel]) -> list[tuple[str, str, FieldInfo]]:
+        return [
+            (
+                field.validation_alias if isinstance(field.validation_alias, str) else field.alias or name,
+                f"_{name}",
+                field,
+            )
+            for name, field in model.model_fields.items()
+        ]
@@ -0,0 +1,177 @@
+from typing import Annotated, Any, ClassVar, final
+
+from pydantic_core import SchemaSerializer, SchemaValidator, from_json, to_json
+from typing_extensions import Doc
+
+from ..utils import external
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover
+    cbor2 = None
+
+
+@external
+class Codec:
+    """
+    Base class of the wire codecs used to encode and decode `Message` payloads.
+
+    Custom codecs define the *content type* and implement `dumps()` and `loads()`
+    of JSON-compatible data.
+
+    **Example**
+
+    ```python
+    import pickle
+
+    from message_flow import Codec, Codecs
+
+
+    class PickleCodec(Codec):
+        content_type = "application/x-pickle"
+
+        def dumps(self, data):
+            return pickle.dumps(data)
+
+        def loads(self, raw):
+            return pickle.loads(raw)
+
+
+    Codecs.register(PickleCodec())
+    ```
+    """
+
+    content_type: ClassVar[str]
+
+    def dumps(self, data: Annotated[Any, Doc("JSON-compatible data to encode.")]) -> bytes:
+        """
+        Encode JSON-compatible data to bytes.
+        """
+        raise NotImplementedError
+
+    def loads(self, raw: Annotated[bytes | memoryview, Doc("Encoded data.")]) -> Any:
+        """
+        Decode bytes to JSON-compatible data.
+        """
+        raise NotImplementedError
+
+    def encode(self, serializer: SchemaSerializer, value: dict[str, Any]) -> bytes:
+        return self.dumps(serializer.to_python(value, mode="json"))
+
+    def decode(self, validator: SchemaValidator, raw: bytes | memoryview, strict: bool = False) -> Any:
+        return validator.validate_python(self.loads(raw), strict=strict)
+
+
+@final
+@external
+class JsonCodec(Codec):
+    """
+    Compact JSON codec, encoded and decoded by pydantic-core without intermediate objects.
+    """
+
+    content_type = "application/json"
+
+    def dumps(self, data: Any) -> bytes:
+        return to_json(data)
+
+    def loads(self, raw: bytes | memoryview) -> Any:
+        return from_json(raw.tobytes() if isinstance(raw, memoryview) else raw)
+
+    def encode(self, serializer: SchemaSerializer, value: dict[str, Any]) -> bytes:
+        return serializer.to_json(value)
+
+    def decode(self, validator: SchemaValidator, raw: bytes | memoryview, strict: bool = False) -> Any:
+        return validator.validate_json(raw.tobytes() if isinstance(raw, memoryview) else raw, strict=strict)
+
+
+@final
+@external
+class MsgPackCodec(Codec):
+    """
+    MessagePack codec.
+
+    **Note:** Requires the `msgpack` package.
+    """
+
+    content_type = "application/msgpack"
+
+    def dumps(self, data: Any) -> bytes:
+        if msgpack is None:
+            raise ImportError("Please install `msgpack` to use MessagePack codec.")
+
+        return msgpack.packb(data)
+
+    def loads(self, raw: bytes | memoryview) -> Any:
+        if msgpack is None:
+            raise ImportError("Please install `msgpack` to use MessagePack codec.")
+
+        return msgpack.unpackb(raw)
+
+
+@final
+@external
+class CborCodec(Codec):
+    """
+    CBOR codec.
+
+    **Note:** Requires the `cbor2` package.
+    """
+
+    content_type = "application/cbor"
+
+    def dumps(self, data: Any) -> bytes:
+        if cbor2 is None:
+            raise ImportError("Please install `cbor2` to use CBOR codec.")
+
+        return cbor2.dumps(data)
+
+    def loads(self, raw: bytes | memoryview) -> Any:
+        if cbor2 is None:
+            raise ImportError("Please install `cbor2` to use CBOR codec.")
+
+        return cbor2.loads(raw)
+
+
+@final
+@external
+class Codecs:
+    """
+    Registry of the wire codecs, by *content type*.
+
+    The *content type* of the payload travels in the `content-type` header.
+    """
+
+    HEADER: ClassVar[str] = "content-type"
+    DEFAULT: ClassVar[str] = JsonCodec.content_type
+
+    _codecs: ClassVar[dict[str, Codec]] = {}
+
+    @classmethod
+    def register(cls, codec: Annotated[Codec, Doc("The codec to register for its content type.")]) -> None:
+        """
+        Register the codec, replacing the one registered for the same *content type*.
+        """
+        cls._codecs[codec.content_type] = codec
+
+    @classmethod
+    def get(cls, content_type: Annotated[str, Doc("The content type of the payload.")]) -> Codec:
+        """
+        Find the codec of the *content type*.
+
+        Raises:
+            ValueError: Raised when no codec is registered for the *content type*.
+        """
+        if (codec := cls._codecs.get(content_type)) is None:
+            raise ValueError(f"Codec for {content_type!r} content type is not registered.")
+
+        return codec
+
+
+Codecs.register(JsonCodec())
+Codecs.register(MsgPackCodec())
+Codecs.register(CborCodec())
@@ -7,6 +7,7 @@ from pydantic_core import PydanticUndefined as Undefined
 from typing_extensions import Doc
 
 from ..utils import external
+from .validation_policy import ValidationPolicy
 
 
 @final
@@ -272,8 +273,13 @@ class Header(FieldInfo):
         return getattr(obj, self._private_name)
 
     def __set__(self, obj: Any, value: Any) -> None:
-        self._validate(value)
+        if (policy := type(obj).message_info.get("validation", ValidationPolicy.LAX)).should_validate():
+            value = self._validate(value, policy.strict)
+
         setattr(obj, self._private_name, value)
 
-    def _validate(self, value) -> None:
-        TypeAdapter(Annotated[self.annotation, self]).validate_python(value)
+    def _validate(self, value: Any, strict: bool = False) -> Any:
+        if not hasattr(self, "_type_adapter"):
+            self._type_adapter = TypeAdapter(Annotated[self.annotation, self])
+
+        return self._type_adapter.validate_python(value, strict=strict)
@@ -1,15 +1,16 @@
-import json
-from typing import TYPE_CHECKING, Annotated, Any, ClassVar
+from typing import TYPE_CHECKING, Annotated, ClassVar
 
 from pydantic import BaseModel, create_model
 from typing_extensions import Doc
 
 from ..shared import Components, Reference
 from ..utils import external
-from ._internal import MessageMeta
+from ._internal import MessageDecoder, MessageMeta
+from .codec import Codec, Codecs
 from .header import Header
 from .message_info import MessageInfo
 from .payload import Payload
+from .validation_policy import ValidationPolicy
 
 
 @external
@@ -26,6 +27,15 @@ class Message(metaclass=MessageMeta):
         product_id: str = Payload()
         tenant_id: str = Header()
     ```
+
+    Instances of `Messages` declared with `slots=True` store attributes in
+    `__slots__` instead of `__dict__`, which reduces their memory footprint.
+
+    ```python
+    class OrderCreated(Message, slots=True):
+        order_id: str = Payload()
+        tenant_id: str = Header()
+    ```
     """
 
     if TYPE_CHECKING:
@@ -33,6 +43,12 @@ class Message(metaclass=MessageMeta):
         __async_api_components__: ClassVar[Components]
         __async_api_reference__: ClassVar[Reference]
 
+        def __encode_payload__(self, codec: Codec) -> bytes: ...
+
+        def __encode_headers__(self) -> dict[str, str]: ...
+
+    __slots__ = ("_headers", "_payload", "_content_type")
+
     message_info: Annotated[MessageInfo, Doc("Declare additional information of the `Message`.")] = MessageInfo()
 
     def __str__(self) -> str:
@@ -57,10 +73,7 @@ class Message(metaclass=MessageMeta):
             dict[str, str]: The message headers.
         """
         if not hasattr(self, "_headers"):
-            headers_model = self.headers_model()
-            self._headers = headers_model(
-                **{header_name: getattr(self, header_name) for header_name in self.headers_attributes()}
-            ).model_dump()
+            self._headers = self.__encode_headers__()
 
         return self._headers
 
@@ -73,16 +86,36 @@ class Message(metaclass=MessageMeta):
             bytes: The message payload.
         """
         if not hasattr(self, "_payload"):
-            payload_model = self.payload_model()
-            self._payload = (
-                payload_model(
-                    **{payload_name: getattr(self, payload_name) for payload_name in self.payload_attributes()}
-                )
-                .model_dump_json()
-                .encode()
-            )
+            self._payload = self.__encode_payload__(Codecs.get(self.content_type))
+
         return self._payload
 
+    @property
+    def content_type(self) -> str:
+        """
+        The content type of the message payload.
+
+        Returns:
+            str: The content type declared in `MessageInfo`, JSON by default.
+        """
+        if not hasattr(self, "_content_type"):
+            self._content_type = self.message_info.get("content_type", Codecs.DEFAULT)
+
+        return self._content_type
+
+    def set_default_content_type(self, content_type: str) -> None:
+        """
+        Encode the payload with the *content type*, e.g. the one of the `Channel`,
+        unless the `Message` declares its own.
+        """
+        if "content_type" in self.message_info or content_type == self.content_type:
+            return
+
+        self._content_type = content_type
+
+        if hasattr(self, "_payload"):
+            del self._payload
+
     @classmethod
     def headers_attributes(cls) -> list[str]:
         if not hasattr(cls, "_headers_attributes"):
@@ -153,17 +186,16 @@ class Message(metaclass=MessageMeta):
         return cls._payload_model
 
     @classmethod
-    def from_payload_and_headers(cls, raw_payload: bytes, raw_headers: dict[str, str]) -> "Message":
-        payload_obj = cls.payload_model()(**json.loads(raw_payload.decode()))
-        payload: dict[str, Any] = {
-            payload_name: getattr(payload_obj, payload_name) for payload_name in cls.payload_attributes()
-        }
-
-        headers_obj = cls.headers_model()(**raw_headers)
-        headers: dict[str, Any] = {
-            header_name: getattr(headers_obj, header_name) for header_name in cls.headers_attributes()
-        }
-        return cls(**payload, **headers)
+    def from_payload_and_headers(
+        cls,
+        raw_payload: bytes | memoryview,
+        raw_headers: dict[str, str],
+        validation: ValidationPolicy | None = None,
+    ) -> "Message":
+        if (decoder := cls.__dict__.get("_message_decoder")) is None:
+            cls._message_decoder = decoder = MessageDecoder(cls)
+
+        return decoder.decode(raw_payload, raw_headers, validation)
 
     def add_routing_headers(self, extra_headers: dict[str, str]) -> None:
         self.headers.update(extra_headers)
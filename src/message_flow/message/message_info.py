@@ -5,6 +5,7 @@ from typing_extensions import Doc
 from ..utils import external
 from .correlation_id import CorrelationId
 from .message_trait import MessageTrait
+from .validation_policy import ValidationPolicy
 
 
 @external
@@ -113,6 +114,52 @@ class MessageInfo(TypedDict, total=False):
             """
         ),
     ]
+    content_type: Annotated[
+        str,
+        Doc(
+            """
+            The content type of the message payload, used to select the codec from `Codecs`.
+
+            **Note:** When absent, the content type of the `Channel` or JSON is used.
+
+            **Example**
+
+            ```python
+            from message_flow import Message, Payload, MessageInfo
+
+            class CreateOrder(Message):
+                message_info = MessageInfo(
+                    content_type="application/msgpack",
+                )
+
+                product_id: str = Payload()
+            ```
+            """
+        ),
+    ]
+    validation: Annotated[
+        ValidationPolicy,
+        Doc(
+            """
+            The validation policy of the message attributes on construction and decoding.
+
+            **Note:** The policy of the `Channel` takes precedence on decoding.
+
+            **Example**
+
+            ```python
+            from message_flow import Message, Payload, MessageInfo, ValidationPolicy
+
+            class CreateOrder(Message):
+                message_info = MessageInfo(
+                    validation=ValidationPolicy.sampled(0.01),
+                )
+
+                product_id: str = Payload()
+            ```
+            """
+        ),
+    ]
     traits: Annotated[
         list[type[MessageTrait]],
         Doc(
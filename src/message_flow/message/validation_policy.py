@@ -0,0 +1,79 @@
+import random
+from typing import Annotated, ClassVar, Literal, final
+
+from typing_extensions import Doc
+
+from ..utils import external
+
+ValidationMode = Literal["strict", "lax", "trusted", "sampled"]
+
+
+@final
+@external
+class ValidationPolicy:
+    """
+    Declare how `Message` attributes are validated on construction, assignment and decoding.
+    Validated attributes store the validated value, e.g. `"1"` assigned to an `int` attribute is stored as `1`.
+
+    - `STRICT` validates without type coercion.
+    - `LAX` validates with type coercion, the default.
+    - `TRUSTED` skips validation, values are stored as given or decoded.
+    - `sampled(rate)` validates the given fraction of `Messages` and trusts the rest.
+
+    **Note:** Trusted values are not converted, e.g. nested models decoded from
+    a payload stay plain data, so use it only for data validated upstream.
+
+    **Example**
+
+    ```python
+    from message_flow import Message, MessageInfo, Payload, ValidationPolicy
+
+    class OrderCreated(Message):
+        message_info = MessageInfo(validation=ValidationPolicy.TRUSTED)
+
+        order_id: str = Payload()
+    ```
+    """
+
+    STRICT: ClassVar["ValidationPolicy"]
+    LAX: ClassVar["ValidationPolicy"]
+    TRUSTED: ClassVar["ValidationPolicy"]
+
+    def __init__(
+        self,
+        mode: Annotated[ValidationMode, Doc("The validation mode.")] = "lax",
+        rate: Annotated[float, Doc("The fraction of `Messages` validated in the *sampled* mode.")] = 1.0,
+    ) -> None:
+        if mode not in ("strict", "lax", "trusted", "sampled"):
+            raise ValueError("Validation mode should be one of strict, lax, trusted, sampled.")
+
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("Validation rate should be between 0 and 1.")
+
+        self.mode = mode
+        self.rate = rate
+        self.strict = mode == "strict"
+
+    def __repr__(self) -> str:
+        return f"ValidationPolicy({self.mode!r}, rate={self.rate})"
+
+    @classmethod
+    def sampled(cls, rate: Annotated[float, Doc("The fraction of `Messages` to validate.")]) -> "ValidationPolicy":
+        """
+        Validate the *rate* fraction of `Messages` chosen at random and trust the rest.
+        """
+        return cls("sampled", rate)
+
+    def should_validate(self) -> bool:
+        """
+        Decide whether the next `Message` should be validated.
+        """
+        if self.mode == "trusted":
+            return False
+
+        return self.mode != "sampled" or random.random() < self.rate
+
+
+ValidationPolicy.STRICT = ValidationPolicy("strict")
+ValidationPolicy.LAX = ValidationPolicy("lax")
+ValidationPolicy.TRUSTED = ValidationPolicy("trusted")
@@ -1,3 +1,11 @@
-from ..utils import init_package
+from ..utils import lazy_package
 
-init_package(__name__)
+_exports = {
+    "ActionType": "action_type",
+    "Operation": "operation",
+    "OperationBatch": "operation_batch",
+    "OperationReply": "operation_reply",
+}
+
+__all__ = list(_exports)
+__getattr__, __dir__ = lazy_package(__name__, _exports)
@@ -1,3 +1,4 @@
-from .action_type import *
-from .operation import *
-from .operation_reply import *
+from .action_type import ActionType as ActionType
+from .operation import Operation as Operation
+from .operation_batch import OperationBatch as OperationBatch
+from .operation_reply import OperationReply as OperationReply
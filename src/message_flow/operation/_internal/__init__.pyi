@@ -1,3 +1,4 @@
-from .operation_construction import *
-from .operation_info import *
-from .operation_schema import *
+from .operation_construction import OperationMeta as OperationMeta
+from .operation_info import OperationInfo as OperationInfo
+from .operation_schema import OperationReplySchema as OperationReplySchema
+from .operation_schema import OperationSchema as OperationSchema
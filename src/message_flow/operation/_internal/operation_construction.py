@@ -23,13 +23,21 @@ class OperationMeta(ABCMeta):
             return wrapper
 
         cls.__init__ = decorated_init(cls.__init__)
+        cls.__async_api_components__ = property(mcs._make_components)
 
         return cls
 
     @staticmethod
     def __post_init__(operation: "Operation") -> None:
         operation.__async_api_reference__ = Reference.for_operation(operation.operation_id)
-        operation.__async_api_components__ = Components()
+        operation._async_api_components = None
+
+    @staticmethod
+    def _make_components(operation: "Operation") -> Components:
+        if operation._async_api_components is not None:
+            return operation._async_api_components
+
+        operation._async_api_components = components = Components()
 
         channel_ref = Reference.for_channel(operation.operation_info["channel"])
         message_ref = channel_ref.merge(operation.message.__async_api_reference__)
@@ -55,4 +63,6 @@ class OperationMeta(ABCMeta):
                 messages=[operation.reply.message.__async_api_reference__.as_direct_component()],  # type: ignore
             )
 
-        operation.__async_api_components__.add_operation(operation.operation_id, schema)  # type: ignore
+        components.add_operation(operation.operation_id, schema)  # type: ignore
+
+        return components
@@ -1,10 +1,11 @@
-from typing import TYPE_CHECKING, Any, Callable, final
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, final
 
 from ..message import Message
 from ..shared import Components, Reference
 from ..utils import internal
 from ._internal import OperationInfo, OperationMeta
 from .action_type import ActionType
+from .operation_batch import OperationBatch
 from .operation_reply import OperationReply
 
 
@@ -14,6 +15,7 @@ class Operation(metaclass=OperationMeta):
     if TYPE_CHECKING:
         __async_api_components__: Components
         __async_api_reference__: Reference
+        _async_api_components: Components | None
 
     def __init__(
         self,
@@ -21,7 +23,8 @@ class Operation(metaclass=OperationMeta):
         message: type[Message],
         reply: type[Message] | None = None,
         reply_channel: str | None = None,
-        handler: Callable[[Message], Message | None] | None = None,
+        handler: Callable[[Message], Message | None | Awaitable[Message | None]] | None = None,
+        batch: OperationBatch | None = None,
         *,
         channel: str,
         title: str | None,
@@ -32,6 +35,7 @@ class Operation(metaclass=OperationMeta):
         self.message = message
         self.reply = OperationReply(message=reply, channel=reply_channel)
         self.handler = handler
+        self.batch = batch
 
         if not self.reply.is_valid:
             raise RuntimeError("You should provide both reply and reply channel address.")
@@ -43,7 +47,7 @@ class Operation(metaclass=OperationMeta):
             description=description,
         )
 
-    def __call__(self, message: Message) -> Message | None:
+    def __call__(self, message: Message) -> Message | None | Awaitable[Message | None]:
         if self.handler is None:
             raise RuntimeError(f"Handler not defined for {self.message}")
 
@@ -100,6 +104,7 @@ class Operation(metaclass=OperationMeta):
         cls,
         message: type[Message],
         handler: Any,
+        batch: OperationBatch | None = None,
         *,
         channel: str,
         title: str | None = None,
@@ -110,6 +115,7 @@ class Operation(metaclass=OperationMeta):
             action=ActionType.RECEIVE,
             message=message,
             handler=handler,
+            batch=batch,
             channel=channel,
             title=title,
             summary=summary,
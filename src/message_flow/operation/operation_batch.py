@@ -0,0 +1,14 @@
+from ..utils import internal
+
+
+@internal
+class OperationBatch:
+    def __init__(self, max_size: int, max_wait: float) -> None:
+        if max_size < 1:
+            raise ValueError("Batch size should be positive.")
+
+        if max_wait <= 0:
+            raise ValueError("Batch wait time should be positive.")
+
+        self.max_size = max_size
+        self.max_wait = max_wait
@@ -1,2 +1,2 @@
-from .components import *
-from .reference import *
+from .components import Components as Components
+from .reference import Reference as Reference
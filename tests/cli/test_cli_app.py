@@ -0,0 +1,123 @@
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+import typer
+
+from message_flow import LogMessageProducer
+
+APP_MODULE = textwrap.dedent(
+    """
+    import os
+    import threading
+
+    from message_flow import LogMessageConsumer, Message, MessageFlow, Payload
+
+    DIRECTORY = os.environ["WORKERS_DIRECTORY"]
+
+
+    class ForkSafeConsumer:
+        fork_safe = True
+
+        def __init__(self):
+            self._closed = threading.Event()
+
+        def subscribe(self, channels, handler):
+            pass
+
+        def start_consuming(self):
+            open(os.path.join(DIRECTORY, str(os.getpid())), "w").close()
+            self._closed.wait()
+            open(os.path.join(DIRECTORY, f"{os.getpid()}.drained"), "w").close()
+
+        def close(self):
+            self._closed.set()
+
+
+    app = MessageFlow(message_consumer=ForkSafeConsumer())
+    default_app = MessageFlow()
+    log_app = MessageFlow(message_consumer=LogMessageConsumer(os.environ["LOG_DIRECTORY"]))
+
+
+    class Ping(Message):
+        n: int = Payload()
+
+
+    @log_app.subscribe(address="pings", message=Ping)
+    def handle_ping(ping: Ping) -> None:
+        with open(os.path.join(DIRECTORY, f"{os.getpid()}.handled"), "a") as fp:
+            fp.write(f"{ping.n}\\n")
+    """
+)
+
+DISPATCH_SCRIPT = "import sys; from message_flow.cli._cli_app import CLIApp; CLIApp(sys.argv[1]).dispatch(workers=2)"
+
+
+def wait_for(condition, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def app_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "app.py").write_text(APP_MODULE)
+    (tmp_path / "workers").mkdir()
+    monkeypatch.setenv("WORKERS_DIRECTORY", str(tmp_path / "workers"))
+    monkeypatch.setenv("LOG_DIRECTORY", str(tmp_path / "log"))
+    monkeypatch.chdir(tmp_path)
+
+    return tmp_path
+
+
+def test_cli_app__dispatches_with_workers_and_drains_on_stop(app_directory: Path):
+    workers = app_directory / "workers"
+    supervisor = subprocess.Popen([sys.executable, "-c", DISPATCH_SCRIPT, "app:app"])
+
+    try:
+        wait_for(lambda: len(os.listdir(workers)) == 2)
+        supervisor.send_signal(signal.SIGTERM)
+        assert supervisor.wait(timeout=10) == 0
+    finally:
+        supervisor.kill()
+
+    started = {path for path in os.listdir(workers) if "." not in path}
+
+    assert 2 == len(started)
+    assert {f"{pid}.drained" for pid in started} == {path for path in os.listdir(workers) if "." in path}
+
+
+def test_cli_app__refuses_workers_for_consumer_that_is_not_fork_safe(app_directory: Path):
+    from message_flow.cli._cli_app import CLIApp
+
+    with pytest.raises(typer.BadParameter):
+        CLIApp("app:default_app").dispatch(workers=2)
+
+
+def test_cli_app__shares_log_partitions_between_workers(app_directory: Path):
+    producer = LogMessageProducer(app_directory / "log", partitions=4)
+    headers = {"message-type": "Ping", "channel-address": "pings"}
+    producer.send_many("pings", [(b'{"n":%d}' % n, headers) for n in range(40)])
+    producer.close()
+
+    workers = app_directory / "workers"
+    supervisor = subprocess.Popen([sys.executable, "-c", DISPATCH_SCRIPT, "app:log_app"])
+
+    def handled() -> list[list[int]]:
+        return [[int(n) for n in (workers / path).read_text().split()] for path in os.listdir(workers)]
+
+    try:
+        wait_for(lambda: sum(len(numbers) for numbers in handled()) >= 40)
+        supervisor.send_signal(signal.SIGTERM)
+        assert supervisor.wait(timeout=10) == 0
+    finally:
+        supervisor.kill()
+
+    assert 2 == len(handled())
+    assert list(range(40)) == sorted(n for numbers in handled() for n in numbers)
@@ -0,0 +1,118 @@
+import gzip
+import hashlib
+import json
+import threading
+from http.client import HTTPConnection
+
+import pytest
+
+from message_flow import Message, MessageFlow, Payload
+from message_flow.cli._documentation_server import DocumentationServer
+
+
+class OrderCreated(Message):
+    order_id: str = Payload()
+
+
+@pytest.fixture
+def app():
+    app = MessageFlow(title="Orders")
+
+    @app.subscribe(address="orders", message=OrderCreated)
+    def handle_order_created(event: OrderCreated) -> None: ...
+
+    return app
+
+
+@pytest.fixture
+def connection(app: MessageFlow):
+    server = DocumentationServer(app.generate_docs_page(), app.async_api_schema, "localhost", 0)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+
+    connection = HTTPConnection(*server.address, timeout=5)
+    yield connection
+
+    connection.close()
+    server.shutdown()
+    thread.join()
+
+
+def get(connection: HTTPConnection, path: str, **headers: str) -> tuple[int, dict[str, str], bytes]:
+    connection.request("GET", path, headers={name.replace("_", "-"): value for name, value in headers.items()})
+    response = connection.getresponse()
+
+    return response.status, dict(response.getheaders()), response.read()
+
+
+def test_json_schema_is_served_with_content_hash_etag(app: MessageFlow, connection: HTTPConnection):
+    status, headers, body = get(connection, "/asyncapi.json")
+
+    assert 200 == status
+    assert "application/json" == headers["Content-Type"]
+    assert f'"{hashlib.sha256(body).hexdigest()}"' == headers["ETag"]
+    assert app.async_api_schema.content == body
+
+
+def test_yaml_schema_is_served(connection: HTTPConnection):
+    yaml = pytest.importorskip("yaml")
+
+    status, headers, body = get(connection, "/asyncapi.yaml")
+
+    assert 200 == status
+    assert "application/yaml" == headers["Content-Type"]
+    assert "Orders" == yaml.safe_load(body)["info"]["title"]
+
+
+def test_matching_if_none_match_is_not_modified(connection: HTTPConnection):
+    _, headers, _ = get(connection, "/asyncapi.json")
+
+    status, revalidated, body = get(connection, "/asyncapi.json", If_None_Match=headers["ETag"])
+
+    assert 304 == status
+    assert headers["ETag"] == revalidated["ETag"]
+    assert b"" == body
+
+
+def test_gzip_is_served_when_accepted(connection: HTTPConnection):
+    _, _, plain = get(connection, "/async-api-docs")
+
+    status, headers, body = get(connection, "/async-api-docs", Accept_Encoding="br, gzip")
+
+    assert 200 == status
+    assert "gzip" == headers["Content-Encoding"]
+    assert plain == gzip.decompress(body)
+
+
+def test_unknown_path_is_not_found(connection: HTTPConnection):
+    status, _, body = get(connection, "/missing")
+
+    assert 404 == status
+    assert b"404 Not Found" == body
+
+
+def test_schema_etag_matches_between_endpoints(app: MessageFlow, connection: HTTPConnection):
+    _, headers, body = get(connection, "/asyncapi.json")
+
+    assert json.loads(body) == json.loads(app.make_async_api_schema())
+    assert app.async_api_schema.etag == headers["ETag"]
+
+
+def test_servers_in_one_process_keep_their_own_pages(app: MessageFlow, connection: HTTPConnection):
+    other_app = MessageFlow(title="Payments")
+    other = DocumentationServer(other_app.generate_docs_page(), other_app.async_api_schema, "localhost", 0)
+    thread = threading.Thread(target=other.serve, daemon=True)
+    thread.start()
+
+    try:
+        other_connection = HTTPConnection(*other.address, timeout=5)
+        _, _, other_body = get(other_connection, "/asyncapi.json")
+        other_connection.close()
+    finally:
+        other.shutdown()
+        thread.join()
+
+    _, _, body = get(connection, "/asyncapi.json")
+
+    assert "Orders" == json.loads(body)["info"]["title"]
+    assert "Payments" == json.loads(other_body)["info"]["title"]
@@ -0,0 +1,66 @@
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+SUPERVISOR_SCRIPT = textwrap.dedent(
+    """
+    import os
+    import sys
+    import threading
+
+    from message_flow.cli._prefork_supervisor import PreforkSupervisor
+    from message_flow.utils import logger
+
+    directory = sys.argv[1]
+    stopped = threading.Event()
+
+
+    def target(worker):
+        path = os.path.join(directory, str(os.getpid()))
+        if len(os.listdir(directory)) < 3:
+            with open(path, "w") as fp:
+                fp.write(str(worker))
+            raise RuntimeError("Worker crashed")
+
+        try:
+            with open(path, "w") as fp:
+                fp.write(str(worker))
+            stopped.wait()
+        finally:
+            with open(path + ".stopped", "w") as fp:
+                fp.write(str(worker))
+
+
+    PreforkSupervisor.RESTART_DELAY = 0.01
+    PreforkSupervisor(target, stopped.set, 2, logger).run()
+    """
+)
+
+
+def wait_for(condition, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_prefork_supervisor__restarts_and_stops_workers(tmp_path: Path):
+    supervisor = subprocess.Popen([sys.executable, "-c", SUPERVISOR_SCRIPT, str(tmp_path)])
+
+    try:
+        wait_for(lambda: len([path for path in os.listdir(tmp_path) if "." not in path]) >= 5)
+        supervisor.send_signal(signal.SIGTERM)
+        assert supervisor.wait(timeout=10) == 0
+    finally:
+        supervisor.kill()
+
+    workers = [path for path in os.listdir(tmp_path) if "." not in path]
+    stopped = [path for path in os.listdir(tmp_path) if path.endswith(".stopped")]
+
+    assert len(workers) >= 5
+    assert {"0", "1"} == {(tmp_path / path).read_text() for path in workers}
+    assert ["0", "1"] == sorted((tmp_path / path).read_text() for path in stopped)
@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from message_flow import Channel, Codec, Codecs, Header, Message, MessageFlow, MessageInfo, Payload
+
+from ..message_flow.message_flow_unit_test_support.recording_message_producer import RecordingMessageProducer
+
+
+class ReversedJsonCodec(Codec):
+    content_type = "application/x-reversed-json"
+
+    def dumps(self, data):
+        return json.dumps(data).encode()[::-1]
+
+    def loads(self, raw):
+        return json.loads(bytes(raw)[::-1])
+
+
+Codecs.register(ReversedJsonCodec())
+
+
+def test_codec__message_content_type():
+    class Example(Message):
+        message_info = MessageInfo(content_type=ReversedJsonCodec.content_type)
+
+        p1: int = Payload()
+        h1: str = Header()
+
+    test_message = Example(p1=1, h1="h1 value")
+
+    assert b'}1 :"1p"{' == test_message.payload
+    assert ReversedJsonCodec.content_type == Example.__async_api_components__.messages["Example"]["contentType"]
+
+    decoded = Example.from_payload_and_headers(test_message.payload, {"h1": "h1 value"})
+
+    assert 1 == decoded.p1
+
+
+def test_codec__decoder_selected_by_header():
+    class Example(Message):
+        p1: int = Payload()
+
+    decoded = Example.from_payload_and_headers(b'}1 :"1p"{', {Codecs.HEADER: ReversedJsonCodec.content_type})
+
+    assert 1 == decoded.p1
+    assert "application/json" == Example.__async_api_components__.messages["Example"]["contentType"]
+
+
+def test_codec__channel_content_type():
+    class Example(Message):
+        p1: int = Payload()
+
+    class Declared(Message):
+        message_info = MessageInfo(content_type="application/json")
+
+        p1: int = Payload()
+
+    channel = Channel("examples", content_type=ReversedJsonCodec.content_type)
+    channel.publish()(Example)
+    channel.publish()(Declared)
+
+    producer = RecordingMessageProducer()
+    app = MessageFlow(channels=[channel], message_producer=producer)
+
+    app.publish(Example(p1=1))
+    app.publish(Declared(p1=1))
+
+    (_, payload, headers), (_, declared_payload, declared_headers) = producer.sent
+
+    assert b'}1 :"1p"{' == payload
+    assert ReversedJsonCodec.content_type == headers[Codecs.HEADER]
+    assert 1 == Example.from_payload_and_headers(payload, headers).p1
+    assert b'{"p1":1}' == declared_payload
+    assert "application/json" == declared_headers[Codecs.HEADER]
+
+
+def test_codec__not_registered():
+    class Example(Message):
+        p1: int = Payload()
+
+    with pytest.raises(ValueError):
+        Example.from_payload_and_headers(b"", {Codecs.HEADER: "application/unknown"})
+
+
+def test_codec__msgpack():
+    msgpack = pytest.importorskip("msgpack")
+
+    class Example(Message):
+        message_info = MessageInfo(content_type="application/msgpack")
+
+        p1: int = Payload()
+
+    test_message = Example(p1=1)
+
+    assert {"p1": 1} == msgpack.unpackb(test_message.payload)
+    assert 1 == Example.from_payload_and_headers(test_message.payload, {}).p1
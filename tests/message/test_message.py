@@ -99,3 +99,61 @@ def test_message__explicit_constructor():
             def __init__(self, *, p1: str, h1: str) -> None:
                 self.p1 = p1
                 self.h1 = h1
+
+
+def test_message__deserialization_from_memoryview():
+    class Example(Message):
+        p1: int = Payload()
+        h1: str = Header("h1 value")
+
+    test_message = Example.from_payload_and_headers(memoryview(b'{"p1":"1","extra":true}'), {})
+
+    assert 1 == test_message.p1
+    assert "h1 value" == test_message.h1
+    assert b'{"p1":1}' == test_message.payload
+    assert {"h1": "h1 value"} == test_message.headers
+
+
+def test_message__deserialization__invalid_payload():
+    class Example(Message):
+        p1: int = Payload()
+
+    with pytest.raises(ValueError):
+        Example.from_payload_and_headers(b'{"p1":"not a number"}', {})
+
+
+def test_message__payload_and_headers__validated_values():
+    class Example(Message):
+        p1: int = Payload()
+        p2: list[float] = Payload(serialization_alias="ignored")
+        h1: int = Header()
+
+    test_message = Example(p1="1", p2=[1, "2.5"], h1="3")
+
+    assert 1 == test_message.p1
+    assert b'{"p1":1,"p2":[1.0,2.5]}' == test_message.payload
+    assert {"h1": 3} == test_message.headers
+
+
+def test_message__slots():
+    class Example(Message, slots=True):
+        p1: int = Payload()
+        h1: str = Header()
+
+    test_message = Example.from_payload_and_headers(b'{"p1":1}', {"h1": "h1 value"})
+
+    assert not hasattr(test_message, "__dict__")
+    assert b'{"p1":1}' == test_message.payload
+    assert {"h1": "h1 value"} == test_message.headers
+
+    with pytest.raises(AttributeError):
+        test_message.unknown = "value"  # type: ignore
+
+
+def test_message__explicit_slots():
+    with pytest.raises(RuntimeError):
+
+        class Example(Message, slots=True):
+            __slots__ = ("_p1",)
+
+            p1: str = Payload()
@@ -0,0 +1,146 @@
+from datetime import datetime
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from message_flow import Header, Message, MessageInfo, Payload, ValidationPolicy
+
+
+class Nested(BaseModel):
+    value: str
+
+
+def test_validation_policy__lax():
+    class Example(Message):
+        p1: int = Payload()
+
+    assert 1 == Example(p1="1").p1  # type: ignore
+    assert 1 == Example.from_payload_and_headers(b'{"p1":"1"}', {}).p1
+
+    with pytest.raises(ValidationError):
+        Example(p1="one")  # type: ignore
+
+
+def test_validation_policy__strict():
+    class Example(Message):
+        message_info = MessageInfo(validation=ValidationPolicy.STRICT)
+
+        p1: int = Payload()
+
+    assert 1 == Example(p1=1).p1
+
+    with pytest.raises(ValidationError):
+        Example(p1="1")  # type: ignore
+
+    with pytest.raises(ValidationError):
+        Example.from_payload_and_headers(b'{"p1":"1"}', {})
+
+
+def test_validation_policy__strict_decodes_payload_in_json_mode():
+    class Example(Message):
+        message_info = MessageInfo(validation=ValidationPolicy.STRICT)
+
+        created_at: datetime = Payload()
+        nested: Nested = Payload()
+        h1: int = Header()
+        h2: str = Header("default", alias="h-2")
+
+    message = Example.from_payload_and_headers(
+        b'{"created_at":"2024-05-01T00:00:00","nested":{"value":"v"}}',
+        {"h1": 1},  # type: ignore
+    )
+
+    assert (datetime(2024, 5, 1), Nested(value="v"), 1, "default") == (
+        message.created_at,
+        message.nested,
+        message.h1,
+        message.h2,
+    )
+
+    with pytest.raises(ValidationError):
+        Example.from_payload_and_headers(b'{"created_at":"2024-05-01T00:00:00","nested":{"value":"v"}}', {"h1": "1"})
+
+
+def test_validation_policy__lax_stores_coerced_values():
+    class Example(Message):
+        p1: float = Payload()
+        nested: Nested = Payload()
+        h1: int = Header()
+
+    message = Example(p1=1, nested={"value": "v"}, h1="2")  # type: ignore
+
+    assert (1.0, float, Nested(value="v"), 2) == (message.p1, type(message.p1), message.nested, message.h1)
+
+    message.nested = {"value": "w"}  # type: ignore
+    message.h1 = "3"  # type: ignore
+
+    assert (Nested(value="w"), 3) == (message.nested, message.h1)
+
+
+def test_validation_policy__strict_validates_assignment_without_coercion():
+    class Example(Message):
+        message_info = MessageInfo(validation=ValidationPolicy.STRICT)
+
+        p1: float = Payload()
+        h1: int = Header()
+
+    message = Example(p1=1, h1=2)
+    message.p1 = 2
+
+    assert (2.0, float) == (message.p1, type(message.p1))
+
+    with pytest.raises(ValidationError):
+        message.h1 = "3"  # type: ignore
+
+    assert 2 == message.h1
+
+
+def test_validation_policy__trusted():
+    class Example(Message):
+        message_info = MessageInfo(validation=ValidationPolicy.TRUSTED)
+
+        p1: int = Payload()
+        p2: Nested = Payload()
+        h1: str = Header("h1 value")
+
+    test_message = Example(p1="one", p2=Nested(value="value"))  # type: ignore
+
+    assert "one" == test_message.p1
+
+    decoded = Example.from_payload_and_headers(b'{"p1":"one","p2":{"value":"value"}}', {})
+
+    assert "one" == decoded.p1
+    assert {"value": "value"} == decoded.p2
+    assert "h1 value" == decoded.h1
+
+
+def test_validation_policy__overridden_on_decoding():
+    class Example(Message):
+        p1: int = Payload()
+
+    assert "one" == Example.from_payload_and_headers(b'{"p1":"one"}', {}, ValidationPolicy.TRUSTED).p1
+
+
+def test_validation_policy__sampled():
+    class Never(Message):
+        message_info = MessageInfo(validation=ValidationPolicy.sampled(0.0))
+
+        p1: int = Payload()
+
+    class Always(Message):
+        message_info = MessageInfo(validation=ValidationPolicy.sampled(1.0))
+
+        p1: int = Payload()
+
+    assert "one" == Never(p1="one").p1  # type: ignore
+
+    with pytest.raises(ValidationError):
+        Always(p1="one")  # type: ignore
+
+
+def test_validation_policy__invalid():
+    with pytest.raises(ValueError):
+        ValidationPolicy("unknown")  # type: ignore
+
+    with pytest.raises(ValueError):
+        ValidationPolicy.sampled(2.0)
@@ -0,0 +1,20 @@
+from typing import Awaitable, Callable
+
+from message_flow import AsyncMessageConsumer
+
+
+class FakeAsyncMessageConsumer(AsyncMessageConsumer):
+    def __init__(self, messages: list[tuple[bytes, dict[str, str]]]) -> None:
+        self.messages = messages
+        self.closed = False
+        self._handler: Callable[[bytes, dict[str, str]], Awaitable[None]] | None = None
+
+    def subscribe(self, channels: set[str], handler: Callable[[bytes, dict[str, str]], Awaitable[None]]) -> None:
+        self._handler = handler
+
+    async def start_consuming(self) -> None:
+        for payload, headers in self.messages:
+            await self._handler(payload, headers)
+
+    async def close(self) -> None:
+        self.closed = True
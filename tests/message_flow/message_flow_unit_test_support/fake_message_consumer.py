@@ -0,0 +1,42 @@
+from typing import Callable
+
+from message_flow import Message, MessageConsumer
+
+
+class FakeMessageConsumer(MessageConsumer):
+    def __init__(self, messages: list[tuple[bytes, dict[str, str]]]) -> None:
+        self.messages = messages
+        self.handlers: dict[str, Callable[[bytes, dict[str, str]], None]] = {}
+
+    def subscribe(self, channels: set[str], handler: Callable[[bytes, dict[str, str]], None]) -> None:
+        self.handlers.update({channel: handler for channel in channels})
+
+    def start_consuming(self) -> None:
+        for payload, headers in self.messages:
+            self.handlers[headers["channel-address"]](payload, headers)
+
+    def close(self) -> None: ...
+
+
+class FakeBatchMessageConsumer(FakeMessageConsumer):
+    def subscribe_batch(
+        self,
+        channels: set[str],
+        handler: Callable[[list[tuple[bytes, dict[str, str]]]], None],
+        max_size: int,
+        max_wait: float,
+    ) -> None:
+        self.batch_handler = handler
+        self.max_size = max_size
+
+    def start_consuming(self) -> None:
+        for start in range(0, len(self.messages), self.max_size):
+            self.batch_handler(self.messages[start : start + self.max_size])
+
+
+def make_messages(message: type[Message], channel: str, count: int) -> list[tuple[bytes, dict[str, str]]]:
+    messages = [message(value=str(number), correlation_id=str(number)) for number in range(count)]
+    return [
+        (message.payload, {**message.headers, "message-type": message.message_id, "channel-address": channel})
+        for message in messages
+    ]
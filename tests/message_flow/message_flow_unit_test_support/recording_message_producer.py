@@ -0,0 +1,17 @@
+from message_flow import MessageProducer
+
+
+class RecordingMessageProducer(MessageProducer):
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, bytes, dict[str, str]]] = []
+        self.batches: list[tuple[str, list[tuple[bytes, dict[str, str] | None]]]] = []
+        self.closed = False
+
+    def send(self, channel: str, payload: bytes, headers: dict[str, str] | None = None) -> None:
+        self.sent.append((channel, payload, headers or {}))
+
+    def send_many(self, channel: str, messages: list[tuple[bytes, dict[str, str] | None]]) -> None:
+        self.batches.append((channel, messages))
+
+    def close(self) -> None:
+        self.closed = True
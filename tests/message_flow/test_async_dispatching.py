@@ -0,0 +1,142 @@
+import asyncio
+import threading
+
+import pytest
+
+from message_flow import BaseMiddleware, Message, MessageFlow
+from message_flow.app._simple_messaging import SimpleMessageConsumer
+from message_flow.utils import logger
+
+from .message_flow_unit_test_support.fake_async_message_consumer import FakeAsyncMessageConsumer
+from .message_flow_unit_test_support.fake_message_producer import FakeMessageProducer
+from .message_flow_unit_test_support.message_flow_unit_test_support import MessageFlowUnitTestSupport
+
+
+def make_message(message: Message, channel: str) -> tuple[bytes, dict[str, str]]:
+    return message.payload, {**message.headers, "message-type": message.message_id, "channel-address": channel}
+
+
+def test_dispatch_async__concurrent_handlers(test_channel: str, test_message: type[Message]):
+    messages = [make_message(test_message(value=str(i), correlation_id=str(i)), test_channel) for i in range(3)]
+    consumer = FakeAsyncMessageConsumer(messages)
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+
+    handled: list[str] = []
+    all_started = asyncio.Event()
+    running = 0
+
+    @app.subscribe(test_channel, test_message)
+    async def handler(message) -> None:
+        nonlocal running
+        running += 1
+        if running == len(messages):
+            all_started.set()
+        await asyncio.wait_for(all_started.wait(), 1)
+        handled.append(message.value)
+
+    app.dispatch()
+
+    assert sorted(handled) == ["0", "1", "2"]
+    assert consumer.closed
+
+
+def test_dispatch_async__sync_handler_offloaded(test_channel: str, test_message: type[Message]):
+    consumer = FakeAsyncMessageConsumer([make_message(test_message(value="v", correlation_id="c"), test_channel)])
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+
+    threads: list[threading.Thread] = []
+
+    @app.subscribe(test_channel, test_message)
+    def handler(message) -> None:
+        threads.append(threading.current_thread())
+
+    asyncio.run(app.dispatch_async(max_in_flight=1))
+
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_dispatch_async__sync_consumer():
+    app = MessageFlow(message_consumer=SimpleMessageConsumer(logger, dry_run=True))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(app.dispatch_async())
+
+
+def test_dispatch_async__async_middleware(test_channel: str, test_message: type[Message]):
+    consumer = FakeAsyncMessageConsumer([make_message(test_message(value="v", correlation_id="c"), test_channel)])
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+
+    events: list[str] = []
+
+    class AsyncMiddleware(BaseMiddleware):
+        async def on_consume(self) -> None:
+            await asyncio.sleep(0)
+            events.append("on_consume")
+
+        async def after_consume(self, error: Exception | None = None) -> None:
+            events.append("after_consume")
+
+    app.add_middleware(AsyncMiddleware)
+
+    @app.subscribe(test_channel, test_message)
+    async def handler(message) -> None:
+        events.append("handler")
+
+    app.dispatch()
+
+    assert events == ["on_consume", "handler", "after_consume"]
+
+
+def test_dispatch_async__batches_by_size(test_channel: str, test_message: type[Message]):
+    consumer = FakeAsyncMessageConsumer(
+        [make_message(test_message(value=str(i), correlation_id=str(i)), test_channel) for i in range(5)]
+    )
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+
+    events: list[str] = []
+
+    class AsyncMiddleware(BaseMiddleware):
+        async def on_consume(self) -> None:
+            events.append(f"on_consume {self.headers['correlation_id']}")
+
+    app.add_middleware(AsyncMiddleware)
+
+    @app.subscribe(test_channel, test_message, batch_size=2, batch_wait=60)
+    async def handler(messages: list) -> None:
+        events.append(str([message.value for message in messages]))
+
+    asyncio.run(app.dispatch_async(max_in_flight=2))
+
+    assert events == [
+        "on_consume 0",
+        "on_consume 1",
+        "['0', '1']",
+        "on_consume 2",
+        "on_consume 3",
+        "['2', '3']",
+        "on_consume 4",
+        "['4']",
+    ]
+
+
+def test_dispatch_async__flushes_batch_after_wait(test_channel: str, test_message: type[Message]):
+    class SlowAsyncMessageConsumer(FakeAsyncMessageConsumer):
+        async def start_consuming(self) -> None:
+            for payload, headers in self.messages:
+                await self._handler(payload, headers)
+                await asyncio.sleep(0.2)
+
+    consumer = SlowAsyncMessageConsumer(
+        [make_message(test_message(value=str(i), correlation_id=str(i)), test_channel) for i in range(2)]
+    )
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+
+    batches: list[list[str]] = []
+
+    @app.subscribe(test_channel, test_message, batch_size=10, batch_wait=0.01)
+    def handler(messages: list) -> None:
+        batches.append([message.value for message in messages])
+
+    app.dispatch()
+
+    assert batches == [["0"], ["1"]]
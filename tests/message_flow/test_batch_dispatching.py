@@ -0,0 +1,85 @@
+import pytest
+
+from message_flow import Message, MessageFlow
+
+from .message_flow_unit_test_support.fake_message_consumer import (
+    FakeBatchMessageConsumer,
+    FakeMessageConsumer,
+    make_messages,
+)
+from .message_flow_unit_test_support.fake_message_producer import FakeMessageProducer
+from .message_flow_unit_test_support.message_flow_unit_test_support import MessageFlowUnitTestSupport
+
+
+def test_batch_dispatching__dispatcher_batching(test_channel: str, test_message: type[Message]):
+    consumer = FakeMessageConsumer(make_messages(test_message, test_channel, 5))
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+
+    batches: list[list[str]] = []
+
+    @app.subscribe(test_channel, test_message, batch_size=2, batch_wait=60)
+    def handler(messages: list) -> None:
+        batches.append([message.value for message in messages])
+
+    app.dispatch()
+
+    assert batches == [["0", "1"], ["2", "3"], ["4"]]
+
+
+def test_batch_dispatching__consumer_batching(test_channel: str, test_message: type[Message]):
+    consumer = FakeBatchMessageConsumer(make_messages(test_message, test_channel, 3))
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+
+    batches: list[list[str]] = []
+
+    @app.subscribe(test_channel, test_message, batch_size=2)
+    def handler(messages: list) -> None:
+        batches.append([message.value for message in messages])
+
+    app.dispatch()
+
+    assert batches == [["0", "1"], ["2"]]
+    assert test_channel not in consumer.handlers
+
+
+def test_batch_dispatching__failed_batch_releases_credit_once(test_channel: str, test_message: type[Message]):
+    consumer = FakeMessageConsumer(make_messages(test_message, test_channel, 4))
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+
+    @app.subscribe(test_channel, test_message, batch_size=2, batch_wait=60)
+    def handler(messages: list) -> None:
+        raise RuntimeError("Handler failed")
+
+    app.dispatch(max_in_flight=2)
+
+    assert (0, 0) == (app.dispatcher._flow_control._messages, app.dispatcher._flow_control._bytes)  # type: ignore
+
+
+def test_batch_dispatching__consumer_batching_with_flow_control(test_channel: str, test_message: type[Message]):
+    consumer = FakeBatchMessageConsumer(make_messages(test_message, test_channel, 5))
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+    in_flight: list[int] = []
+
+    @app.subscribe(test_channel, test_message, batch_size=3)
+    def handler(messages: list) -> None:
+        in_flight.append(app.dispatcher._flow_control._messages)  # type: ignore
+
+    app.dispatch(max_in_flight=2)
+
+    assert [3, 2] == in_flight
+    assert 0 == app.dispatcher._flow_control._messages  # type: ignore
+
+
+def test_batch_dispatching__consumer_errors_are_not_hidden(test_channel: str, test_message: type[Message]):
+    class BrokenBatchMessageConsumer(FakeBatchMessageConsumer):
+        def subscribe_batch(self, *args) -> None:
+            raise AttributeError("broken consumer")
+
+    consumer = BrokenBatchMessageConsumer(make_messages(test_message, test_channel, 1))
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+
+    @app.subscribe(test_channel, test_message, batch_size=3)
+    def handler(messages: list) -> None: ...
+
+    with pytest.raises(AttributeError, match="broken consumer"):
+        app.dispatch()
@@ -0,0 +1,104 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from message_flow import BufferedMessageProducer
+from message_flow.app.messaging import buffered_producer
+
+from .message_flow_unit_test_support.recording_message_producer import RecordingMessageProducer
+
+
+def test_buffered_producer__flush_on_size():
+    message_producer = RecordingMessageProducer()
+    producer = BufferedMessageProducer(message_producer, max_messages=2, max_bytes=5, linger=60)
+
+    producer.send("a", b"1")
+    producer.send("b", b"123456")
+    producer.send("a", b"2")
+
+    assert message_producer.batches == [("b", [(b"123456", None)]), ("a", [(b"1", None), (b"2", None)])]
+
+    producer.close()
+
+
+def test_buffered_producer__flush_on_linger():
+    message_producer = RecordingMessageProducer()
+    producer = BufferedMessageProducer(message_producer, linger=0.01)
+
+    producer.send("a", b"1")
+
+    deadline = time.monotonic() + 5
+    while not message_producer.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert message_producer.batches == [("a", [(b"1", None)])]
+
+    producer.close()
+
+
+def test_buffered_producer__flush_on_close():
+    message_producer = RecordingMessageProducer()
+    producer = BufferedMessageProducer(message_producer, linger=60)
+
+    producer.send("a", b"1")
+    producer.send("a", b"2")
+    producer.close()
+
+    assert message_producer.batches == [("a", [(b"1", None), (b"2", None)])]
+    assert producer.closed and message_producer.closed
+
+
+def test_buffered_producer__publishers_not_blocked_by_sending():
+    sending = threading.Event()
+    release = threading.Event()
+
+    class BlockingMessageProducer(RecordingMessageProducer):
+        def send_many(self, channel: str, messages: list[tuple[bytes, dict[str, str] | None]]) -> None:
+            if channel == "a":
+                sending.set()
+                release.wait(5)
+            super().send_many(channel, messages)
+
+    message_producer = BlockingMessageProducer()
+    producer = BufferedMessageProducer(message_producer, max_bytes=1, linger=60)
+    publisher = threading.Thread(target=producer.send, args=("a", b"1"))
+    publisher.start()
+    sending.wait(5)
+
+    started = time.monotonic()
+    producer.send("b", b"")
+
+    assert time.monotonic() - started < 1
+
+    release.set()
+    publisher.join()
+    producer.close()
+
+    assert message_producer.batches == [("a", [(b"1", None)]), ("b", [(b"", None)])]
+
+
+def test_buffered_producer__flusher_sleeps_while_buffers_are_empty(monkeypatch: pytest.MonkeyPatch):
+    calls = 0
+
+    def monotonic() -> float:
+        nonlocal calls
+        calls += 1
+        return time.monotonic()
+
+    monkeypatch.setattr(buffered_producer, "time", SimpleNamespace(monotonic=monotonic))
+    message_producer = RecordingMessageProducer()
+    producer = BufferedMessageProducer(message_producer, linger=0.001)
+
+    producer.send("a", b"1")
+    deadline = time.monotonic() + 5
+    while not message_producer.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    idle_calls = calls
+    time.sleep(0.1)
+
+    assert idle_calls == calls
+
+    producer.close()
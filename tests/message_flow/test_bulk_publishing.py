@@ -0,0 +1,88 @@
+import pytest
+
+from message_flow import Channel, Message, MessageFlow, MessageProducer
+
+from .message_flow_unit_test_support.recording_message_producer import RecordingMessageProducer
+
+
+class LoopingMessageProducer(MessageProducer):
+    def __init__(self) -> None:
+        self.messages: list[tuple[str, bytes]] = []
+
+    def send(self, channel: str, payload: bytes, headers: dict[str, str] | None = None) -> None:
+        self.messages.append((channel, payload))
+
+    def close(self) -> None: ...
+
+
+def test_publish_many__batches_per_channel(
+    test_channel: str,
+    another_test_channel: str,
+    test_message: type[Message],
+    another_test_message: type[Message],
+):
+    message_producer = RecordingMessageProducer()
+    app = MessageFlow(message_producer=message_producer)
+
+    channel = Channel(test_channel)
+    channel.publish()(test_message)
+    app.add_channel(channel)
+
+    messages = [
+        message(value=str(number), correlation_id=str(number))
+        for number in range(5)
+        for message in (test_message, another_test_message)
+    ]
+
+    app.publish_many(messages, channel_address=another_test_channel, batch_size=3)
+
+    assert [(address, len(batch)) for address, batch in message_producer.batches] == [
+        (test_channel, 3),
+        (another_test_channel, 3),
+        (test_channel, 2),
+        (another_test_channel, 2),
+    ]
+    assert all(
+        headers["channel-address"] == address for address, batch in message_producer.batches for _, headers in batch
+    )
+    assert [] == message_producer.sent
+
+
+def test_send_many__reply_address(
+    test_channel: str,
+    another_test_channel: str,
+    test_message: type[Message],
+    another_test_message: type[Message],
+):
+    message_producer = RecordingMessageProducer()
+    app = MessageFlow(message_producer=message_producer)
+
+    channel, reply_channel = Channel(test_channel), Channel(another_test_channel)
+    channel.send(another_test_message, reply_channel)(test_message)
+    app.add_channel(channel)
+
+    app.send_many(test_message(value=str(number), correlation_id=str(number)) for number in range(3))
+
+    [(address, batch)] = message_producer.batches
+    assert address == test_channel
+    assert [headers["reply-to-address"] for _, headers in batch] == [another_test_channel] * 3
+    assert [] == message_producer.sent
+
+
+def test_publish_many__fallback_to_send(test_channel: str, test_message: type[Message]):
+    message_producer = LoopingMessageProducer()
+    app = MessageFlow(message_producer=message_producer)
+
+    app.publish_many(
+        (test_message(value=str(number), correlation_id=str(number)) for number in range(3)),
+        channel_address=test_channel,
+    )
+
+    assert [channel for channel, _ in message_producer.messages] == [test_channel] * 3
+
+
+def test_publish_many__channel_not_found(test_message: type[Message]):
+    app = MessageFlow(message_producer=LoopingMessageProducer())
+
+    with pytest.raises(RuntimeError):
+        app.publish_many([test_message(value="value", correlation_id="correlation_id")])
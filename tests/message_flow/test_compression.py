@@ -0,0 +1,134 @@
+import gzip
+import zlib
+
+import pytest
+
+from message_flow import Channel, Compression, Message, MessageFlow
+
+from .message_flow_unit_test_support.fake_async_message_consumer import FakeAsyncMessageConsumer
+from .message_flow_unit_test_support.fake_message_consumer import FakeMessageConsumer
+from .message_flow_unit_test_support.recording_message_producer import RecordingMessageProducer
+
+
+@pytest.mark.parametrize("algorithm", Compression.ALGORITHMS)
+def test_compression__round_trip(test_channel: str, test_message: type[Message], algorithm: str):
+    channel = Channel(test_channel, compression=Compression(algorithm, threshold=100))  # type: ignore
+    channel.publish()(test_message)
+
+    producer = RecordingMessageProducer()
+    app = MessageFlow(channels=[channel], message_producer=producer)
+
+    app.publish(test_message(value="a" * 1000, correlation_id="1"))
+    app.publish(test_message(value="b", correlation_id="2"))
+
+    (_, compressed, compressed_headers), (_, small, small_headers) = producer.sent
+
+    assert algorithm == compressed_headers["content-encoding"]
+    assert len(compressed) < 1000
+    assert "content-encoding" not in small_headers
+    assert b'{"value":"b"}' == small
+
+    consumer = FakeMessageConsumer([(payload, headers) for _, payload, headers in producer.sent])
+    consuming_app = MessageFlow(message_consumer=consumer, message_producer=RecordingMessageProducer())
+    values: list[str] = []
+
+    @consuming_app.subscribe(test_channel, test_message)
+    def handler(message: Message) -> None:
+        values.append(message.value)  # type: ignore
+
+    consuming_app.dispatch()
+
+    assert ["a" * 1000, "b"] == values
+    assert 1 == app.compression_stats.compressed_messages
+    assert app.compression_stats.ratio < 0.1
+    assert 1 == consuming_app.compression_stats.decompressed_messages
+
+
+def test_compression__incompressible_payload_sent_as_is(test_channel: str, test_message: type[Message]):
+    channel = Channel(test_channel, compression=Compression(threshold=0))
+    channel.publish()(test_message)
+
+    producer = RecordingMessageProducer()
+    app = MessageFlow(channels=[channel], message_producer=producer)
+
+    app.publish(test_message(value="", correlation_id="1"))
+
+    [(_, payload, headers)] = producer.sent
+
+    assert b'{"value":""}' == payload
+    assert "content-encoding" not in headers
+
+
+def test_compression__header_removed_on_resend(
+    test_channel: str, another_test_channel: str, test_message: type[Message]
+):
+    producer = RecordingMessageProducer()
+    app = MessageFlow(message_producer=producer)
+    message = test_message(value="a" * 1000, correlation_id="1")
+
+    app.producer.send(test_channel, message, compression=Compression(threshold=0))
+    app.producer.send(another_test_channel, message)
+
+    assert zlib.decompress(producer.sent[0][1]) == producer.sent[1][1]
+    assert "content-encoding" not in producer.sent[1][2]
+
+
+@pytest.mark.parametrize("consumer_type", [FakeMessageConsumer, FakeAsyncMessageConsumer])
+def test_compression__reply_uses_reply_channel_compression(
+    test_channel: str,
+    another_test_channel: str,
+    test_message: type[Message],
+    another_test_message: type[Message],
+    consumer_type: type,
+):
+    request = test_message(value="request", correlation_id="1")
+    consumer = consumer_type(
+        [
+            (
+                request.payload,
+                {
+                    **request.headers,
+                    "message-type": request.message_id,
+                    "channel-address": test_channel,
+                    "reply-to-address": another_test_channel,
+                },
+            )
+        ]
+    )
+    producer = RecordingMessageProducer()
+    reply_channel = Channel(another_test_channel, compression=Compression("gzip", threshold=100))
+    app = MessageFlow(channels=[reply_channel], message_consumer=consumer, message_producer=producer)
+
+    @app.subscribe(test_channel, test_message)
+    def handler(message: Message) -> Message:
+        return another_test_message(value="a" * 1000, correlation_id="1")
+
+    app.dispatch()
+
+    [(_, payload, headers)] = producer.sent
+
+    assert "gzip" == headers["content-encoding"]
+    assert b'{"value":"' + b"a" * 1000 + b'"}' == gzip.decompress(payload)
+    assert 1 == app.compression_stats.compressed_messages
+
+
+def test_compression__stats_skip_payloads_sent_uncompressed(test_channel: str, test_message: type[Message]):
+    channel = Channel(test_channel, compression=Compression(threshold=0))
+    channel.publish()(test_message)
+    app = MessageFlow(channels=[channel], message_producer=RecordingMessageProducer())
+
+    app.publish(test_message(value="", correlation_id="1"))
+
+    assert (0, 0, 0) == (
+        app.compression_stats.compressed_messages,
+        app.compression_stats.uncompressed_bytes,
+        app.compression_stats.compressed_bytes,
+    )
+
+
+def test_compression__invalid_configuration():
+    with pytest.raises(ValueError):
+        Compression("brotli")  # type: ignore
+
+    with pytest.raises(ValueError):
+        Compression(threshold=-1)
@@ -1,6 +1,10 @@
-from message_flow import Message
+import asyncio
+
+from message_flow import Message, MessageFlow
 
 from .message_flow_unit_test_support import MessageFlowUnitTestSupport
+from .message_flow_unit_test_support.fake_message_consumer import FakeMessageConsumer, make_messages
+from .message_flow_unit_test_support.fake_message_producer import FakeMessageProducer
 
 
 def test_dispatching__successful(
@@ -52,3 +56,20 @@ def test_dispatching__no_subscription(
         .expect_no_consume()
     )
     # fmt: on
+
+
+def test_dispatching__coroutine_handlers_share_event_loop(test_channel: str, test_message: type[Message]):
+    consumer = FakeMessageConsumer(make_messages(test_message, test_channel, 6))
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    @app.subscribe(test_channel, test_message)
+    async def handler(message: Message) -> None:
+        await asyncio.sleep(0)
+        loops.append(asyncio.get_running_loop())
+
+    app.dispatch(threads=3, ordering_key="correlation_id")
+
+    assert 6 == len(loops)
+    assert 1 == len(set(loops))
+    assert loops[0].is_closed()
@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from message_flow.app._message_management import AsyncFlowControl, FlowControl
+
+
+def test_flow_control__blocks_when_messages_limit_reached():
+    flow_control = FlowControl(max_messages=2)
+    admitted = threading.Event()
+
+    flow_control.acquire(1)
+    flow_control.acquire(1)
+
+    thread = threading.Thread(target=lambda: (flow_control.acquire(1), admitted.set()))
+    thread.start()
+
+    assert not admitted.wait(0.05)
+
+    flow_control.release(1)
+
+    assert admitted.wait(1)
+    thread.join()
+
+
+def test_flow_control__blocks_when_bytes_limit_reached():
+    flow_control = FlowControl(max_bytes=10)
+    admitted = threading.Event()
+
+    flow_control.acquire(8)
+
+    thread = threading.Thread(target=lambda: (flow_control.acquire(4), admitted.set()))
+    thread.start()
+
+    assert not admitted.wait(0.05)
+
+    flow_control.release(8)
+
+    assert admitted.wait(1)
+    thread.join()
+
+
+def test_flow_control__admits_oversized_message_when_idle():
+    flow_control = FlowControl(max_bytes=10)
+
+    flow_control.acquire(100)
+    flow_control.release(100)
+
+
+def test_flow_control__invalid_limits():
+    with pytest.raises(ValueError):
+        FlowControl(max_messages=0)
+
+    with pytest.raises(ValueError):
+        FlowControl(max_bytes=0)
+
+
+def test_flow_control__limits_in_flight_handlers():
+    flow_control = FlowControl(max_messages=3)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def handler(payload: bytes, headers: dict[str, str]) -> None:
+        nonlocal in_flight, peak
+
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+
+        time.sleep(0.01)
+
+        with lock:
+            in_flight -= 1
+
+    completed = flow_control.complete(handler)
+    admitted = flow_control.admit(
+        lambda payload, headers: threading.Thread(target=completed, args=(payload, headers)).start()
+    )
+
+    for _ in range(12):
+        admitted(b"message", {})
+
+    assert 0 < peak <= 3
+
+
+def test_flow_control__releases_credit_when_hand_over_fails():
+    flow_control = FlowControl(max_messages=1)
+
+    def handler(payload: bytes, headers: dict[str, str]) -> None:
+        raise RuntimeError("Pool is shut down")
+
+    for wrapped in (flow_control.admit(handler), flow_control.limit(handler)):
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                wrapped(b"message", {})
+
+    assert (0, 0) == (flow_control._messages, flow_control._bytes)
+
+
+def test_async_flow_control__blocks_when_bytes_limit_reached():
+    async def scenario() -> None:
+        flow_control = AsyncFlowControl(max_messages=10, max_bytes=10)
+
+        await flow_control.acquire(8)
+        waiter = asyncio.create_task(flow_control.acquire(4))
+        await asyncio.sleep(0.01)
+
+        assert not waiter.done()
+
+        await flow_control.release(8)
+        await asyncio.wait_for(waiter, 1)
+
+    asyncio.run(scenario())
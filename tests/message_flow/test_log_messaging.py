@@ -0,0 +1,307 @@
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from message_flow import LogMessageConsumer, LogMessageProducer, Message, MessageFlow, Payload
+from message_flow.app._log_messaging import OffsetIndex, PartitionLog
+from message_flow.app._simple_messaging import Envelope, SimpleMessageConsumer
+from message_flow.utils import logger
+
+
+def consume(
+    directory: Path, channels: set[str], expected: int, timeout: float = 5, **kwargs
+) -> list[tuple[bytes, dict[str, str]]]:
+    received: list[tuple[bytes, dict[str, str]]] = []
+    consumer = LogMessageConsumer(directory, **kwargs)
+    consumer.subscribe(channels, lambda payload, headers: received.append((payload, headers)))
+
+    thread = threading.Thread(target=consumer.start_consuming)
+    thread.start()
+
+    deadline = time.monotonic() + timeout
+    while len(received) < expected and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+    consumer.close()
+    thread.join()
+
+    return received
+
+
+def test_messages_with_same_key_share_partition_in_order(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path, partitions=4, key_header="key")
+    producer.send_many("orders", [(b'{"n":%d}' % n, {"key": str(n % 3), "n": str(n)}) for n in range(300)])
+    producer.close()
+
+    received = consume(tmp_path, {"orders"}, 300)
+
+    assert 300 == len(received)
+    for key in "012":
+        numbers = [int(headers["n"]) for _, headers in received if headers["key"] == key]
+        assert sorted(numbers) == numbers
+    assert {"0", "1", "2", "3"} >= {path.name for path in (tmp_path / "orders").iterdir()}
+
+
+def test_messages_without_key_are_spread_round_robin(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path, partitions=3)
+    for n in range(9):
+        producer.send("orders", b"{}", {})
+    producer.close()
+
+    for partition in range(3):
+        assert 3 == PartitionLog(tmp_path / "orders" / str(partition), 1024).next_offset
+
+
+def test_messages_with_typed_key_share_partition(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path, partitions=4, key_header="key")
+    producer.send_many("orders", [(b"{}", {"key": n % 2, "parent": None}) for n in range(20)])
+    producer.close()
+
+    received = consume(tmp_path, {"orders"}, 20)
+
+    assert 20 == len(received)
+    assert [{"key": 0, "parent": None}, {"key": 1, "parent": None}] == sorted(
+        {headers["key"]: headers for _, headers in received}.values(), key=lambda headers: headers["key"]
+    )
+    assert 2 >= len([path for path in (tmp_path / "orders").iterdir() if path.name.isdigit()])
+
+
+def test_channel_names_stay_inside_log_directory(tmp_path: Path):
+    directory = tmp_path / "log"
+    producer = LogMessageProducer(directory)
+    for channel in ("../escaped", "orders/created", "..", "."):
+        producer.send(channel, b'{"channel":"%s"}' % channel.encode(), {})
+    producer.close()
+
+    assert ["log"] == [path.name for path in tmp_path.iterdir()]
+    assert 4 == len(list(directory.iterdir()))
+    assert [(b'{"channel":"../escaped"}', {})] == consume(directory, {"../escaped"}, 1)
+
+
+def test_transports_log_to_injected_logger(tmp_path: Path, caplog: pytest.LogCaptureFixture):
+    custom_logger = logging.getLogger("custom_log_transport")
+    producer = LogMessageProducer(tmp_path, logger=custom_logger)
+    producer.send_many("orders", [(b"{}", {})])
+    producer.close()
+
+    with caplog.at_level(logging.DEBUG, logger="custom_log_transport"):
+        consume(tmp_path, {"orders"}, 1, logger=custom_logger)
+
+    assert {"custom_log_transport"} == {record.name for record in caplog.records}
+    assert any(record.levelno == logging.INFO for record in caplog.records)
+
+
+def test_segments_roll_and_retention_deletes_oldest(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path, segment_bytes=1024, retention_bytes=4096)
+    for n in range(200):
+        producer.send("orders", b'{"n":%05d}' % n, {})
+    producer.close()
+
+    partition = tmp_path / "orders" / "0"
+    segments = PartitionLog.segments(partition)
+
+    assert segments[0] > 0
+    assert sum(PartitionLog.segment_path(partition, base).stat().st_size for base in segments) <= 4096 + 1024
+
+    received = consume(tmp_path, {"orders"}, 200 - segments[0], timeout=0.5)
+
+    assert b'{"n":%05d}' % segments[0] == received[0][0]
+    assert b'{"n":00199}' == received[-1][0]
+
+
+def test_consumer_group_resumes_from_committed_offset(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path, segment_bytes=512)
+    producer.send_many("orders", [(b'{"n":%d}' % n, {}) for n in range(20)])
+
+    assert 20 == len(consume(tmp_path, {"orders"}, 20, group="billing"))
+
+    producer.send_many("orders", [(b'{"n":%d}' % n, {}) for n in range(20, 25)])
+    producer.close()
+
+    assert [b'{"n":%d}' % n for n in range(20, 25)] == [
+        payload for payload, _ in consume(tmp_path, {"orders"}, 5, group="billing")
+    ]
+    assert 25 == len(consume(tmp_path, {"orders"}, 25, group="shipping"))
+
+
+def test_latest_offset_reset_skips_existing_messages(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path, segment_bytes=256)
+    producer.send_many("orders", [(b"{}", {}) for _ in range(30)])
+    producer.close()
+
+    assert [] == consume(tmp_path, {"orders"}, 1, timeout=0.2, offset_reset="latest")
+
+
+def test_consumer_follows_producer_across_segments(tmp_path: Path):
+    received: list[tuple[bytes, dict[str, str]]] = []
+    consumer = LogMessageConsumer(tmp_path, max_backoff=0.01)
+    consumer.subscribe({"orders"}, lambda payload, headers: received.append((payload, headers)))
+    thread = threading.Thread(target=consumer.start_consuming)
+    thread.start()
+
+    producer = LogMessageProducer(tmp_path, partitions=2, segment_bytes=256)
+    for n in range(500):
+        producer.send("orders", b'{"n":%d}' % n, {"key": str(n)})
+    producer.close()
+
+    deadline = time.monotonic() + 5
+    while len(received) < 500 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    consumer.close()
+    thread.join()
+
+    assert 500 == len(received)
+
+
+def test_producer_recovers_offset_and_truncates_partial_record(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path)
+    producer.send_many("orders", [(b"{}", {}) for _ in range(10)])
+    producer.close()
+
+    segment = PartitionLog.segment_path(tmp_path / "orders" / "0", 0)
+    size = segment.stat().st_size
+    with open(segment, "ab") as fp:
+        fp.write(b"\xffMF\x01")
+
+    log = PartitionLog(tmp_path / "orders" / "0", 1024 * 1024)
+
+    assert 10 == log.next_offset
+    assert size == os.path.getsize(segment)
+    log.close()
+
+
+def test_recovery_and_consumer_skip_record_with_corrupted_headers(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path)
+    producer.send_many("orders", [(b'{"n":%d}' % n, {"n": str(n)}) for n in range(3)])
+    producer.close()
+
+    segment = PartitionLog.segment_path(tmp_path / "orders" / "0", 0)
+    size = segment.stat().st_size
+    with open(segment, "r+b") as fp:
+        fp.seek(size // 3 + Envelope.PREFIX.size + len("orders"))
+        fp.write(b"\x30")
+
+    log = PartitionLog(tmp_path / "orders" / "0", 1024 * 1024)
+
+    assert 3 == log.next_offset
+    assert size == os.path.getsize(segment)
+    log.close()
+
+    received = consume(tmp_path, {"orders"}, 2)
+
+    assert [(b'{"n":0}', {"n": "0"}), (b'{"n":2}', {"n": "2"})] == [(bytes(p), h) for p, h in received]
+
+
+def test_closed_producer_rejects_new_partitions(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path)
+    producer.close()
+
+    with pytest.raises(RuntimeError):
+        producer.send("orders", b"{}")
+
+
+def test_index_maps_offsets_to_record_positions(tmp_path: Path):
+    log = PartitionLog(tmp_path, 1024 * 1024, index_interval_bytes=256)
+    for n in range(100):
+        log.append([Envelope.encode("orders", b'{"n":%03d}' % n, {})])
+    log.close()
+
+    index = OffsetIndex.for_segment(tmp_path, 0)
+    offset, position = index.lookup_offset(57)  # type: ignore
+
+    assert 1 < len(index.entries()) < 100
+    assert offset <= 57
+    with open(PartitionLog.segment_path(tmp_path, 0), "rb") as fp:
+        fp.seek(position)
+        assert ("orders", b'{"n":%03d}' % offset, {}) == Envelope.read(fp)
+
+
+def test_recovery_rebuilds_missing_index(tmp_path: Path):
+    log = PartitionLog(tmp_path, 1024 * 1024, index_interval_bytes=256)
+    log.append([Envelope.encode("orders", b"{}", {}) for _ in range(100)])
+    log.close()
+
+    OffsetIndex.for_segment(tmp_path, 0).path.unlink()
+    PartitionLog(tmp_path, 1024 * 1024, index_interval_bytes=256).close()
+
+    entries = OffsetIndex.for_segment(tmp_path, 0).entries()
+
+    assert (0, 0) == (entries[0][0], entries[0][2])
+    assert 1 < len(entries)
+
+
+def test_consumer_seeks_to_offset_across_segments(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path, segment_bytes=512)
+    producer.send_many("orders", [(b'{"n":%03d}' % n, {}) for n in range(100)])
+    producer.close()
+
+    consumer = LogMessageConsumer(tmp_path)
+    consumer.seek(offset=73)
+    received: list[bytes] = []
+    consumer.subscribe({"orders"}, lambda payload, headers: (received.append(payload), consumer.close()))
+    consumer.start_consuming()
+
+    assert [b'{"n":073}'] == received
+
+
+def test_consumer_seeks_to_time(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path, index_interval_bytes=64)
+    for n in range(50):
+        producer.send("orders", b'{"n":%03d}' % n, {})
+    time.sleep(0.01)
+    replay_from = datetime.now(timezone.utc)
+    time.sleep(0.01)
+    for n in range(50, 60):
+        producer.send("orders", b'{"n":%03d}' % n, {})
+    producer.close()
+
+    consumer = LogMessageConsumer(tmp_path)
+    consumer.seek(timestamp=replay_from)
+    received: list[bytes] = []
+
+    def handle(payload: bytes, headers: dict[str, str]) -> None:
+        received.append(payload)
+        if payload == b'{"n":059}':
+            consumer.close()
+
+    consumer.subscribe({"orders"}, handle)
+    consumer.start_consuming()
+
+    assert [b'{"n":%03d}' % n for n in range(50, 60)] == received[-10:]
+    assert len(received) <= 12
+
+
+def test_dispatch_replays_from_offset(tmp_path: Path):
+    producer = LogMessageProducer(tmp_path)
+    headers = {"message-type": "Replayed", "channel-address": "orders"}
+    producer.send_many("orders", [(b'{"value":"%d"}' % n, headers) for n in range(10)])
+    producer.close()
+
+    consumer = LogMessageConsumer(tmp_path)
+    app = MessageFlow(message_consumer=consumer, message_producer=LogMessageProducer(tmp_path))
+    received: list[str] = []
+
+    class Replayed(Message):
+        value: str = Payload()
+
+    @app.subscribe(address="orders", message=Replayed)
+    def handle_replayed(message: Replayed) -> None:
+        received.append(message.value)
+        if message.value == "9":
+            consumer.close()
+
+    app.dispatch(from_offset=7)
+
+    assert ["7", "8", "9"] == received
+
+
+def test_dispatch_rejects_replay_without_seek_support():
+    app = MessageFlow(message_consumer=SimpleMessageConsumer(logger, dry_run=True))
+
+    with pytest.raises(NotImplementedError):
+        app.dispatch(from_offset=0)
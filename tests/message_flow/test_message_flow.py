@@ -1,6 +1,6 @@
 import pytest
 
-from message_flow import Channel, MessageFlow
+from message_flow import Channel, Message, MessageFlow
 from message_flow.app._internal import Channels
 from message_flow.app._simple_messaging import SimpleMessageConsumer
 from message_flow.utils import logger
@@ -32,3 +32,21 @@ def test__find_or_create_channel__channel_already_added():
     channels = Channels(channels=[channel])
 
     assert channel == channels.find_or_create_for(test_address)
+
+
+def test__channels_routes(test_channel: str, test_message: type[Message], another_test_message: type[Message]):
+    channel = Channel(test_channel)
+    channels = Channels(channels=[channel])
+
+    channel.publish()(another_test_message)
+    channels.build_routes()
+
+    assert channels.operation_of(test_channel, test_message.__name__) is None
+
+    channel.subscribe(test_message)(lambda message: None)
+
+    assert channels.operation_of(test_channel, test_message.__name__) is channel.operations[-1]
+    assert channels.channel_and_operation_of(another_test_message(value="v", correlation_id="c")) == (
+        channel,
+        channel.operations[0],
+    )
@@ -0,0 +1,154 @@
+from contextlib import contextmanager
+from typing import Generator
+
+import pytest
+
+from message_flow import BaseMiddleware, Message, MessageFlow, StatelessMiddleware
+
+from .message_flow_unit_test_support.fake_message_consumer import FakeMessageConsumer, make_messages
+from .message_flow_unit_test_support.fake_message_producer import FakeMessageProducer
+from .message_flow_unit_test_support.message_flow_unit_test_support import MessageFlowUnitTestSupport
+
+
+def make_app(test_message: type[Message], test_channel: str, count: int = 1) -> tuple[MessageFlow, list[str]]:
+    consumer = FakeMessageConsumer(make_messages(test_message, test_channel, count))
+    app = MessageFlow(message_consumer=consumer, message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()))
+    return app, []
+
+
+def test_middlewares__hooks_order(test_channel: str, test_message: type[Message]):
+    app, calls = make_app(test_message, test_channel)
+
+    class Outer(BaseMiddleware):
+        def on_consume(self) -> None:
+            calls.append(f"outer:on:{self.headers['correlation_id']}")
+
+        def after_consume(self, error: Exception | None = None) -> None:
+            calls.append("outer:after")
+            return super().after_consume(error)
+
+    class Inner(StatelessMiddleware):
+        @classmethod
+        def on_consume(cls, payload: bytes, headers: dict[str, str]) -> None:
+            calls.append(f"inner:on:{headers['correlation_id']}")
+
+        @classmethod
+        def after_consume(cls, payload: bytes, headers: dict[str, str], error: Exception | None = None) -> None:
+            calls.append("inner:after")
+            return super().after_consume(payload, headers, error)
+
+    app.add_middleware(Outer)
+    app.add_middleware(Inner)
+
+    @app.subscribe(test_channel, test_message)
+    def handler(message: Message) -> None:
+        calls.append("handler")
+
+    app.dispatch()
+
+    assert calls == ["outer:on:0", "inner:on:0", "handler", "inner:after", "outer:after"]
+
+
+def test_middlewares__error_passed_to_after_hooks(test_channel: str, test_message: type[Message]):
+    app, errors = make_app(test_message, test_channel)
+
+    class Suppressing(BaseMiddleware):
+        def after_consume(self, error: Exception | None = None) -> None:
+            errors.append(f"suppressing:{error}")
+
+    class Propagating(StatelessMiddleware):
+        @classmethod
+        def after_consume(cls, payload: bytes, headers: dict[str, str], error: Exception | None = None) -> None:
+            errors.append(f"propagating:{error}")
+            return super().after_consume(payload, headers, error)
+
+    app.add_middleware(Suppressing)
+    app.add_middleware(Propagating)
+
+    @app.subscribe(test_channel, test_message)
+    def handler(message: Message) -> None:
+        raise ValueError("failed")
+
+    app.dispatch()
+
+    assert errors == ["propagating:failed", "suppressing:failed"]
+
+
+def test_middlewares__error_propagated(test_channel: str, test_message: type[Message]):
+    app, _ = make_app(test_message, test_channel)
+
+    app.add_middleware(StatelessMiddleware)
+    app.add_middleware(BaseMiddleware)
+
+    @app.subscribe(test_channel, test_message)
+    def handler(message: Message) -> None:
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"):
+        app.dispatch()
+
+
+def test_middlewares__batch_hooks(test_channel: str, test_message: type[Message]):
+    app, calls = make_app(test_message, test_channel, count=2)
+
+    class Recording(StatelessMiddleware):
+        @classmethod
+        def on_consume(cls, payload: bytes, headers: dict[str, str]) -> None:
+            calls.append(f"on:{headers['correlation_id']}")
+
+        @classmethod
+        def after_consume(cls, payload: bytes, headers: dict[str, str], error: Exception | None = None) -> None:
+            calls.append(f"after:{headers['correlation_id']}")
+
+    app.add_middleware(Recording)
+
+    @app.subscribe(test_channel, test_message, batch_size=2, batch_wait=60)
+    def handler(messages: list) -> None:
+        calls.append("handler")
+
+    app.dispatch()
+
+    assert calls == ["on:0", "on:1", "handler", "after:1", "after:0"]
+
+
+def test_middlewares__overridden_consume_wraps_handler(test_channel: str, test_message: type[Message]):
+    app, calls = make_app(test_message, test_channel, count=2)
+
+    class Wrapping(BaseMiddleware):
+        @contextmanager
+        def consume(self) -> Generator[None, None, None]:
+            calls.append(f"enter:{self.headers['correlation_id']}")
+            yield
+            calls.append(f"exit:{self.headers['correlation_id']}")
+
+    app.add_middleware(Wrapping)
+
+    @app.subscribe(test_channel, test_message)
+    def handler(message: Message) -> None:
+        calls.append("handler")
+
+    app.dispatch()
+
+    assert calls == ["enter:0", "handler", "exit:0", "enter:1", "handler", "exit:1"]
+
+
+@pytest.mark.parametrize("base", [BaseMiddleware, StatelessMiddleware])
+def test_middlewares__coroutine_hooks_rejected_by_sync_dispatch(
+    test_channel: str, test_message: type[Message], base: type
+):
+    app, calls = make_app(test_message, test_channel)
+
+    class AsyncMiddleware(base):  # type: ignore
+        async def on_consume(self, *args) -> None:
+            calls.append("on_consume")
+
+    app.add_middleware(AsyncMiddleware)
+
+    @app.subscribe(test_channel, test_message)
+    def handler(message: Message) -> None:
+        calls.append("handler")
+
+    with pytest.raises(TypeError, match="AsyncMiddleware has coroutine hooks"):
+        app.dispatch()
+
+    assert calls == []
@@ -0,0 +1,49 @@
+import threading
+import time
+
+from message_flow.app._message_management import OrderedWorkerPool
+from message_flow.utils import logger
+
+
+def test_ordered_worker_pool__same_key_ordered():
+    handled: dict[str, list[int]] = {}
+    threads: dict[str, set[str]] = {}
+
+    def handler(payload: bytes, headers: dict[str, str]) -> None:
+        time.sleep(0.001)
+        handled.setdefault(headers["tenant_id"], []).append(int(payload))
+        threads.setdefault(headers["tenant_id"], set()).add(threading.current_thread().name)
+
+    pool = OrderedWorkerPool(handler, logger, workers=4, ordering_key="tenant_id", queue_size=2)
+    pool.start()
+
+    for number in range(20):
+        for tenant in ("a", "b", "c"):
+            pool.submit(str(number).encode(), {"tenant_id": tenant})
+
+    pool.shutdown()
+
+    assert handled == {tenant: list(range(20)) for tenant in ("a", "b", "c")}
+    assert all(len(names) == 1 for names in threads.values())
+
+
+def test_ordered_worker_pool__different_keys_concurrent():
+    barrier = threading.Barrier(2, timeout=1)
+    handled: list[str] = []
+
+    def handler(payload: bytes, headers: dict[str, str]) -> None:
+        barrier.wait()
+        handled.append(headers["tenant_id"])
+
+    pool = OrderedWorkerPool(handler, logger, workers=2, ordering_key="tenant_id", queue_size=1)
+    pool.start()
+
+    keys = iter(str(number) for number in range(100))
+    first = next(keys)
+    second = next(key for key in keys if hash(key) % 2 != hash(first) % 2)
+
+    pool.submit(b"", {"tenant_id": first})
+    pool.submit(b"", {"tenant_id": second})
+    pool.shutdown()
+
+    assert sorted(handled) == sorted([first, second])
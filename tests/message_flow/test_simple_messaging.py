@@ -0,0 +1,237 @@
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from message_flow.app._simple_messaging import Durability, Envelope, SimpleMessageConsumer, SimpleMessageProducer
+from message_flow.utils import logger
+
+
+@pytest.fixture
+def queue_path(tmp_path: Path) -> str:
+    return str(tmp_path / "queue.txt")
+
+
+def read_records(queue_path: str) -> list[tuple[str, bytes, dict[str, str]]]:
+    records = []
+    with open(queue_path, "rb") as fp:
+        while (record := Envelope.read(fp)) is not None:
+            records.append(record)
+
+    return records
+
+
+def consume(queue_path: str, expected: int, timeout: float = 5, **kwargs) -> list[tuple[bytes, dict[str, str]]]:
+    received: list[tuple[bytes, dict[str, str]]] = []
+    consumer = SimpleMessageConsumer(logger, queue_path, **kwargs)
+    consumer.subscribe({"orders"}, lambda payload, headers: received.append((payload, headers)))
+
+    thread = threading.Thread(target=consumer.start_consuming)
+    thread.start()
+
+    deadline = time.monotonic() + timeout
+    while len(received) < expected and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+    consumer.close()
+    thread.join()
+
+    return received
+
+
+def test_consumer_drains_backlog_without_per_message_sleep(queue_path: str):
+    Path(queue_path).touch()
+    Path(f"{queue_path}.offset").write_text("0")
+    SimpleMessageProducer(logger, queue_path).send_many(
+        "orders", [(b'{"n":%d}' % n, {"n": str(n)}) for n in range(500)]
+    )
+
+    started = time.monotonic()
+    received = consume(queue_path, 500)
+
+    assert 500 == len(received)
+    assert (b'{"n":499}', {"n": "499"}) == received[-1]
+    assert time.monotonic() - started < 2
+
+
+def test_consumer_resumes_from_committed_offset(queue_path: str):
+    producer = SimpleMessageProducer(logger, queue_path)
+    Path(queue_path).touch()
+    Path(f"{queue_path}.offset").write_text("0")
+
+    producer.send("orders", b'{"n":1}', {})
+    assert [(b'{"n":1}', {})] == consume(queue_path, 1)
+    assert str(Path(queue_path).stat().st_size) == Path(f"{queue_path}.offset").read_text()
+
+    producer.send("orders", b'{"n":2}', {})
+    assert [(b'{"n":2}', {})] == consume(queue_path, 1)
+
+
+def test_consumer_starts_at_end_without_offset(queue_path: str):
+    SimpleMessageProducer(logger, queue_path).send("orders", b'{"n":1}', {})
+
+    assert [] == consume(queue_path, 1, timeout=0.2, max_backoff=0.01)
+
+
+def test_consumer_waits_for_partial_record(queue_path: str):
+    Path(queue_path).write_bytes(b'orders\t{"n":1}\t{}\norders\t{"n":2}')
+    Path(f"{queue_path}.offset").write_text("0")
+
+    assert [(b'{"n":1}', {})] == consume(queue_path, 2, timeout=0.2, max_backoff=0.01)
+    assert str(len(b'orders\t{"n":1}\t{}\n')) == Path(f"{queue_path}.offset").read_text()
+
+
+@pytest.mark.parametrize("durability", list(Durability))
+def test_concurrent_senders_append_whole_records(queue_path: str, durability: Durability):
+    producer = SimpleMessageProducer(logger, queue_path, durability=durability)
+
+    def send(sender: int) -> None:
+        for n in range(200):
+            producer.send("orders", b'{"sender":%d,"n":%d}' % (sender, n), {"sender": str(sender)})
+
+    threads = [threading.Thread(target=send, args=(sender,)) for sender in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    producer.close()
+
+    records = read_records(queue_path)
+
+    assert 1600 == len(records)
+    assert 200 == sum(1 for _, _, headers in records if headers == {"sender": "7"})
+    assert producer.closed
+
+
+def test_producer_shares_file_across_processes(queue_path: str):
+    script = (
+        "import sys\n"
+        "from message_flow.app._simple_messaging import SimpleMessageProducer\n"
+        "from message_flow.utils import logger\n"
+        "producer = SimpleMessageProducer(logger, sys.argv[1])\n"
+        "producer.send_many('orders', [(b'x' * 4096, {}) for _ in range(200)])\n"
+    )
+    processes = [subprocess.Popen([sys.executable, "-c", script, queue_path]) for _ in range(4)]
+    for process in processes:
+        assert 0 == process.wait()
+
+    records = read_records(queue_path)
+
+    assert 800 == len(records)
+    assert all(("orders", b"x" * 4096, {}) == record for record in records)
+
+
+def test_producer_opens_file_on_first_send(queue_path: str):
+    producer = SimpleMessageProducer(logger, queue_path, binary=False)
+
+    assert not Path(queue_path).exists()
+
+    producer.send("orders", b"{}")
+    producer.close()
+
+    assert b"orders\t{}\tnull\n" == Path(queue_path).read_bytes()
+
+
+def test_binary_envelope_carries_tabs_and_newlines(queue_path: str):
+    Path(queue_path).touch()
+    Path(f"{queue_path}.offset").write_text("0")
+    payload = b'{"note":"line\\n\\tbreak"}\n\t\xff'
+
+    SimpleMessageProducer(logger, queue_path, checksum=True).send("orders", payload, {"key": "tab\tnew\nline"})
+
+    assert [(payload, {"key": "tab\tnew\nline"})] == consume(queue_path, 1)
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_binary_envelope_round_trips_typed_headers(queue_path: str, memory_map: bool):
+    Path(queue_path).touch()
+    Path(f"{queue_path}.offset").write_text("0")
+    headers = {"count": 3, "parent": None, "tenant": "t-1", "created": "2024-01-01T00:00:00Z"}
+
+    SimpleMessageProducer(logger, queue_path).send("orders", b"{}", headers)
+
+    assert [("orders", b"{}", headers)] == read_records(queue_path)
+    assert [(b"{}", headers)] == consume(queue_path, 1, memory_map=memory_map)
+
+
+def test_consumer_reads_mixed_text_and_binary_records(queue_path: str):
+    Path(queue_path).touch()
+    Path(f"{queue_path}.offset").write_text("0")
+    SimpleMessageProducer(logger, queue_path, binary=False).send("orders", b'{"n":1}', {})
+    SimpleMessageProducer(logger, queue_path).send("orders", b'{"n":2}', {"n": "2"})
+    SimpleMessageProducer(logger, queue_path, binary=False).send("orders", b'{"n":3}', {})
+
+    assert [(b'{"n":1}', {}), (b'{"n":2}', {"n": "2"}), (b'{"n":3}', {})] == consume(queue_path, 3)
+
+
+def test_consumer_skips_record_with_bad_checksum(queue_path: str):
+    corrupted = bytearray(Envelope.encode("orders", b'{"n":1}', {}, checksum=True))
+    corrupted[-2] ^= 0xFF
+    Path(queue_path).write_bytes(bytes(corrupted) + Envelope.encode("orders", b'{"n":2}', {}, checksum=True))
+    Path(f"{queue_path}.offset").write_text("0")
+
+    assert [(b'{"n":2}', {})] == consume(queue_path, 1)
+
+
+def test_consumer_waits_for_partial_envelope(queue_path: str):
+    record = Envelope.encode("orders", b'{"n":1}', {"n": "1"})
+    Path(queue_path).write_bytes(record + record[:-3])
+    Path(f"{queue_path}.offset").write_text("0")
+
+    assert [(b'{"n":1}', {"n": "1"})] == consume(queue_path, 2, timeout=0.2, max_backoff=0.01)
+    assert str(len(record)) == Path(f"{queue_path}.offset").read_text()
+
+
+def test_memory_mapped_consumer_hands_out_buffer_slices(queue_path: str):
+    Path(queue_path).touch()
+    Path(f"{queue_path}.offset").write_text("0")
+    SimpleMessageProducer(logger, queue_path, binary=False).send("orders", b'{"n":1}', {})
+    SimpleMessageProducer(logger, queue_path, checksum=True).send("orders", b'{"n":2}\n\t', {"n": "2"})
+
+    received = consume(queue_path, 2, memory_map=True)
+
+    assert [(b'{"n":1}', {}), (b'{"n":2}\n\t', {"n": "2"})] == received
+    assert all(isinstance(payload, memoryview) for payload, _ in received)
+
+
+def test_memory_mapped_consumer_follows_growing_file(queue_path: str):
+    Path(queue_path).touch()
+    Path(f"{queue_path}.offset").write_text("0")
+    producer = SimpleMessageProducer(logger, queue_path)
+    received: list[tuple[bytes, dict[str, str]]] = []
+    consumer = SimpleMessageConsumer(logger, queue_path, memory_map=True, max_backoff=0.01)
+    consumer.subscribe({"orders"}, lambda payload, headers: received.append((payload, headers)))
+
+    thread = threading.Thread(target=consumer.start_consuming)
+    thread.start()
+    for n in range(3):
+        producer.send("orders", b'{"n":%d}' % n, {})
+        deadline = time.monotonic() + 5
+        while len(received) <= n and time.monotonic() < deadline:
+            time.sleep(0.001)
+    consumer.close()
+    thread.join()
+
+    assert [b'{"n":0}', b'{"n":1}', b'{"n":2}'] == [bytes(payload) for payload, _ in received]
+
+
+def test_memory_mapped_consumer_skips_malformed_records(queue_path: str):
+    corrupted = bytearray(Envelope.encode("orders", b'{"n":1}', {}, checksum=True))
+    corrupted[-2] ^= 0xFF
+    Path(queue_path).write_bytes(bytes(corrupted) + b"orders\tbroken\n" + Envelope.encode("orders", b'{"n":2}', {}))
+    Path(f"{queue_path}.offset").write_text("0")
+
+    assert [(b'{"n":2}', {})] == consume(queue_path, 1, memory_map=True)
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_consumer_skips_record_with_corrupted_headers(queue_path: str, memory_map: bool):
+    corrupted = bytearray(Envelope.encode("orders", b'{"n":1}', {"n": "1"}))
+    corrupted[Envelope.PREFIX.size + len("orders")] = 0x30
+    Path(queue_path).write_bytes(bytes(corrupted) + Envelope.encode("orders", b'{"n":2}', {"n": "2"}))
+    Path(f"{queue_path}.offset").write_text("0")
+
+    assert [(b'{"n":2}', {"n": "2"})] == consume(queue_path, 1, memory_map=memory_map)
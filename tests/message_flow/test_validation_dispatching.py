@@ -0,0 +1,31 @@
+from message_flow import Channel, Header, Message, MessageFlow, Payload, ValidationPolicy
+
+from .message_flow_unit_test_support.fake_message_consumer import FakeMessageConsumer
+from .message_flow_unit_test_support.fake_message_producer import FakeMessageProducer
+from .message_flow_unit_test_support.message_flow_unit_test_support import MessageFlowUnitTestSupport
+
+
+class Counted(Message):
+    count: int = Payload()
+    correlation_id: str = Header()
+
+
+def test_validation_dispatching__channel_policy(test_channel: str):
+    channel = Channel(test_channel, validation=ValidationPolicy.TRUSTED)
+    consumer = FakeMessageConsumer(
+        [(b'{"count":"many"}', {"correlation_id": "1", "message-type": "Counted", "channel-address": test_channel})]
+    )
+    app = MessageFlow(
+        channels=[channel],
+        message_consumer=consumer,
+        message_producer=FakeMessageProducer(MessageFlowUnitTestSupport()),
+    )
+    counts: list[object] = []
+
+    @channel.subscribe(Counted)
+    def handler(message: Counted) -> None:
+        counts.append(message.count)
+
+    app.dispatch()
+
+    assert ["many"] == counts
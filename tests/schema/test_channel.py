@@ -1,7 +1,42 @@
 from typing import Any
 
-from message_flow import Channel
+from message_flow import Channel, Message, MessageInfo, Payload
 
 
 def test_channel_schema(example_channel: Channel, example_channel_components: dict[str, Any]):
     assert example_channel_components == example_channel.__async_api_components__.as_schema()
+
+
+def test_channel_schema_is_refreshed_after_adding_messages():
+    class Example(Message):
+        p1: str = Payload()
+
+    channel = Channel(address="example")
+    assert channel.__async_api_components__.messages == {}
+
+    channel.publish()(Example)
+
+    assert "Example" in channel.__async_api_components__.messages
+    assert "sendExample" in channel.__async_api_components__.operations
+
+
+def test_channel_schema_describes_channel_content_type():
+    class Plain(Message):
+        p1: str = Payload()
+
+    class Declared(Message):
+        message_info = MessageInfo(content_type="application/json")
+
+        p1: str = Payload()
+
+    channel = Channel(address="example", content_type="application/msgpack")
+    channel.publish()(Plain)
+    channel.publish()(Declared)
+
+    components = channel.__async_api_components__
+
+    assert "application/msgpack" == components.channels["example"]["messages"]["Plain"]["contentType"]
+    assert components.messages["Plain"]["payload"] == components.channels["example"]["messages"]["Plain"]["payload"]
+    assert {"$ref": "#/components/messages/Declared"} == components.channels["example"]["messages"]["Declared"]
+    assert "application/json" == components.messages["Plain"]["contentType"]
+    assert "sendPlain" in components.operations
@@ -1,7 +1,19 @@
 from typing import Any
 
-from message_flow import Message
+from message_flow import Message, Payload
 
 
 def test_message_schema(example_message: Message, example_message_components: dict[str, Any]):
     assert example_message_components == example_message.__async_api_components__.as_schema()
+
+
+def test_message_schema_is_generated_on_first_access():
+    class Lazy(Message):
+        p1: str = Payload()
+
+    assert "_async_api_components" not in Lazy.__dict__
+
+    components = Lazy.__async_api_components__
+
+    assert components is Lazy.__dict__["_async_api_components"]
+    assert components is Lazy.__async_api_components__
@@ -1,8 +1,41 @@
+import hashlib
 import json
 from typing import Any
 
-from message_flow import MessageFlow
+from message_flow import Channel, Message, MessageFlow, Payload
 
 
 def test_message_schema(example_message_flow: MessageFlow, example_message_flow_components: dict[str, Any]):
     assert json.dumps(example_message_flow_components) == example_message_flow.make_async_api_schema()
+
+
+def test_schema_is_cached_until_channels_change(example_message_flow: MessageFlow):
+    schema = example_message_flow.async_api_schema
+
+    assert schema is example_message_flow.async_api_schema
+    assert hashlib.sha256(schema.content).hexdigest() == schema.sha256
+
+    example_message_flow.add_channel(Channel(address="audit"))
+
+    assert schema is not example_message_flow.async_api_schema
+    assert "audit" in json.loads(example_message_flow.make_async_api_schema())["channels"]
+
+
+def test_schema_is_invalidated_by_new_operations(example_message_flow: MessageFlow):
+    class Audited(Message):
+        entry: str = Payload()
+
+    schema = example_message_flow.async_api_schema
+
+    @example_message_flow.subscribe(address="audit", message=Audited)
+    def handle_audited(message: Audited) -> None: ...
+
+    assert schema.sha256 != example_message_flow.async_api_schema.sha256
+    assert "Audited" in json.loads(example_message_flow.make_async_api_schema())["components"]["messages"]
+
+
+def test_docs_page_is_cached_with_schema(example_message_flow: MessageFlow):
+    page = example_message_flow.generate_docs_page()
+
+    assert page is example_message_flow.generate_docs_page()
+    assert page is not example_message_flow.generate_docs_page(title="Orders")
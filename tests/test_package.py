@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+import message_flow
+
+
+def imported_modules(statement: str) -> set[str]:
+    output = subprocess.run(
+        [sys.executable, "-c", f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(output.stdout.split())
+
+
+def test_import_does_not_load_submodules():
+    modules = imported_modules("import message_flow")
+
+    assert "message_flow.app" not in modules
+    assert "message_flow.message" not in modules
+
+
+def test_app_import_does_not_load_cli_or_studio():
+    modules = imported_modules("from message_flow import MessageFlow")
+
+    assert "typer" not in modules
+    assert "message_flow.cli" not in modules
+    assert "message_flow.app._internal.async_api_studio" not in modules
+
+
+@pytest.mark.parametrize("name", message_flow.__all__)
+def test_public_names_are_resolvable(name: str):
+    assert getattr(message_flow, name).__name__ == name
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        _ = message_flow.Unknown